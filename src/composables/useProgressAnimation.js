@@ -0,0 +1,71 @@
+// src/composables/useProgressAnimation.js
+import { computed, onMounted, onUnmounted, watch } from 'vue'
+import { useTimerStore } from '../stores/timer'
+import { useSettingsStore } from '../stores/settings'
+
+const supportsAnimations = typeof Element !== 'undefined' && 'animate' in Element.prototype
+
+/**
+ * Composable that runs a progress indicator as a Web Animation spanning the
+ * whole phase, instead of re-rendering it on every timer tick.
+ *
+ * `frame(progress)` returns the CSS properties of `target` at a progress
+ * between 0 and 1; it is sampled `samples` times to build the keyframes, so
+ * non-linear motion (a curved path, eased sand) keeps its shape. The
+ * animation is only rebuilt when the phase starts, pauses or resumes, the tab
+ * becomes visible again or the window is resized.
+ *
+ * Returns `animated`: while true the component should bind its start-of-phase
+ * values and leave the motion to the animation.
+ */
+export function useProgressAnimation(target, frame, { samples = 1 } = {}) {
+  const timer = useTimerStore()
+  const settings = useSettingsStore()
+  const animated = computed(() => settings.smoothProgress && supportsAnimations)
+  let animation = null
+
+  function remainingMs() {
+    if (timer.status === 'paused') return timer.timeRemaining * 1000
+    return Math.max(0, timer.targetEndTime - Date.now())
+  }
+
+  function sync() {
+    animation?.cancel()
+    animation = null
+    const el = target.value
+    if (!animated.value || !el || timer.totalTime === 0 || timer.status === 'idle') return
+
+    const keyframes = []
+    for (let i = 0; i <= samples; i++) {
+      keyframes.push({ ...frame(i / samples), offset: i / samples })
+    }
+    const duration = timer.totalTime * 1000
+    animation = el.animate(keyframes, { duration, fill: 'both', easing: 'linear' })
+    animation.currentTime = Math.min(duration, duration - remainingMs())
+    if (timer.status === 'paused') animation.pause()
+  }
+
+  function onVisibilityChange() {
+    if (!document.hidden) sync()
+  }
+
+  watch(
+    [animated, target, () => timer.status, () => timer.totalTime, () => timer.targetEndTime],
+    sync,
+    { flush: 'post' }
+  )
+
+  onMounted(() => {
+    sync()
+    document.addEventListener('visibilitychange', onVisibilityChange)
+    window.addEventListener('resize', sync)
+  })
+
+  onUnmounted(() => {
+    animation?.cancel()
+    document.removeEventListener('visibilitychange', onVisibilityChange)
+    window.removeEventListener('resize', sync)
+  })
+
+  return { animated }
+}
@@ -3,21 +3,39 @@ import { createPinia } from 'pinia'
 import App from './App.vue'
 
 import './themes/base.css'
-import './themes/divertido.css'
-import './themes/minimalista.css'
-import './themes/floresta.css'
-import './themes/espaco.css'
-import './themes/oceano.css'
-import './themes/doces.css'
 
+import { useSettingsStore } from './stores/settings'
 import { setupAudioListeners } from './utils/audio'
+import { storage } from './utils/storage'
+import { installRenderStats } from './utils/renderStats'
 
 const app = createApp(App)
-app.use(createPinia())
-app.mount('#app')
+const pinia = createPinia()
+app.use(pinia)
 
-// Setup audio after app is mounted
-setupAudioListeners()
+if (import.meta.env.DEV || window.__RENDER_STATS__) {
+  installRenderStats(app)
+}
+
+function mountApp() {
+  app.mount('#app')
+
+  // Stores are hydrated (including restoreTimerState) and the first render is
+  // done once mount() returns - publish a readiness marker for tests/tooling
+  performance.mark('app-ready')
+  document.documentElement.setAttribute('data-app-ready', 'true')
+  window.dispatchEvent(new CustomEvent('app-ready'))
+
+  // Setup audio after app is mounted
+  setupAudioListeners()
+
+  // Off the boot path: move any localStorage history into IndexedDB
+  storage.migrateHistory()
+}
+
+// Only the starting theme's stylesheet is loaded; waiting for it keeps the
+// first paint themed
+useSettingsStore(pinia).initTheme().then(mountApp)
 
 // Register service worker for PWA support
 if ('serviceWorker' in navigator) {
@@ -235,10 +235,10 @@ export const useProfilesStore = defineStore('profiles', () => {
   }
 
   function saveProfiles() {
-    const current = storage.load()
-    current.profiles = profiles.value
-    current.activeProfileId = activeProfileId.value
-    storage.save(current)
+    storage.update({
+      profiles: profiles.value,
+      activeProfileId: activeProfileId.value,
+    })
   }
 
   return {
@@ -2,6 +2,7 @@
 import { defineStore } from 'pinia'
 import { ref, watch } from 'vue'
 import { storage } from '../utils/storage'
+import { loadTheme } from '../themes'
 
 export const useSettingsStore = defineStore('settings', () => {
   const data = storage.load()
@@ -11,6 +12,8 @@ export const useSettingsStore = defineStore('settings', () => {
   const soundEffectsEnabled = ref(data.globalSettings?.soundEffectsEnabled ?? true)
   const hapticEnabled = ref(data.globalSettings?.hapticEnabled ?? true)
   const defaultPreset = ref(data.globalSettings?.defaultPreset ?? '25-5')
+  // Indicators move continuously (browser-driven animation) instead of once per tick
+  const smoothProgress = ref(data.globalSettings?.smoothProgress ?? false)
 
   // Sound alerts (loaded from saved data)
   const alerts = ref({
@@ -40,28 +43,42 @@ export const useSettingsStore = defineStore('settings', () => {
   const devMode = ref(false)
 
   function saveSettings() {
-    const current = storage.load()
-    current.globalSettings = {
-      masterVolume: masterVolume.value,
-      soundEffectsEnabled: soundEffectsEnabled.value,
-      hapticEnabled: hapticEnabled.value,
-      defaultPreset: defaultPreset.value,
-      alerts: alerts.value,
-    }
-    storage.save(current)
+    storage.update({
+      globalSettings: {
+        masterVolume: masterVolume.value,
+        soundEffectsEnabled: soundEffectsEnabled.value,
+        hapticEnabled: hapticEnabled.value,
+        defaultPreset: defaultPreset.value,
+        smoothProgress: smoothProgress.value,
+        alerts: alerts.value,
+      },
+    })
   }
 
   // Auto-save on changes (including alerts - use deep watch for alerts object)
-  watch([masterVolume, soundEffectsEnabled, hapticEnabled, defaultPreset], saveSettings)
+  watch([masterVolume, soundEffectsEnabled, hapticEnabled, defaultPreset, smoothProgress], saveSettings)
   watch(alerts, saveSettings, { deep: true })
 
+  // The previous theme stays applied until the new stylesheet is in, so
+  // switching never shows unstyled content. Resolves once applied.
+  function applyTheme(name) {
+    return loadTheme(name)
+      .catch(err => console.warn('Failed to load theme:', err))
+      .then(() => {
+        // A later switch may have happened while this one was loading
+        if (theme.value === name) {
+          document.documentElement.setAttribute('data-theme', name)
+        }
+      })
+  }
+
   function setTheme(newTheme) {
     theme.value = newTheme
-    document.documentElement.setAttribute('data-theme', newTheme)
+    return applyTheme(newTheme)
   }
 
   function initTheme() {
-    document.documentElement.setAttribute('data-theme', theme.value)
+    return applyTheme(theme.value)
   }
 
   function setIllustrationStyle(style) {
@@ -73,6 +90,7 @@ export const useSettingsStore = defineStore('settings', () => {
     soundEffectsEnabled,
     hapticEnabled,
     defaultPreset,
+    smoothProgress,
     alerts,
     musicPreference,
     youtubeUrl,
@@ -4,6 +4,8 @@ import { ref, computed } from 'vue'
 import { useProfilesStore } from './profiles'
 import { useSettingsStore } from './settings'
 import { storage } from '../utils/storage'
+import { history } from '../utils/history'
+import { createDeadline } from '../utils/scheduler'
 import { points as pointValues } from '../data/rewards'
 
 export const useTimerStore = defineStore('timer', () => {
@@ -22,8 +24,13 @@ export const useTimerStore = defineStore('timer', () => {
   const isFirstOfDay = ref(true)
 
   // Internal
-  let intervalId = null
+  // Phase end and alerts fire from deadlines armed relative to
+  // targetEndTime; the per-second tick only refreshes the display
+  const phaseEnd = createDeadline(handleTimerComplete)
+  const alertDue = createDeadline(fireDueAlerts)
+  let tickTimeout = null
   let pausedStatus = null
+  let firedAlerts = [] // alerts already fired in the current phase
 
   // Presets
   const presets = [
@@ -48,50 +55,94 @@ export const useTimerStore = defineStore('timer', () => {
     return Math.round(progress.value * 100)
   })
 
-  // Alert checks
-  function checkAlerts(remaining, total) {
-    const settings = useSettingsStore()
-    const alerts = settings.alerts
+  // Seconds left in a phase of `total` seconds when each alert is due
+  const alertThresholds = {
+    oneMinute: () => 60,
+    fiveMinutes: () => 300,
+    fiftyPercent: total => Math.floor(total * 0.5),
+    twentyFivePercent: total => Math.floor(total * 0.25),
+  }
 
-    const triggers = []
+  // Alerts of the current phase that have not fired yet, earliest first.
+  // Thresholds at or above the phase length are never due.
+  function pendingAlerts() {
+    return Object.entries(alertThresholds)
+      .map(([name, threshold]) => ({ name, seconds: threshold(totalTime.value) }))
+      .filter(({ name, seconds }) =>
+        seconds > 0 && seconds < totalTime.value && !firedAlerts.includes(name))
+      .map(({ name, seconds }) => ({ name, at: targetEndTime.value - seconds * 1000 }))
+      .sort((a, b) => a.at - b.at)
+  }
 
-    if (alerts.oneMinute && remaining === 60) {
-      triggers.push('oneMinute')
-    }
-    if (alerts.fiveMinutes && remaining === 300) {
-      triggers.push('fiveMinutes')
-    }
-    if (alerts.fiftyPercent && remaining === Math.floor(total * 0.5)) {
-      triggers.push('fiftyPercent')
-    }
-    if (alerts.twentyFivePercent && remaining === Math.floor(total * 0.25)) {
-      triggers.push('twentyFivePercent')
-    }
+  // Alerts already behind `remaining` seconds, for states saved without firedAlerts
+  function passedAlerts(remaining, total) {
+    return Object.keys(alertThresholds).filter(name => alertThresholds[name](total) >= remaining)
+  }
 
-    return triggers
+  function armAlerts() {
+    const next = pendingAlerts()[0]
+    if (next) alertDue.arm(next.at)
   }
 
-  // Timer tick
-  function tick() {
+  // Fire every alert whose deadline has passed - a late wake-up fires all of
+  // them together rather than losing any - then wait for the next one
+  function fireDueAlerts() {
     const now = Date.now()
-    const remaining = Math.max(0, Math.round((targetEndTime.value - now) / 1000))
-    timeRemaining.value = remaining
+    const due = pendingAlerts().filter(alert => alert.at <= now).map(alert => alert.name)
+    firedAlerts.push(...due)
 
-    // Check for alerts
-    const alerts = checkAlerts(remaining, totalTime.value)
+    const settings = useSettingsStore()
+    const alerts = due.filter(name => settings.alerts[name])
     if (alerts.length > 0) {
       // Emit event for sound system to handle
       window.dispatchEvent(new CustomEvent('timer-alert', { detail: { alerts } }))
     }
 
-    if (remaining <= 0) {
-      handleTimerComplete()
+    saveTimerState()
+    armAlerts()
+  }
+
+  function secondsLeft() {
+    return Math.max(0, Math.round((targetEndTime.value - Date.now()) / 1000))
+  }
+
+  // Timer tick
+  function tick() {
+    timeRemaining.value = secondsLeft()
+  }
+
+  // Tick when the displayed (rounded) second changes, i.e. at every x.5s
+  // before the deadline, rather than on a free-running interval
+  function scheduleTick() {
+    // Nobody sees a hidden tab - ticking resumes when it becomes visible
+    if (document.hidden) {
+      tickTimeout = null
+      return
     }
+    const msLeft = targetEndTime.value - Date.now()
+    const delay = (((msLeft - 500) % 1000) + 1000) % 1000 + 5
+    tickTimeout = setTimeout(() => {
+      tick()
+      scheduleTick()
+    }, delay)
   }
 
-  function handleTimerComplete() {
-    clearInterval(intervalId)
-    intervalId = null
+  function startClock() {
+    stopClock()
+    phaseEnd.arm(targetEndTime.value)
+    armAlerts()
+    scheduleTick()
+  }
+
+  function stopClock() {
+    clearTimeout(tickTimeout)
+    tickTimeout = null
+    phaseEnd.cancel()
+    alertDue.cancel()
+  }
+
+  function handleTimerComplete(lateMs = 0) {
+    stopClock()
 
     if (status.value === 'working') {
       // Work session complete - THIS IS THE POMODORO COMPLETION!
@@ -116,14 +167,14 @@ export const useTimerStore = defineStore('timer', () => {
       // Record to session history
       recordSession()
 
-      window.dispatchEvent(new CustomEvent('timer-event', { detail: { type: 'work-complete' } }))
+      window.dispatchEvent(new CustomEvent('timer-event', { detail: { type: 'work-complete', lateMs } }))
       window.dispatchEvent(new CustomEvent('timer-event', { detail: { type: 'pomodoro-complete' } }))
 
       // Start break
       startBreak()
     } else if (status.value === 'break') {
       // Break complete - just return to idle
-      window.dispatchEvent(new CustomEvent('timer-event', { detail: { type: 'break-complete' } }))
+      window.dispatchEvent(new CustomEvent('timer-event', { detail: { type: 'break-complete', lateMs } }))
 
       status.value = 'idle'
       timeRemaining.value = 0
@@ -145,19 +196,22 @@ export const useTimerStore = defineStore('timer', () => {
   }
 
   function recordSession() {
-    const data = storage.load()
     const profiles = useProfilesStore()
-
-    data.sessionHistory.push({
+    const session = {
       profileId: profiles.activeProfileId,
       date: new Date().toISOString(),
       type: 'pomodoro',
       workDuration: workDuration.value,
       breakDuration: breakDuration.value,
       completed: true,
-    })
+    }
 
-    storage.save(storage.pruneOldHistory(data))
+    history.record(session).catch(() => {
+      // No IndexedDB - keep the last 30 days in the stored document instead
+      const data = storage.load()
+      data.sessionHistory.push(session)
+      storage.update({ sessionHistory: storage.pruneOldHistory(data).sessionHistory })
+    })
   }
 
   // Public methods
@@ -179,10 +233,11 @@ export const useTimerStore = defineStore('timer', () => {
     totalTime.value = workDuration.value * 60
     timeRemaining.value = totalTime.value
     targetEndTime.value = Date.now() + (totalTime.value * 1000)
+    firedAlerts = []
 
     window.dispatchEvent(new CustomEvent('timer-event', { detail: { type: 'work-start' } }))
 
-    intervalId = setInterval(tick, 1000)
+    startClock()
     saveTimerState()
   }
 
@@ -191,10 +246,11 @@ export const useTimerStore = defineStore('timer', () => {
     totalTime.value = breakDuration.value * 60
     timeRemaining.value = totalTime.value
     targetEndTime.value = Date.now() + (totalTime.value * 1000)
+    firedAlerts = []
 
     window.dispatchEvent(new CustomEvent('timer-event', { detail: { type: 'break-start' } }))
 
-    intervalId = setInterval(tick, 1000)
+    startClock()
     saveTimerState()
   }
 
@@ -203,8 +259,8 @@ export const useTimerStore = defineStore('timer', () => {
 
     pausedStatus = status.value
     status.value = 'paused'
-    clearInterval(intervalId)
-    intervalId = null
+    timeRemaining.value = secondsLeft()
+    stopClock()
     saveTimerState()
   }
 
@@ -213,13 +269,12 @@ export const useTimerStore = defineStore('timer', () => {
 
     status.value = pausedStatus
     targetEndTime.value = Date.now() + (timeRemaining.value * 1000)
-    intervalId = setInterval(tick, 1000)
+    startClock()
     saveTimerState()
   }
 
   function stop() {
-    clearInterval(intervalId)
-    intervalId = null
+    stopClock()
     status.value = 'idle'
     timeRemaining.value = 0
     totalTime.value = 0
@@ -231,8 +286,7 @@ export const useTimerStore = defineStore('timer', () => {
   function skipBreak() {
     if (status.value !== 'break') return
 
-    clearInterval(intervalId)
-    intervalId = null
+    stopClock()
 
     window.dispatchEvent(new CustomEvent('timer-event', { detail: { type: 'break-skipped' } }))
 
@@ -245,24 +299,23 @@ export const useTimerStore = defineStore('timer', () => {
 
   // Timer state persistence
   function saveTimerState() {
-    const data = storage.load()
-    data.timerState = {
-      status: status.value,
-      timeRemaining: timeRemaining.value,
-      totalTime: totalTime.value,
-      targetEndTime: targetEndTime.value,
-      workDuration: workDuration.value,
-      breakDuration: breakDuration.value,
-      pausedStatus: pausedStatus,
-      savedAt: Date.now()
-    }
-    storage.save(data)
+    storage.update({
+      timerState: {
+        status: status.value,
+        timeRemaining: timeRemaining.value,
+        totalTime: totalTime.value,
+        targetEndTime: targetEndTime.value,
+        workDuration: workDuration.value,
+        breakDuration: breakDuration.value,
+        pausedStatus: pausedStatus,
+        firedAlerts: [...firedAlerts],
+        savedAt: Date.now()
+      },
+    })
   }
 
   function clearTimerState() {
-    const data = storage.load()
-    data.timerState = null
-    storage.save(data)
+    storage.update({ timerState: null })
   }
 
   function restoreTimerState() {
@@ -271,6 +324,7 @@ export const useTimerStore = defineStore('timer', () => {
     if (!saved || saved.status === 'idle') return false
 
     const now = Date.now()
+    firedAlerts = saved.firedAlerts ?? passedAlerts(saved.timeRemaining, saved.totalTime)
 
     if (saved.status === 'paused') {
       // Restore paused state as-is
@@ -284,18 +338,19 @@ export const useTimerStore = defineStore('timer', () => {
     }
 
     if (saved.status === 'working' || saved.status === 'break') {
-      // Calculate elapsed time since save
-      const elapsed = Math.floor((now - saved.savedAt) / 1000)
-      const newTimeRemaining = Math.max(0, saved.timeRemaining - elapsed)
+      // The stored deadline is exact; states saved before it existed fall
+      // back to the time elapsed since the save
+      const endTime = saved.targetEndTime ?? saved.savedAt + saved.timeRemaining * 1000
+      const newTimeRemaining = Math.max(0, Math.round((endTime - now) / 1000))
 
-      if (newTimeRemaining <= 0) {
+      if (endTime <= now) {
         // Timer expired while page was closed - trigger completion
         status.value = saved.status
         workDuration.value = saved.workDuration
         breakDuration.value = saved.breakDuration
         totalTime.value = saved.totalTime
         timeRemaining.value = 0
-        handleTimerComplete()
+        handleTimerComplete(now - endTime)
         return true
       }
 
@@ -303,10 +358,11 @@ export const useTimerStore = defineStore('timer', () => {
       status.value = saved.status
       timeRemaining.value = newTimeRemaining
       totalTime.value = saved.totalTime
-      targetEndTime.value = now + (newTimeRemaining * 1000)
+      targetEndTime.value = endTime
       workDuration.value = saved.workDuration
       breakDuration.value = saved.breakDuration
-      intervalId = setInterval(tick, 1000)
+      // Alerts that fell due while the page was closed fire right away
+      startClock()
       return true
     }
 
@@ -319,8 +375,13 @@ export const useTimerStore = defineStore('timer', () => {
     if (!targetEndTime.value) return
     if (status.value === 'paused' || status.value === 'idle') return
 
-    // Recalculate on tab focus
+    // Catch deadlines whose wake-up was throttled, then resume rendering
+    phaseEnd.check()
+    alertDue.check()
+    if (status.value === 'idle') return
+    clearTimeout(tickTimeout)
     tick()
+    scheduleTick()
   }
 
   // Initialize visibility listener
@@ -329,10 +390,7 @@ export const useTimerStore = defineStore('timer', () => {
   // Cleanup function for removing event listeners
   function cleanup() {
     document.removeEventListener('visibilitychange', handleVisibilityChange)
-    if (intervalId) {
-      clearInterval(intervalId)
-      intervalId = null
-    }
+    stopClock()
   }
 
   // Check if new day for first-of-day bonus
@@ -354,6 +412,7 @@ export const useTimerStore = defineStore('timer', () => {
     status,
     timeRemaining,
     totalTime,
+    targetEndTime,
     workDuration,
     breakDuration,
     progress,
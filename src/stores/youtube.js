@@ -172,9 +172,7 @@ export const useYoutubeStore = defineStore('youtube', () => {
   }
 
   function saveVideos() {
-    const data = storage.load()
-    data.savedYoutubeVideos = savedVideos.value
-    storage.save(data)
+    storage.update({ savedYoutubeVideos: savedVideos.value })
   }
 
   return {
@@ -0,0 +1,34 @@
+// src/themes/index.js
+// base.css is bundled with the app; every theme stylesheet is its own chunk,
+// loaded when the theme is applied or prefetched while the browser is idle.
+
+const stylesheets = import.meta.glob(['./*.css', '!./base.css'])
+const loading = {}
+
+export function loadTheme(name) {
+  const loader = stylesheets[`./${name}.css`]
+  if (!loader) return Promise.reject(new Error(`Unknown theme: ${name}`))
+  if (!loading[name]) {
+    loading[name] = loader().catch((err) => {
+      // Forget the failure so the next attempt retries
+      delete loading[name]
+      throw err
+    })
+  }
+  return loading[name]
+}
+
+const whenIdle = window.requestIdleCallback
+  ? (fn) => window.requestIdleCallback(fn, { timeout: 5000 })
+  : (fn) => setTimeout(fn, 1000)
+
+// Load owned themes ahead of time, one per idle period
+export function prefetchThemes(names) {
+  const queue = names.filter(name => !loading[name] && stylesheets[`./${name}.css`])
+  const next = () => {
+    const name = queue.shift()
+    if (!name) return
+    loadTheme(name).catch(() => {}).finally(() => whenIdle(next))
+  }
+  if (queue.length) whenIdle(next)
+}
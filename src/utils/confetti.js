@@ -0,0 +1,129 @@
+// src/utils/confetti.js
+// Confetti drawn on a single canvas. Particles come from a pool allocated
+// once, so a celebration creates no objects or DOM nodes per frame. Each
+// frame's work is timed; when frames run over budget the particle count and
+// canvas resolution drop, so a slow device keeps its frame rate. The count in
+// use is published as the canvas's data-particles attribute.
+
+const COLORS = ['#FF6B6B', '#4ECDC4', '#FFE66D', '#95E1D3', '#F38181', '#AA96DA']
+const POOL_SIZE = 120
+const MIN_PARTICLES = 15
+const FRAME_BUDGET_MS = 4 // drawing time allowed per frame
+const SLOW_FRAME_MS = 1000 / 60 * 1.5
+const SLOW_FRAMES_BEFORE_REDUCING = 5
+
+const pool = Array.from({ length: POOL_SIZE }, () => ({
+  x: 0, size: 0, sway: 0, spin: 0, delay: 0, duration: 0, color: '',
+}))
+
+export function prefersReducedMotion() {
+  return typeof matchMedia === 'function' && matchMedia('(prefers-reduced-motion: reduce)').matches
+}
+
+// Same spread as the old DOM confetti: 0-3s delay, 3-5s fall, 8-16px pieces
+function reset(particle, index, width) {
+  particle.x = Math.random() * width
+  particle.size = 8 + Math.random() * 8
+  particle.delay = Math.random() * 3000
+  particle.duration = 3000 + Math.random() * 2000
+  particle.sway = (Math.random() - 0.5) * 60
+  particle.spin = 4 * Math.PI * (Math.random() < 0.5 ? -1 : 1)
+  particle.color = COLORS[index % COLORS.length]
+}
+
+export function createConfetti(canvas) {
+  const ctx = canvas.getContext('2d')
+  let frame = null
+  let startedAt = 0
+  let active = 0
+  let scale = 1
+  let maxScale = 2
+  let slowFrames = 0
+  let lastFrameAt = 0
+
+  function resize() {
+    scale = Math.min(window.devicePixelRatio || 1, maxScale)
+    canvas.width = Math.round(window.innerWidth * scale)
+    canvas.height = Math.round(window.innerHeight * scale)
+  }
+
+  // Halve the work: fewer particles first, then a 1x canvas
+  function reduceQuality() {
+    slowFrames = 0
+    active = Math.max(MIN_PARTICLES, Math.floor(active / 2))
+    canvas.dataset.particles = active
+    if (scale > 1) {
+      maxScale = 1
+      resize()
+    }
+  }
+
+  function draw(now) {
+    const workStart = performance.now()
+    const elapsed = now - startedAt
+    const height = window.innerHeight
+    let alive = 0
+
+    ctx.setTransform(1, 0, 0, 1, 0, 0)
+    ctx.clearRect(0, 0, canvas.width, canvas.height)
+
+    for (let i = 0; i < active; i++) {
+      const p = pool[i]
+      const t = (elapsed - p.delay) / p.duration
+      if (t >= 1) continue
+      alive++
+      if (t < 0) continue
+
+      const angle = p.spin * t
+      const cos = Math.cos(angle) * scale
+      const sin = Math.sin(angle) * scale
+      ctx.setTransform(
+        cos, sin, -sin, cos,
+        (p.x + p.sway * t) * scale,
+        (-20 + (height + 20) * t) * scale
+      )
+      ctx.globalAlpha = 1 - t
+      ctx.fillStyle = p.color
+      ctx.fillRect(-p.size / 2, -p.size / 2, p.size, p.size)
+    }
+    ctx.globalAlpha = 1
+
+    const work = performance.now() - workStart
+    const interval = lastFrameAt ? now - lastFrameAt : 0
+    lastFrameAt = now
+    if (work > FRAME_BUDGET_MS || interval > SLOW_FRAME_MS) {
+      if (++slowFrames >= SLOW_FRAMES_BEFORE_REDUCING && active > MIN_PARTICLES) reduceQuality()
+    } else {
+      slowFrames = 0
+    }
+
+    frame = alive > 0 ? requestAnimationFrame(draw) : null
+    if (frame === null) ctx.clearRect(0, 0, canvas.width, canvas.height)
+  }
+
+  function start() {
+    stop()
+    // Fewer cores usually means a slower device - start at half the pieces
+    const cores = navigator.hardwareConcurrency || 4
+    active = cores <= 2 ? POOL_SIZE / 2 : POOL_SIZE
+    maxScale = cores <= 2 ? 1 : 2
+    canvas.dataset.particles = active
+    for (let i = 0; i < active; i++) reset(pool[i], i, window.innerWidth)
+    slowFrames = 0
+    lastFrameAt = 0
+    resize()
+    frame = requestAnimationFrame((now) => {
+      startedAt = now
+      draw(now)
+    })
+  }
+
+  function stop() {
+    if (frame !== null) cancelAnimationFrame(frame)
+    frame = null
+    ctx.setTransform(1, 0, 0, 1, 0, 0)
+    ctx.clearRect(0, 0, canvas.width, canvas.height)
+  }
+
+  return { start, stop }
+}
@@ -0,0 +1,163 @@
+// src/utils/history.js
+// Session history lives in IndexedDB instead of the localStorage document:
+// one record per session keyed by [profileId, date], plus a rollup record
+// per profile and day that is updated as sessions are added. Old sessions
+// are pruned with a key range on the date index, so neither recording nor
+// pruning touches the rest of the history.
+
+const DB_NAME = 'kids-timer'
+const DB_VERSION = 1
+const SESSIONS = 'sessions'
+const ROLLUPS = 'dailyRollups'
+export const HISTORY_RETENTION_DAYS = 365
+
+let dbPromise = null
+
+function openDb() {
+  if (dbPromise) return dbPromise
+  dbPromise = new Promise((resolve, reject) => {
+    if (typeof indexedDB === 'undefined') {
+      reject(new Error('IndexedDB is not available'))
+      return
+    }
+    const request = indexedDB.open(DB_NAME, DB_VERSION)
+    request.onupgradeneeded = () => {
+      const db = request.result
+      const sessions = db.createObjectStore(SESSIONS, { keyPath: ['profileId', 'date'] })
+      sessions.createIndex('date', 'date')
+      const rollups = db.createObjectStore(ROLLUPS, { keyPath: ['profileId', 'day'] })
+      rollups.createIndex('day', 'day')
+    }
+    request.onsuccess = () => resolve(request.result)
+    request.onerror = () => reject(request.error)
+  }).catch((err) => {
+    dbPromise = null
+    throw err
+  })
+  return dbPromise
+}
+
+// Run fn(stores) in one transaction; resolves with fn's result once committed
+async function transaction(mode, fn) {
+  const db = await openDb()
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction([SESSIONS, ROLLUPS], mode)
+    const result = fn({ sessions: tx.objectStore(SESSIONS), rollups: tx.objectStore(ROLLUPS) })
+    tx.oncomplete = () => resolve(result)
+    tx.onerror = () => reject(tx.error)
+    tx.onabort = () => reject(tx.error)
+  })
+}
+
+// Day bucket, matching the ISO date the timer uses for "today"
+function dayOf(date) {
+  return date.slice(0, 10)
+}
+
+function normalize(session) {
+  return { ...session, profileId: session.profileId ?? '' }
+}
+
+// Add the sessions that are not stored yet and fold them into their daily
+// rollups. Each rollup is read and written once per call, so sessions of
+// the same day in one batch don't overwrite each other's counts.
+function addSessions({ sessions, rollups }, sessionList) {
+  const unique = new Map(sessionList.map(s => [JSON.stringify([s.profileId, s.date]), s]))
+  const added = []
+  let pending = unique.size
+
+  for (const session of unique.values()) {
+    sessions.getKey([session.profileId, session.date]).onsuccess = (e) => {
+      if (e.target.result === undefined) {
+        sessions.add(session)
+        added.push(session)
+      }
+      if (--pending === 0) updateRollups(rollups, added)
+    }
+  }
+}
+
+function updateRollups(rollups, added) {
+  const deltas = new Map()
+  for (const session of added) {
+    const key = [session.profileId, dayOf(session.date)]
+    const id = JSON.stringify(key)
+    const delta = deltas.get(id) || { key, pomodoros: 0, workMinutes: 0, breakMinutes: 0 }
+    delta.pomodoros++
+    delta.workMinutes += session.workDuration || 0
+    delta.breakMinutes += session.breakDuration || 0
+    deltas.set(id, delta)
+  }
+
+  for (const { key, ...delta } of deltas.values()) {
+    rollups.get(key).onsuccess = (e) => {
+      const rollup = e.target.result || {
+        profileId: key[0],
+        day: key[1],
+        pomodoros: 0,
+        workMinutes: 0,
+        breakMinutes: 0,
+      }
+      rollup.pomodoros += delta.pomodoros
+      rollup.workMinutes += delta.workMinutes
+      rollup.breakMinutes += delta.breakMinutes
+      rollups.put(rollup)
+    }
+  }
+}
+
+function collect(request) {
+  const items = []
+  request.onsuccess = (e) => {
+    const cursor = e.target.result
+    if (!cursor) return
+    items.push(cursor.value)
+    cursor.continue()
+  }
+  return items
+}
+
+export const history = {
+  record(session) {
+    return this.addMany([session])
+  },
+
+  // Add many sessions in one transaction (legacy migration, backup import).
+  // Sessions already stored are skipped, so this is safe to repeat.
+  addMany(sessionList) {
+    return transaction('readwrite', stores => addSessions(stores, sessionList.map(normalize)))
+  },
+
+  getSessions(profileId, from = '', to = '\uffff') {
+    return transaction('readonly', ({ sessions }) =>
+      collect(sessions.openCursor(IDBKeyRange.bound([profileId, from], [profileId, to])))
+    )
+  },
+
+  getDailyRollups(profileId, fromDay = '', toDay = '\uffff') {
+    return transaction('readonly', ({ rollups }) =>
+      collect(rollups.openCursor(IDBKeyRange.bound([profileId, fromDay], [profileId, toDay])))
+    )
+  },
+
+  getAll() {
+    return transaction('readonly', ({ sessions }) => collect(sessions.index('date').openCursor()))
+  },
+
+  // Delete sessions and rollups older than the retention window
+  prune(daysToKeep = HISTORY_RETENTION_DAYS) {
+    const cutoff = new Date(Date.now() - daysToKeep * 24 * 60 * 60 * 1000).toISOString()
+    return transaction('readwrite', ({ sessions, rollups }) => {
+      const deleteAll = (request) => {
+        request.onsuccess = (e) => {
+          const cursor = e.target.result
+          if (!cursor) return
+          cursor.delete()
+          cursor.continue()
+        }
+      }
+      deleteAll(sessions.index('date').openCursor(IDBKeyRange.upperBound(cutoff, true)))
+      deleteAll(rollups.index('day').openCursor(IDBKeyRange.upperBound(dayOf(cutoff), true)))
+    })
+  },
+}
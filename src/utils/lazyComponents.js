@@ -0,0 +1,45 @@
+// src/utils/lazyComponents.js
+import { defineAsyncComponent } from 'vue'
+import LoadingPanel from '../components/UI/LoadingPanel.vue'
+
+// Panels that only render behind a modal or setting, split into their own chunks
+const loaders = {
+  settings: () => import('../components/Settings/SettingsPanel.vue'),
+  rewardsShop: () => import('../components/Rewards/RewardsShop.vue'),
+  badges: () => import('../components/Rewards/BadgesDisplay.vue'),
+  musicPlayer: () => import('../components/Music/MusicPlayer.vue'),
+  youtubePlayer: () => import('../components/Music/YouTubePlayer.vue'),
+}
+
+const pending = {}
+const components = {}
+
+// Start downloading a panel's chunk. Safe to call repeatedly; a failed
+// download is forgotten so the next attempt retries.
+export function prefetchComponent(name) {
+  if (!pending[name]) {
+    pending[name] = loaders[name]().catch((err) => {
+      delete pending[name]
+      throw err
+    })
+  }
+  return pending[name]
+}
+
+// Prefetch without surfacing errors - the real load reports them
+export function prefetchOnIntent(...names) {
+  return () => names.forEach(name => prefetchComponent(name).catch(() => {}))
+}
+
+// One async wrapper per panel, shared by every component that renders it
+export function lazyComponent(name) {
+  components[name] ??= defineAsyncComponent({
+    loader: () => prefetchComponent(name),
+    loadingComponent: LoadingPanel,
+    errorComponent: LoadingPanel,
+    // Avoid flashing the spinner when the chunk is already prefetched
+    delay: 150,
+    timeout: 15000,
+  })
+  return components[name]
+}
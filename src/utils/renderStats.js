@@ -0,0 +1,22 @@
+// src/utils/renderStats.js
+// Component update counters for render profiling. On in development; other
+// builds opt in by setting window.__RENDER_STATS__ before the app boots (the
+// test harness does). Counts are kept per component name in
+// window.__renderStats.updates, e.g. { TimerClock: 25, CircularProgress: 25 }.
+
+export function installRenderStats(app) {
+  const stats = {
+    updates: {},
+    reset() {
+      this.updates = {}
+    },
+  }
+  window.__renderStats = stats
+
+  app.mixin({
+    updated() {
+      const name = this.$options.name || this.$options.__name || 'Anonymous'
+      stats.updates[name] = (stats.updates[name] || 0) + 1
+    },
+  })
+}
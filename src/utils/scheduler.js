@@ -0,0 +1,65 @@
+// src/utils/scheduler.js
+import TimerWorker from './timerWorker.js?worker'
+
+// Deadlines are armed twice: with a main-thread timeout and in a worker.
+// Whichever wakes first checks Date.now() against the deadline, so the
+// callback runs once, on time even when the tab is hidden and throttled,
+// and page-level fake clocks (tests) still drive it.
+
+let worker = null
+let workerUnavailable = false
+const pending = new Map()
+let nextId = 0
+
+function getWorker() {
+  if (worker || workerUnavailable) return worker
+  try {
+    worker = new TimerWorker()
+    worker.onmessage = ({ data }) => pending.get(data.id)?.()
+  } catch (e) {
+    // No worker support (or blocked) - the main-thread timeout still runs
+    workerUnavailable = true
+  }
+  return worker
+}
+
+export function createDeadline(onDue) {
+  const id = ++nextId
+  let deadline = null
+  let timeoutId = null
+
+  function schedule(delay) {
+    clearTimeout(timeoutId)
+    timeoutId = setTimeout(check, delay)
+    getWorker()?.postMessage({ type: 'arm', id, delay })
+  }
+
+  // Run onDue if the deadline has passed, otherwise wait for the rest
+  function check() {
+    if (deadline === null) return
+    const left = deadline - Date.now()
+    if (left > 0) {
+      schedule(left)
+      return
+    }
+    const lateMs = -left
+    cancel()
+    onDue(lateMs)
+  }
+
+  function arm(at) {
+    deadline = at
+    pending.set(id, check)
+    schedule(Math.max(0, at - Date.now()))
+  }
+
+  function cancel() {
+    deadline = null
+    clearTimeout(timeoutId)
+    timeoutId = null
+    pending.delete(id)
+    worker?.postMessage({ type: 'cancel', id })
+  }
+
+  return { arm, cancel, check }
+}
@@ -1,8 +1,26 @@
 // src/utils/storage.js
-const STORAGE_KEY = 'kids-timer-data'
+import { history } from './history'
+
+// Version 1 kept the whole document under one key. Since version 2 each
+// section has its own key, so a timer save doesn't rewrite every profile
+// and the whole session history.
+const LEGACY_KEY = 'kids-timer-data'
+const KEY_PREFIX = 'kids-timer:'
+const META_KEY = `${KEY_PREFIX}meta`
+const PROFILE_PREFIX = `${KEY_PREFIX}profile:`
+const CURRENT_VERSION = 2
+
+// Document section -> key it is stored under. Profiles get one key each;
+// everything else (version, activeProfileId, ...) lives in the meta key.
+const SECTION_KEYS = {
+  globalSettings: `${KEY_PREFIX}settings`,
+  timerState: `${KEY_PREFIX}timer`,
+  sessionHistory: `${KEY_PREFIX}history`,
+  savedYoutubeVideos: `${KEY_PREFIX}youtube`,
+}
 
 const defaultData = {
-  version: 1,
+  version: CURRENT_VERSION,
   profiles: [],
   activeProfileId: null,
   globalSettings: {
@@ -11,25 +29,149 @@ const defaultData = {
     defaultPreset: '25-5'
   },
   sessionHistory: [],
-  timerState: null  // Will store: { status, timeRemaining, totalTime, targetEndTime, workDuration, breakDuration, pausedStatus, savedAt }
+  timerState: null  // Will store: { status, timeRemaining, totalTime, targetEndTime, workDuration, breakDuration, pausedStatus, firedAlerts, savedAt }
+}
+
+// One hydrated document is kept in memory. Stores update sections of it and
+// the changes are written back together once the current task is done, so a
+// burst of saves (e.g. a timer completion) costs a single stringify + write.
+// Pending changes are flushed immediately when the page is hidden or closed.
+let cache = null
+const dirty = new Set()
+let flushTimer = null
+// Last value read or written per key, so unchanged shards are not rewritten
+const written = new Map()
+
+function freshData() {
+  return JSON.parse(JSON.stringify(defaultData))
+}
+
+function scheduleFlush() {
+  if (flushTimer !== null) return
+  // A task rather than a microtask, so Vue watchers that save in reaction to
+  // the same change land in the same write
+  flushTimer = setTimeout(() => storage.flush(), 0)
+}
+
+function profileKey(id) {
+  return `${PROFILE_PREFIX}${id}`
+}
+
+function readKey(key) {
+  const raw = localStorage.getItem(key)
+  if (raw !== null) written.set(key, raw)
+  return raw
+}
+
+// Assemble the document from its shards
+function readShards(rawMeta) {
+  const { profileIds = [], ...meta } = JSON.parse(rawMeta)
+  const data = { ...freshData(), ...meta, profiles: [] }
+  for (const [section, key] of Object.entries(SECTION_KEYS)) {
+    const raw = readKey(key)
+    if (raw !== null) data[section] = JSON.parse(raw)
+  }
+  for (const id of profileIds) {
+    const raw = readKey(profileKey(id))
+    if (raw !== null) data.profiles.push(JSON.parse(raw))
+  }
+  return data
+}
+
+// Serialize the keys backing the given sections. Returns [key, value] pairs
+// in write order; a null value means the key should be removed.
+function shardsFor(data, sections) {
+  const updates = []
+  const removals = []
+  let metaChanged = false
+
+  for (const section of sections) {
+    if (SECTION_KEYS[section]) {
+      updates.push([SECTION_KEYS[section], JSON.stringify(data[section] ?? null)])
+    } else if (section === 'profiles') {
+      const current = new Set()
+      for (const profile of data.profiles) {
+        const key = profileKey(profile.id)
+        current.add(key)
+        updates.push([key, JSON.stringify(profile)])
+      }
+      for (const key of written.keys()) {
+        if (key.startsWith(PROFILE_PREFIX) && !current.has(key)) removals.push([key, null])
+      }
+      metaChanged = true
+    } else {
+      metaChanged = true
+    }
+  }
+
+  // Meta goes after the profiles it lists and before stale ones are removed
+  if (metaChanged) {
+    const meta = { profileIds: data.profiles.map(p => p.id) }
+    for (const [key, value] of Object.entries(data)) {
+      if (key !== 'profiles' && !SECTION_KEYS[key]) meta[key] = value
+    }
+    updates.push([META_KEY, JSON.stringify(meta)])
+  }
+  return updates.concat(removals)
 }
 
 export const storage = {
   load() {
+    if (cache) return cache
     try {
-      const raw = localStorage.getItem(STORAGE_KEY)
-      if (!raw) return { ...defaultData }
-      const data = JSON.parse(raw)
-      return this.migrate(data)
+      const rawMeta = readKey(META_KEY)
+      if (rawMeta !== null) {
+        cache = this.migrate(readShards(rawMeta))
+      } else {
+        const legacy = localStorage.getItem(LEGACY_KEY)
+        cache = legacy ? this.migrate(JSON.parse(legacy)) : freshData()
+        // Split the legacy blob into shards; keep it if that fails
+        if (legacy && this.save(cache)) localStorage.removeItem(LEGACY_KEY)
+      }
     } catch (e) {
       console.error('Failed to load storage:', e)
-      return { ...defaultData }
+      cache = freshData()
     }
+    return cache
   },
 
+  // Replace sections of the document, e.g. update({ timerState: null }).
+  // The write happens at the end of the current task.
+  update(sections) {
+    const data = this.load()
+    for (const [key, value] of Object.entries(sections)) {
+      data[key] = value
+      dirty.add(key)
+    }
+    scheduleFlush()
+  },
+
+  // Replace the whole document and write it now
   save(data) {
+    cache = data
+    Object.keys(data).forEach(key => dirty.add(key))
+    dirty.add('profiles')
+    return this.flush()
+  },
+
+  flush() {
+    if (flushTimer !== null) {
+      clearTimeout(flushTimer)
+      flushTimer = null
+    }
+    if (!cache || dirty.size === 0) return true
     try {
-      localStorage.setItem(STORAGE_KEY, JSON.stringify(data))
+      for (const [key, value] of shardsFor(cache, dirty)) {
+        if (written.get(key) === value) continue
+        if (value === null) {
+          localStorage.removeItem(key)
+          written.delete(key)
+        } else {
+          localStorage.setItem(key, value)
+          written.set(key, value)
+        }
+      }
+      dirty.clear()
       return true
     } catch (e) {
       console.error('Failed to save storage:', e)
@@ -37,14 +179,49 @@ export const storage = {
     }
   },
 
+  // Drop the in-memory document so the next load() reads localStorage again
+  invalidate() {
+    if (dirty.size > 0) return
+    cache = null
+    written.clear()
+  },
+
   migrate(data) {
+    // Version 1 -> 2 only changes how the document is stored (see
+    // SECTION_KEYS); the shape is the same, so v1 backups import as-is
+    if (!data.version || data.version < 2) {
+      data.version = 2
+    }
     // Future migrations go here
-    // if (data.version === 1) { migrate to 2 }
+    // if (data.version === 2) { migrate to 3 }
     return data
   },
 
-  exportData() {
-    const data = this.load()
+  // Move sessions from the stored document into the IndexedDB history and
+  // prune it. Without IndexedDB the document keeps holding the history.
+  async migrateHistory() {
+    try {
+      const legacy = this.load().sessionHistory
+      if (legacy?.length) {
+        await history.addMany(legacy)
+        this.update({ sessionHistory: [] })
+      }
+      await history.prune()
+      return true
+    } catch (e) {
+      console.warn('Session history stays in localStorage:', e)
+      return false
+    }
+  },
+
+  async exportData() {
+    const data = { ...this.load() }
+    try {
+      // Backups keep the v1 layout, with history inline
+      data.sessionHistory = [...(data.sessionHistory || []), ...await history.getAll()]
+    } catch (e) {
+      console.warn('Exporting without IndexedDB history:', e)
+    }
     const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' })
     const url = URL.createObjectURL(blob)
     const a = document.createElement('a')
@@ -62,7 +239,7 @@ export const storage = {
           const data = JSON.parse(e.target.result)
           if (data.version) {
             this.save(this.migrate(data))
-            resolve(data)
+            this.migrateHistory().then(() => resolve(data))
           } else {
             reject(new Error('Invalid backup file'))
           }
@@ -83,3 +260,16 @@ export const storage = {
     return data
   }
 }
+
+if (typeof window !== 'undefined') {
+  window.addEventListener('pagehide', () => storage.flush())
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') storage.flush()
+  })
+  // Another tab saved - re-read on next load() unless we have unsaved changes
+  window.addEventListener('storage', (e) => {
+    if (e.key === null || e.key === LEGACY_KEY || e.key.startsWith(KEY_PREFIX)) {
+      storage.invalidate()
+    }
+  })
+}
@@ -0,0 +1,17 @@
+// src/utils/timerWorker.js
+// Timers in a dedicated worker are not subject to the throttling browsers
+// apply to main-thread timers in hidden tabs, so a deadline armed here is
+// reported on time. Messages: { type: 'arm', id, delay } and { type: 'cancel', id }.
+
+const timers = new Map()
+
+self.onmessage = ({ data }) => {
+  clearTimeout(timers.get(data.id))
+  timers.delete(data.id)
+  if (data.type !== 'arm') return
+
+  timers.set(data.id, setTimeout(() => {
+    timers.delete(data.id)
+    self.postMessage({ id: data.id })
+  }, data.delay))
+}
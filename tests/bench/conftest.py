@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def bench_work_minutes(request):
+    """Work session length used by timer benchmarks."""
+    return request.config.getoption("--bench-work-minutes")
@@ -0,0 +1,54 @@
+"""Audio Startup Benchmarks - soundscape start-up latency on simulated networks."""
+import pytest
+from config import SEL
+from utils.bench import write_bench_results
+
+pytestmark = pytest.mark.bench
+
+LATENCIES_MS = [0, 150, 600]
+BANDWIDTHS_KBPS = [None, 1600, 400]
+
+# Time from each HTMLMediaElement.play() call to its first 'playing' event
+PLAY_PROBE_SCRIPT = """
+(() => {
+    window.__audioStarts = []
+    const play = HTMLMediaElement.prototype.play
+    HTMLMediaElement.prototype.play = function () {
+        const started = performance.now()
+        this.addEventListener('playing', () => {
+            window.__audioStarts.push(performance.now() - started)
+        }, { once: true })
+        return play.call(this)
+    }
+})()
+"""
+
+
+@pytest.fixture(scope="module")
+def startup_results():
+    results = {}
+    yield results
+    write_bench_results("audio-startup", results)
+
+
+@pytest.mark.storage_snapshot("one_profile")
+@pytest.mark.parametrize("bandwidth_kbps", BANDWIDTHS_KBPS)
+@pytest.mark.parametrize("latency_ms", LATENCIES_MS)
+def test_soundscape_startup(page, base_url, network_stubs, startup_results,
+                            latency_ms, bandwidth_kbps):
+    """Measure play() to 'playing' for an ambient soundscape."""
+    page.add_init_script(PLAY_PROBE_SCRIPT)
+    page.reload()
+    page.wait_for_selector(SEL["timer_display"])
+    page.click(SEL["settings_btn"])
+    page.click(f"{SEL['music_btn']}:has-text('Música')")
+    page.wait_for_selector(SEL["music_player"])
+
+    network_stubs.knobs.latency_ms = latency_ms
+    network_stubs.knobs.bandwidth_kbps = bandwidth_kbps
+    page.locator(f"{SEL['track_card']}:not(.locked)").first.click()
+    page.wait_for_function("window.__audioStarts.length > 0", timeout=30000)
+
+    startup_ms = page.evaluate("window.__audioStarts[0]")
+    bandwidth = f"{bandwidth_kbps}kbps" if bandwidth_kbps else "unlimited"
+    startup_results[f"{latency_ms}ms/{bandwidth}"] = round(startup_ms, 1)
@@ -0,0 +1,146 @@
+"""Celebration Benchmarks - frames and long tasks through the work->break transition."""
+import time
+
+import pytest
+from config import SEL
+from utils.bench import boot_with_storage, set_cpu_throttling, write_bench_results
+from utils.storage_helpers import build_profile, build_storage_data
+
+pytestmark = pytest.mark.bench
+
+# canvas: the app's confetti. dom: the previous 50-node CSS confetti, replayed
+# by DOM_CONFETTI_SCRIPT while reduced motion keeps the canvas off. none:
+# reduced motion only, the cost of the transition itself.
+MODES = ["canvas", "dom", "none"]
+CPU_RATES = [1, 4, 6]
+# The work phase ends this long after boot; enough for a throttled boot
+LEAD_MS = 8000
+WINDOW_MS = 6000
+
+# Records frame intervals and long tasks for WINDOW_MS from work-complete
+TRANSITION_PROBE_SCRIPT = """
+(() => {
+    const longTasks = []
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) longTasks.push(entry)
+    }).observe({ type: 'longtask' })
+
+    window.addEventListener('timer-event', (e) => {
+        if (e.detail.type !== 'work-complete' || window.__transition) return
+        const start = performance.now()
+        const result = window.__transition = { frames: [], longTasks: [], done: false }
+        let last = start
+        const loop = (t) => {
+            result.frames.push(t - last)
+            last = t
+            if (t - start < %(window)d) {
+                requestAnimationFrame(loop)
+                return
+            }
+            result.longTasks = longTasks
+                .filter(entry => entry.startTime >= start)
+                .map(entry => entry.duration)
+            const canvas = document.querySelector('.confetti-canvas')
+            result.particles = canvas ? Number(canvas.dataset.particles) : null
+            result.done = true
+        }
+        requestAnimationFrame(loop)
+    })
+})()
+""" % {"window": WINDOW_MS}
+
+# The confetti as it was before the canvas renderer: 50 absolutely positioned
+# nodes, four Math.random() calls each, one CSS animation per node
+DOM_CONFETTI_SCRIPT = """
+window.addEventListener('timer-event', (e) => {
+    if (e.detail.type !== 'pomodoro-complete') return
+    const style = document.createElement('style')
+    style.textContent = `
+        .bench-confetti-container { position: fixed; inset: 0; overflow: hidden;
+            pointer-events: none; z-index: 1001; }
+        .bench-confetti { position: absolute; top: -20px; border-radius: 2px;
+            background: var(--confetti-color); animation: bench-confetti-fall linear forwards; }
+        @keyframes bench-confetti-fall {
+            0% { transform: translateY(0) rotate(0deg); opacity: 1; }
+            100% { transform: translateY(100vh) rotate(720deg); opacity: 0; }
+        }`
+    document.head.appendChild(style)
+    const colors = ['#FF6B6B', '#4ECDC4', '#FFE66D', '#95E1D3', '#F38181', '#AA96DA']
+    const container = document.createElement('div')
+    container.className = 'bench-confetti-container'
+    for (let i = 1; i <= 50; i++) {
+        const node = document.createElement('div')
+        const size = 8 + Math.random() * 8
+        node.className = 'bench-confetti'
+        node.style.setProperty('--confetti-color', colors[i % colors.length])
+        node.style.left = `${Math.random() * 100}%`
+        node.style.animationDelay = `${Math.random() * 3}s`
+        node.style.animationDuration = `${3 + Math.random() * 2}s`
+        node.style.width = `${size}px`
+        node.style.height = `${size}px`
+        container.appendChild(node)
+    }
+    document.body.appendChild(container)
+})
+"""
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0
+
+
+@pytest.fixture(scope="module")
+def celebration_results():
+    """Collect every run and write them once at the end."""
+    results = {}
+    yield results
+    write_bench_results("celebration-frames", results)
+
+
+@pytest.mark.parametrize("cpu_rate", CPU_RATES)
+@pytest.mark.parametrize("mode", MODES)
+def test_celebration_frames(browser, base_url, celebration_results, mode, cpu_rate):
+    """Let a work phase end with the celebration and record frames and long tasks."""
+    profile = build_profile()
+    data = build_storage_data([profile], profile["id"])
+    now = int(time.time() * 1000)
+    data["timerState"] = {
+        "status": "working",
+        "timeRemaining": LEAD_MS // 1000,
+        "totalTime": 60,
+        "targetEndTime": now + LEAD_MS,
+        "workDuration": 1,
+        "breakDuration": 1,
+        "pausedStatus": None,
+        "firedAlerts": ["oneMinute", "fiftyPercent", "twentyFivePercent"],
+        "savedAt": now,
+    }
+    scripts = [TRANSITION_PROBE_SCRIPT] + ([DOM_CONFETTI_SCRIPT] if mode == "dom" else [])
+    context, page, _ = boot_with_storage(
+        browser, base_url, data, f"document.querySelector('{SEL['timer_display']}')",
+        init_scripts=scripts,
+    )
+    try:
+        if mode != "canvas":
+            page.emulate_media(reduced_motion="reduce")
+        set_cpu_throttling(page, cpu_rate)
+
+        page.wait_for_function(
+            "window.__transition && window.__transition.done",
+            timeout=LEAD_MS + WINDOW_MS + 30000,
+        )
+        result = page.evaluate("window.__transition")
+        frames = result["frames"][1:]
+        celebration_results[f"cpu{cpu_rate}x/{mode}"] = {
+            "frames": len(frames),
+            "fps": round(len(frames) / (WINDOW_MS / 1000), 1),
+            "frame_p95_ms": round(percentile(frames, 0.95), 1),
+            "dropped_frames": sum(1 for f in frames if f > 1000 / 60 * 1.5),
+            "long_tasks": len(result["longTasks"]),
+            "long_task_ms": round(sum(result["longTasks"]), 1),
+            # Canvas only: pieces left after automatic quality reduction
+            "particles": result["particles"],
+        }
+    finally:
+        context.close()
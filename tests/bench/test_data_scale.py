@@ -0,0 +1,220 @@
+"""Data Scale Benchmarks - boot, load and completion cost as stored data grows."""
+import time
+
+import pytest
+from config import SEL
+from utils.bench import boot_with_storage, start_custom_session, write_bench_results
+from utils.data_scale import build_scaled_storage
+from utils.fast_clock import FastClock
+from utils.storage_helpers import ASSEMBLE_STORAGE_SCRIPT
+
+pytestmark = pytest.mark.bench
+
+HISTORY_SIZES = [10, 100, 1000, 5000, 10000, 25000, 50000]
+PROFILE_SIZES = [1, 10, 100, 500, 1000]
+VIDEO_SIZES = [0, 50, 500, 1000, 5000]
+
+# Timer screen, or the selector when seeding failed (e.g. over quota)
+APP_READY = f"document.querySelector('{SEL['timer_display']}, {SEL['profile_card']}')"
+
+# storage.load(): getItem + JSON.parse of every shard (median of 5)
+LOAD_SCRIPT = """
+() => {
+    const read = %s
+    const times = []
+    for (let i = 0; i < 5; i++) {
+        const start = performance.now()
+        read()
+        times.push(performance.now() - start)
+    }
+    times.sort((a, b) => a - b)
+    return times[2]
+}
+""" % ASSEMBLE_STORAGE_SCRIPT
+
+# Sessions (and their rollups) older than history.js's 365-day retention,
+# written straight into IndexedDB after the boot-time prune has run
+SEED_EXPIRED_SCRIPT = """
+async (count) => {
+    const db = await new Promise((resolve, reject) => {
+        const request = indexedDB.open('kids-timer')
+        request.onsuccess = () => resolve(request.result)
+        request.onerror = () => reject(request.error)
+    })
+    const oldest = Date.now() - 366 * 24 * 60 * 60 * 1000
+    const tx = db.transaction(['sessions', 'dailyRollups'], 'readwrite')
+    const rollups = new Map()
+    for (let i = 0; i < count; i++) {
+        const date = new Date(oldest - i * 60 * 60 * 1000).toISOString()
+        tx.objectStore('sessions').add({
+            profileId: 'scale-profile-00001', date, type: 'pomodoro',
+            workDuration: 25, breakDuration: 5, completed: true,
+        })
+        const day = date.slice(0, 10)
+        const rollup = rollups.get(day) || {
+            profileId: 'scale-profile-00001', day, pomodoros: 0, workMinutes: 0, breakMinutes: 0,
+        }
+        rollup.pomodoros++
+        rollup.workMinutes += 25
+        rollup.breakMinutes += 5
+        rollups.set(day, rollup)
+    }
+    rollups.forEach((rollup) => tx.objectStore('dailyRollups').put(rollup))
+    await new Promise((resolve, reject) => {
+        tx.oncomplete = resolve
+        tx.onerror = () => reject(tx.error)
+    })
+    db.close()
+}
+"""
+
+# history.prune(): cursor delete over the date and day indexes up to the
+# cutoff, timed until the transaction commits. Returns the elapsed time and
+# how many sessions and rollups older than the cutoff are left.
+PRUNE_SCRIPT = """
+async () => {
+    const db = await new Promise((resolve, reject) => {
+        const request = indexedDB.open('kids-timer')
+        request.onsuccess = () => resolve(request.result)
+        request.onerror = () => reject(request.error)
+    })
+    const cutoff = new Date(Date.now() - 365 * 24 * 60 * 60 * 1000).toISOString()
+    const sessionRange = IDBKeyRange.upperBound(cutoff, true)
+    const dayRange = IDBKeyRange.upperBound(cutoff.slice(0, 10), true)
+    const indexes = (tx) => [
+        [tx.objectStore('sessions').index('date'), sessionRange],
+        [tx.objectStore('dailyRollups').index('day'), dayRange],
+    ]
+    const done = (tx) => new Promise((resolve, reject) => {
+        tx.oncomplete = resolve
+        tx.onerror = () => reject(tx.error)
+    })
+
+    const start = performance.now()
+    const tx = db.transaction(['sessions', 'dailyRollups'], 'readwrite')
+    for (const [index, range] of indexes(tx)) {
+        index.openCursor(range).onsuccess = (e) => {
+            const cursor = e.target.result
+            if (!cursor) return
+            cursor.delete()
+            cursor.continue()
+        }
+    }
+    await done(tx)
+    const elapsed = performance.now() - start
+
+    const check = db.transaction(['sessions', 'dailyRollups'])
+    const counts = indexes(check).map(([index, range]) => {
+        const request = index.count(range)
+        return () => request.result
+    })
+    await done(check)
+    db.close()
+    const [sessions, rollups] = counts.map((count) => count())
+    return { elapsed, sessions, rollups }
+}
+"""
+
+# The legacy sessionHistory array has been moved into IndexedDB
+HISTORY_MIGRATED = "JSON.parse(localStorage.getItem('kids-timer:history') || '[]').length === 0"
+
+
+@pytest.fixture(scope="module")
+def scale_results():
+    """Collect one scaling curve per axis and write them once at the end."""
+    results = {"history": [], "profiles": [], "videos": []}
+    yield results
+    for curve in results.values():
+        curve.sort(key=lambda point: point["size"])
+    write_bench_results("data-scale", results)
+
+
+def measure_completion_ms(page):
+    """Extra wall time of the virtual second that completes a work session.
+
+    Compared against an ordinary tick so only the completion work
+    (points, history record, saves) is left.
+    """
+    clock = FastClock(page)
+    start_custom_session(page, 1)
+    clock.advance(57)
+
+    started = time.perf_counter()
+    clock.advance(1)
+    tick_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    clock.run_until("break")
+    complete_ms = (time.perf_counter() - started) * 1000
+    return round(complete_ms - tick_ms, 1)
+
+
+@pytest.mark.parametrize("size", HISTORY_SIZES)
+def test_history_scale(browser, base_url, scale_results, size):
+    """Boot, history migration, load, prune and completion cost against history length.
+
+    Pruning is timed on as many expired sessions as there are recent ones.
+    """
+    data = build_scaled_storage(history=size)
+    context, page, point = boot_with_storage(
+        browser, base_url, data, APP_READY,
+        fast_clock=True,
+    )
+    try:
+        point["size"] = size
+        if point["seed_error"] is None:
+            started = time.perf_counter()
+            page.wait_for_function(HISTORY_MIGRATED, timeout=120000)
+            point["migration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            point["load_ms"] = round(page.evaluate(LOAD_SCRIPT), 2)
+            page.evaluate(SEED_EXPIRED_SCRIPT, size)
+            prune = page.evaluate(PRUNE_SCRIPT)
+            assert prune["sessions"] == 0 and prune["rollups"] == 0, (
+                f"Prune left expired history behind: {prune}"
+            )
+            point["prune_ms"] = round(prune["elapsed"], 2)
+            point["completion_ms"] = measure_completion_ms(page)
+        scale_results["history"].append(point)
+    finally:
+        context.close()
+
+
+@pytest.mark.parametrize("size", PROFILE_SIZES)
+def test_profile_scale(browser, base_url, scale_results, size):
+    """Boot, load and ProfileSelector render cost against profile count."""
+    data = build_scaled_storage(profiles=size, active=False)
+    ready = f"document.querySelectorAll('{SEL['profile_card']}').length >= {size + 1}"
+    context, page, point = boot_with_storage(browser, base_url, data, ready)
+    try:
+        point["size"] = size
+        point["selector_render_ms"] = point.pop("boot_ms")
+        if point["seed_error"] is None:
+            point["load_ms"] = round(page.evaluate(LOAD_SCRIPT), 2)
+        scale_results["profiles"].append(point)
+    finally:
+        context.close()
+
+    data = build_scaled_storage(profiles=size)
+    context, page, boot = boot_with_storage(
+        browser, base_url, data, APP_READY
+    )
+    try:
+        point["boot_ms"] = boot["boot_ms"]
+    finally:
+        context.close()
+
+
+@pytest.mark.parametrize("size", VIDEO_SIZES)
+def test_video_scale(browser, base_url, scale_results, size):
+    """Boot and load cost against savedYoutubeVideos length."""
+    data = build_scaled_storage(videos=size)
+    context, page, point = boot_with_storage(
+        browser, base_url, data, APP_READY
+    )
+    try:
+        point["size"] = size
+        if point["seed_error"] is None:
+            point["load_ms"] = round(page.evaluate(LOAD_SCRIPT), 2)
+        scale_results["videos"].append(point)
+    finally:
+        context.close()
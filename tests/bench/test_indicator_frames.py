@@ -0,0 +1,111 @@
+"""Progress Indicator Benchmarks - main-thread cost per indicator and theme."""
+import json
+import time
+
+import pytest
+from config import SEL
+from utils.bench import (
+    boot_with_storage,
+    cdp_session,
+    set_cpu_throttling,
+    start_custom_session,
+    write_bench_results,
+)
+from utils.perf_trace import read_metrics
+from utils.storage_helpers import build_profile, build_storage_data
+
+pytestmark = pytest.mark.bench
+
+INDICATORS = ["circular", "animal-path", "hourglass", "progress-bar"]
+THEMES = ["divertido", "minimalista", "floresta", "espaco", "oceano", "doces"]
+CPU_RATE = 4
+SAMPLE_SECONDS = 15
+
+# requestAnimationFrame intervals and long tasks while the timer runs
+FRAME_PROBE_SCRIPT = """
+() => {
+    const stats = window.__frameStats = { frames: [], longTasks: [], stopped: false }
+    let last = performance.now()
+    const loop = (t) => {
+        stats.frames.push(t - last)
+        last = t
+        if (!stats.stopped) requestAnimationFrame(loop)
+    }
+    requestAnimationFrame(loop)
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) stats.longTasks.push(entry.duration)
+    }).observe({ type: 'longtask' })
+}
+"""
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0
+
+
+@pytest.fixture(scope="module")
+def frame_results():
+    """Collect every indicator x theme run, then write them ranked by cost."""
+    results = []
+    yield results
+    results.sort(key=lambda r: r["main_thread_ms_per_s"])
+    for rank, result in enumerate(results, 1):
+        result["rank"] = rank
+    write_bench_results("indicator-frames", {"cpu_rate": CPU_RATE, "ranking": results})
+
+
+@pytest.mark.parametrize("theme", THEMES)
+@pytest.mark.parametrize("indicator", INDICATORS)
+def test_indicator_frames(browser, base_url, frame_results, indicator, theme):
+    """Run an indicator under a throttled CPU and record frame and paint cost."""
+    profile = build_profile(theme=theme, progress_indicator=indicator, unlocked_themes=THEMES)
+    # No active profile: picking it on the selector applies its theme, which
+    # a boot straight into the timer would not
+    data = build_storage_data([profile], None)
+    context, page, _ = boot_with_storage(
+        browser, base_url, data, f"document.querySelector('{SEL['profile_card']}')"
+    )
+    try:
+        page.click(f"{SEL['profile_card']}:not(.add-new)")
+        page.wait_for_selector(SEL["timer_display"])
+        page.wait_for_function(
+            "(theme) => document.documentElement.dataset.theme === theme", arg=theme
+        )
+        assert page.get_attribute("html", "data-theme") == theme
+
+        set_cpu_throttling(page, CPU_RATE)
+        session = cdp_session(page)
+        session.send("Performance.enable")
+
+        start_custom_session(page, 1)
+        page.evaluate(FRAME_PROBE_SCRIPT)
+        before = read_metrics(session)
+        browser.start_tracing(page, categories=["devtools.timeline"])
+
+        time.sleep(SAMPLE_SECONDS)
+
+        trace = json.loads(browser.stop_tracing())
+        after = read_metrics(session)
+        stats = page.evaluate("window.__frameStats.stopped = true, window.__frameStats")
+
+        events = trace["traceEvents"]
+        frames = stats["frames"][1:]
+        task_ms = (after["TaskDuration"] - before["TaskDuration"]) * 1000
+        frame_results.append({
+            "indicator": indicator,
+            "theme": theme,
+            "main_thread_ms_per_s": round(task_ms / SAMPLE_SECONDS, 2),
+            "script_ms": round((after["ScriptDuration"] - before["ScriptDuration"]) * 1000, 1),
+            "layout_count": int(after["LayoutCount"] - before["LayoutCount"]),
+            "recalc_style_count": int(after["RecalcStyleCount"] - before["RecalcStyleCount"]),
+            "paint_count": sum(1 for e in events if e.get("name") == "Paint"),
+            "frames": len(frames),
+            "fps": round(len(frames) / SAMPLE_SECONDS, 1),
+            "frame_p95_ms": round(percentile(frames, 0.95), 1),
+            "dropped_frames": sum(1 for f in frames if f > 1000 / 60 * 1.5),
+            "long_tasks": len(stats["longTasks"]),
+            "long_task_ms": round(sum(stats["longTasks"]), 1),
+        })
+    finally:
+        context.close()
@@ -0,0 +1,115 @@
+"""Progress Animation Benchmarks - stepped re-renders vs browser-driven animation."""
+import time
+
+import pytest
+from config import SEL
+from utils.bench import (
+    boot_with_storage,
+    cdp_session,
+    set_cpu_throttling,
+    start_custom_session,
+    write_bench_results,
+)
+from utils.perf_trace import read_metrics
+from utils.storage_helpers import build_profile, build_storage_data
+
+pytestmark = pytest.mark.bench
+
+INDICATORS = ["circular", "animal-path", "hourglass", "progress-bar"]
+MODES = {"stepped": False, "smooth": True}
+CPU_RATES = [1, 4]
+SAMPLE_SECONDS = 10
+MOTION_SECONDS = 3
+
+# Element and reading that shows each indicator's motion: a computed style
+# property, or "width"/"height" from the element's box (transforms included)
+MOTION_PROBES = {
+    "circular": (".progress-ring", "strokeDashoffset"),
+    "animal-path": (".progress-path", "strokeDashoffset"),
+    "hourglass": (".sand", "height"),
+    "progress-bar": (".progress-fill", "width"),
+}
+
+# Reads the probe once per animation frame and records whether it moved
+MOTION_PROBE_SCRIPT = """
+([selector, property, seconds]) => new Promise((resolve) => {
+    const el = document.querySelector(selector)
+    const read = () => property in DOMRect.prototype
+        ? el.getBoundingClientRect()[property]
+        : getComputedStyle(el)[property]
+    const frames = []
+    let last = read()
+    let lastT = performance.now()
+    const end = lastT + seconds * 1000
+    const loop = (t) => {
+        const value = read()
+        frames.push({ interval: t - lastT, moved: value !== last })
+        last = value
+        lastT = t
+        if (t < end) requestAnimationFrame(loop)
+        else resolve(frames)
+    }
+    requestAnimationFrame(loop)
+})
+"""
+
+
+@pytest.fixture(scope="module")
+def animation_results():
+    """Collect every run, then write them with the smooth/stepped comparison."""
+    results = {}
+    yield results
+    comparison = {}
+    for key, smooth in results.items():
+        if not key.endswith("/smooth"):
+            continue
+        stepped = results.get(key.replace("/smooth", "/stepped"))
+        if stepped:
+            comparison[key.replace("/smooth", "")] = {
+                "main_thread_saved_ms_per_s": round(
+                    stepped["main_thread_ms_per_s"] - smooth["main_thread_ms_per_s"], 2
+                ),
+                "moving_frames": [stepped["moving_frame_ratio"], smooth["moving_frame_ratio"]],
+            }
+    write_bench_results("progress-animation", {"runs": results, "comparison": comparison})
+
+
+@pytest.mark.parametrize("cpu_rate", CPU_RATES)
+@pytest.mark.parametrize("mode", list(MODES))
+@pytest.mark.parametrize("indicator", INDICATORS)
+def test_progress_animation(browser, base_url, animation_results, indicator, mode, cpu_rate):
+    """Run a one-minute phase and record main-thread cost and motion per frame."""
+    profile = build_profile(progress_indicator=indicator)
+    data = build_storage_data([profile], profile["id"])
+    data["globalSettings"]["smoothProgress"] = MODES[mode]
+    context, page, _ = boot_with_storage(
+        browser, base_url, data, f"document.querySelector('{SEL['timer_display']}')"
+    )
+    try:
+        set_cpu_throttling(page, cpu_rate)
+        session = cdp_session(page)
+        session.send("Performance.enable")
+        start_custom_session(page, 1)
+
+        before = read_metrics(session)
+        time.sleep(SAMPLE_SECONDS)
+        after = read_metrics(session)
+
+        # Probed separately: reading styles every frame costs main-thread time
+        selector, prop = MOTION_PROBES[indicator]
+        frames = page.evaluate(MOTION_PROBE_SCRIPT, [selector, prop, MOTION_SECONDS])[1:]
+
+        moving = sum(1 for f in frames if f["moved"])
+        animation_results[f"{indicator}/cpu{cpu_rate}x/{mode}"] = {
+            "main_thread_ms_per_s": round(
+                (after["TaskDuration"] - before["TaskDuration"]) * 1000 / SAMPLE_SECONDS, 2
+            ),
+            "script_ms": round((after["ScriptDuration"] - before["ScriptDuration"]) * 1000, 1),
+            "layout_count": int(after["LayoutCount"] - before["LayoutCount"]),
+            "recalc_style_count": int(after["RecalcStyleCount"] - before["RecalcStyleCount"]),
+            "frames": len(frames),
+            "moving_frame_ratio": round(moving / len(frames), 3) if frames else 0,
+            "dropped_frames": sum(1 for f in frames if f["interval"] > 1000 / 60 * 1.5),
+        }
+    finally:
+        context.close()
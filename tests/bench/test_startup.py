@@ -0,0 +1,133 @@
+"""Startup Benchmarks - cold, warm-cache and service-worker visits on a low-end device."""
+import json
+
+import pytest
+from config import SEL, STARTUP_BUDGETS_MS
+from utils.app_ready import wait_for_app_ready
+from utils.bench import cdp_session, write_bench_results
+from utils.storage_snapshots import serialize_snapshots, snapshot_init_script
+
+pytestmark = pytest.mark.bench
+
+CPU_RATE = 4
+# Chrome DevTools "Slow 3G" preset
+SLOW_3G = {
+    "offline": False,
+    "latency": 2000,
+    "downloadThroughput": 500 * 1024 / 8 * 0.8,
+    "uploadThroughput": 500 * 1024 / 8 * 0.8,
+}
+# Time allowed after app-ready for trailing long tasks to show up
+SETTLE_MS = 3000
+
+# Records long tasks and when the first profile card or timer appears
+STARTUP_PROBE_SCRIPT = f"""
+(() => {{
+    if (window !== window.top) return
+    const startup = window.__startup = {{ longTasks: [], firstContent: null }}
+    new PerformanceObserver((list) => {{
+        for (const e of list.getEntries()) {{
+            startup.longTasks.push({{ start: e.startTime, end: e.startTime + e.duration }})
+        }}
+    }}).observe({{ type: 'longtask', buffered: true }})
+    const check = () => {{
+        if (startup.firstContent === null &&
+            document.querySelector("{SEL['profile_card']}, {SEL['timer_display']}")) {{
+            startup.firstContent = performance.now()
+        }}
+    }}
+    new MutationObserver(check).observe(document, {{ childList: true, subtree: true }})
+}})()
+"""
+
+RESULTS_SCRIPT = """
+() => {
+    const paint = (name) => performance.getEntriesByName(name)[0]?.startTime ?? null
+    const ready = performance.getEntriesByName('app-ready')[0]?.startTime ?? null
+    const lastTask = Math.max(0, ...window.__startup.longTasks.map(t => t.end))
+    return {
+        first_paint: paint('first-paint'),
+        first_contentful_paint: paint('first-contentful-paint'),
+        first_content: window.__startup.firstContent,
+        app_ready: ready,
+        // Simplified TTI: app ready and no long task after it
+        interactive: ready === null ? null : Math.max(ready, lastTask),
+        long_tasks: window.__startup.longTasks.length,
+        sw_controlled: !!navigator.serviceWorker?.controller,
+    }
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def startup_budgets(request):
+    budgets = {name: dict(values) for name, values in STARTUP_BUDGETS_MS.items()}
+    path = request.config.getoption("--startup-budgets")
+    if path:
+        with open(path) as f:
+            for name, values in json.load(f).items():
+                budgets.setdefault(name, {}).update(values)
+    return budgets
+
+
+@pytest.fixture(scope="module")
+def startup_results():
+    results = {}
+    yield results
+    write_bench_results("startup", results)
+
+
+def emulate_low_end(page):
+    session = cdp_session(page)
+    session.send("Network.enable")
+    session.send("Network.emulateNetworkConditions", SLOW_3G)
+    session.send("Emulation.setCPUThrottlingRate", {"rate": CPU_RATE})
+    return session
+
+
+def measure_visit(page, navigate):
+    navigate()
+    wait_for_app_ready(page, timeout=120000)
+    page.wait_for_timeout(SETTLE_MS)
+    return page.evaluate(RESULTS_SCRIPT)
+
+
+@pytest.mark.parametrize("scenario", ["cold", "warm_cache", "service_worker"])
+def test_startup(browser, base_url, startup_budgets, startup_results, scenario):
+    """Startup timings for one kind of visit, checked against its budgets."""
+    snapshot = serialize_snapshots()["one_profile"]
+    context = browser.new_context(
+        service_workers="allow" if scenario == "service_worker" else "block"
+    )
+    try:
+        page = context.new_page()
+        page.add_init_script(snapshot_init_script(snapshot))
+        page.add_init_script(STARTUP_PROBE_SCRIPT)
+
+        if scenario != "cold":
+            # First visit fills the HTTP cache and registers the service worker
+            page.goto(base_url)
+            wait_for_app_ready(page)
+            if scenario == "service_worker":
+                page.evaluate("navigator.serviceWorker.ready")
+                page.reload()
+                page.wait_for_function("!!navigator.serviceWorker.controller")
+
+        emulate_low_end(page)
+        if scenario == "cold":
+            result = measure_visit(page, lambda: page.goto(base_url))
+        else:
+            result = measure_visit(page, page.reload)
+    finally:
+        context.close()
+
+    startup_results[scenario] = result
+    if scenario == "service_worker":
+        assert result["sw_controlled"], "repeat visit was not served by the service worker"
+
+    over = {
+        metric: result[metric]
+        for metric, budget in startup_budgets[scenario].items()
+        if result[metric] is None or result[metric] > budget
+    }
+    assert not over, f"{scenario} startup over budget {startup_budgets[scenario]}: {over}"
@@ -0,0 +1,108 @@
+"""Theme Switch Benchmarks - switch latency and style recalc cost per theme."""
+import pytest
+from config import SEL, THEME_SWITCH_BUDGET_MS
+from utils.bench import boot_with_storage, cdp_session, set_cpu_throttling, write_bench_results
+from utils.perf_trace import read_metrics
+from utils.storage_helpers import build_profile, build_storage_data
+
+pytestmark = pytest.mark.bench
+
+THEMES = ["divertido", "minimalista", "floresta", "espaco", "oceano", "doces"]
+CPU_RATE = 4
+
+# Stops the idle prefetch so every switch has to download its stylesheet
+NO_IDLE_PREFETCH = "window.requestIdleCallback = () => 0"
+
+# Click a theme button and time until data-theme changes and a frame is drawn.
+# Each data-theme value seen is recorded with whether its stylesheet was
+# already in document.styleSheets when the attribute flipped; a flip ahead of
+# the stylesheet is a flash of unstyled content.
+SWITCH_SCRIPT = """
+async (theme) => {
+    const root = document.documentElement
+    const hasRules = (name) => [...document.styleSheets].some((sheet) => {
+        try {
+            return [...sheet.cssRules].some((rule) => rule.selectorText === `[data-theme="${name}"]`)
+        } catch {
+            return false
+        }
+    })
+    const seen = []
+    const start = performance.now()
+    const applied = new Promise((resolve) => {
+        new MutationObserver((_, observer) => {
+            const value = root.getAttribute('data-theme')
+            seen.push({ theme: value, styled: hasRules(value) })
+            if (value === theme) {
+                observer.disconnect()
+                resolve(performance.now())
+            }
+        }).observe(root, { attributes: true, attributeFilter: ['data-theme'] })
+    })
+    const buttons = [...document.querySelectorAll('.theme-btn')]
+    buttons[%(themes)s.indexOf(theme)].click()
+    const appliedAt = await applied
+    await new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve)))
+    return { applied_ms: appliedAt - start, frame_ms: performance.now() - start, seen }
+}
+""" % {"themes": THEMES}
+
+THEME_CSS_LOADED = """
+(themes) => themes.every((theme) => performance.getEntriesByType('resource')
+    .some((e) => new RegExp(`/${theme}[-.][^/]*css`).test(e.name)))
+"""
+
+
+@pytest.fixture(scope="module")
+def switch_results():
+    results = {}
+    yield results
+    write_bench_results("theme-switch", {"cpu_rate": CPU_RATE, **results})
+
+
+@pytest.mark.parametrize("mode", ["cold", "prefetched"])
+def test_theme_switch(browser, base_url, switch_results, mode):
+    """Switch through every theme and record latency and style recalc cost."""
+    profile = build_profile(theme="divertido", unlocked_themes=THEMES)
+    data = build_storage_data([profile], profile["id"])
+    context, page, _ = boot_with_storage(
+        browser, base_url, data, f"document.querySelector('{SEL['timer_display']}')",
+        init_scripts=[NO_IDLE_PREFETCH] if mode == "cold" else [],
+    )
+    try:
+        if mode == "prefetched":
+            page.wait_for_function(THEME_CSS_LOADED, arg=THEMES, timeout=30000)
+        page.click(SEL["settings_btn"])
+        page.wait_for_selector(SEL["settings_panel"])
+
+        set_cpu_throttling(page, CPU_RATE)
+        session = cdp_session(page)
+        session.send("Performance.enable")
+
+        runs = []
+        # Start away from the default theme so divertido is switched to as well
+        for theme in THEMES[1:] + THEMES[:1]:
+            before = read_metrics(session)
+            result = page.evaluate(SWITCH_SCRIPT, theme)
+            after = read_metrics(session)
+            runs.append({
+                "theme": theme,
+                "applied_ms": round(result["applied_ms"], 1),
+                "frame_ms": round(result["frame_ms"], 1),
+                "recalc_style_count": int(after["RecalcStyleCount"] - before["RecalcStyleCount"]),
+                "recalc_style_ms": round(
+                    (after["RecalcStyleDuration"] - before["RecalcStyleDuration"]) * 1000, 2
+                ),
+                "unstyled": any(
+                    value["theme"] != theme or not value["styled"] for value in result["seen"]
+                ),
+            })
+    finally:
+        context.close()
+
+    switch_results[mode] = runs
+    assert not any(run["unstyled"] for run in runs), (
+        "data-theme changed before its stylesheet applied, or passed through another value"
+    )
+    slow = [run for run in runs if run["frame_ms"] > THEME_SWITCH_BUDGET_MS[mode]]
+    assert not slow, f"{mode} theme switch over {THEME_SWITCH_BUDGET_MS[mode]}ms: {slow}"
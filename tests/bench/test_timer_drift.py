@@ -0,0 +1,133 @@
+"""Timer Drift Benchmarks - how far the displayed time strays from the wall clock."""
+import time
+
+import pytest
+from config import TIMER_MAX_COMPLETION_LATENESS_MS
+from utils.bench import (
+    block_main_thread,
+    hide_page,
+    parse_display_time,
+    set_cpu_throttling,
+    start_custom_session,
+    write_bench_results,
+)
+
+pytestmark = pytest.mark.bench
+
+CPU_RATES = [1, 4, 6]
+CONDITIONS = ["visible", "hidden", "long-tasks"]
+
+# Records every change of the displayed time and every timer event,
+# stamped with the page's wall clock.
+RECORDER_SCRIPT = """
+() => {
+    const log = window.__timerLog = { ticks: [], events: [] }
+    const el = document.querySelector('.timer-time')
+    new MutationObserver(() => {
+        log.ticks.push({ text: el.textContent.trim(), t: Date.now() })
+    }).observe(el, { childList: true, characterData: true, subtree: true })
+    window.addEventListener('timer-event', (e) => {
+        log.events.push({ type: e.detail.type, t: Date.now(), lateMs: e.detail.lateMs })
+    })
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def drift_results():
+    """Collect results for every run and write them once at the end."""
+    results = {}
+    yield results
+    write_bench_results("timer-drift", results)
+
+
+def find_event(log, event_type):
+    return next((e for e in log["events"] if e["type"] == event_type), None)
+
+
+def summarize(log, samples, total, rendered=True):
+    """Reduce the raw recordings to drift, skipped seconds and lateness.
+
+    A hidden page doesn't render the countdown, so drift and skipped seconds
+    are only reported when ``rendered`` is true.
+    """
+    start = find_event(log, "work-start")
+    assert start is not None, f"work-start was never logged; events: {log['events']}"
+    complete = find_event(log, "work-complete")
+
+    drifts = []
+    for sample in samples:
+        expected = total - (sample["t"] - start["t"]) / 1000
+        if expected < 0:
+            break
+        drifts.append(sample["remaining"] - expected)
+
+    end_t = complete["t"] if complete else float("inf")
+    shown = {
+        parse_display_time(tick["text"])
+        for tick in log["ticks"]
+        if tick["t"] <= end_t and ":" in tick["text"]
+    }
+    skipped = [s for s in range(1, total) if s not in shown]
+
+    return {
+        "total_seconds": total,
+        "samples": len(drifts) if rendered else 0,
+        "max_drift_s": round(max((abs(d) for d in drifts), default=0), 3) if rendered else None,
+        "mean_drift_s": round(sum(drifts) / len(drifts), 3) if rendered and drifts else None,
+        "skipped_seconds": len(skipped) if rendered else None,
+        "completed": complete is not None,
+        "completion_lateness_ms": (
+            complete["t"] - (start["t"] + total * 1000) if complete else None
+        ),
+        # As measured by the app against its own deadline
+        "reported_lateness_ms": complete.get("lateMs") if complete else None,
+    }
+
+
+@pytest.mark.storage_snapshot("one_profile")
+@pytest.mark.parametrize("condition", CONDITIONS)
+@pytest.mark.parametrize("cpu_rate", CPU_RATES)
+def test_timer_drift(page, base_url, bench_work_minutes, drift_results, cpu_rate, condition):
+    """Run a work session and sample the displayed time against the wall clock."""
+    total = bench_work_minutes * 60
+    set_cpu_throttling(page, cpu_rate)
+    page.wait_for_selector(".timer-time")
+    page.evaluate(RECORDER_SCRIPT)
+
+    start_custom_session(page, bench_work_minutes)
+
+    cover = None
+    if condition == "hidden":
+        cover = hide_page(page)
+        assert page.evaluate("document.visibilityState") == "hidden", (
+            "Could not hide the page; the hidden condition would measure a foreground tab"
+        )
+    elif condition == "long-tasks":
+        block_main_thread(page, block_ms=400, every_ms=1500)
+
+    # Sample once per wall-clock second until the work phase completes
+    samples = []
+    deadline = time.monotonic() + total + 120
+    while time.monotonic() < deadline:
+        sample = page.evaluate("""() => ({
+            text: document.querySelector('.timer-time').textContent.trim(),
+            t: Date.now(),
+            done: window.__timerLog.events.some(e => e.type === 'work-complete'),
+        })""")
+        if sample["done"]:
+            break
+        samples.append({"remaining": parse_display_time(sample["text"]), "t": sample["t"]})
+        time.sleep(1)
+
+    if cover:
+        cover.close()
+
+    log = page.evaluate("window.__timerLog")
+    result = summarize(log, samples, total, rendered=condition != "hidden")
+    drift_results[f"cpu{cpu_rate}x/{condition}"] = result
+
+    assert result["completed"], f"Work session never completed: {result}"
+    assert result["completion_lateness_ms"] <= TIMER_MAX_COMPLETION_LATENESS_MS, (
+        f"Work session completed late: {result}"
+    )
@@ -101,6 +101,50 @@ DEFAULT_TIMEOUT = 5000
 ANIMATION_TIMEOUT = 1000
 TIMER_TICK_TIMEOUT = 2000
 
+# How late a phase may end past its deadline, visible or hidden (timer-drift bench)
+TIMER_MAX_COMPLETION_LATENESS_MS = 1000
+
+# localStorage writes allowed per user action (see storage_profiler fixture)
+STORAGE_WRITE_BUDGETS = {
+    "start": 1,
+    "pause": 1,
+    "resume": 1,
+    "complete": 2,
+    "purchase": 2,
+    "theme_change": 1,
+}
+
+# Allowed growth per repeated cycle before it counts as a leak
+LEAK_MAX_BYTES_PER_CYCLE = 16 * 1024
+LEAK_MAX_LISTENERS_PER_CYCLE = 0.5
+LEAK_MAX_NODES_PER_CYCLE = 1
+
+# Startup budgets in ms under slow 3G + 4x CPU (tests/bench/test_startup.py)
+STARTUP_BUDGETS_MS = {
+    "cold": {"first_paint": 8000, "first_content": 10000, "interactive": 12000},
+    "warm_cache": {"first_paint": 4000, "first_content": 5000, "interactive": 6000},
+    "service_worker": {"first_paint": 2500, "first_content": 3500, "interactive": 4500},
+}
+
+# Production build budgets, in bytes (see utils/bundle_report.py)
+BUNDLE_BUDGETS = {
+    "js_gzip_total": 150 * 1024,
+    "largest_js_gzip": 120 * 1024,
+    "css_gzip_total": 25 * 1024,
+    "images_raw_total": 150 * 1024,
+    # Entry chunks plus their static imports, without lazy panels
+    "initial_gzip": 110 * 1024,
+}
+
+# Click-to-visible time for modals, after a hover prefetch and without one
+MODAL_OPEN_BUDGET_MS = {"prefetched": 300, "cold": 1000}
+
+# Click-to-painted time for a theme switch, with and without the idle prefetch
+THEME_SWITCH_BUDGET_MS = {"cold": 800, "prefetched": 150}
+
+# Component updates allowed per timer tick: the clock text and the indicator
+RENDER_UPDATES_PER_TICK = 2
+
 # Test data
 DEFAULT_PROFILE_NAME = "Teste"
 DEFAULT_AVATAR = "rabbit"
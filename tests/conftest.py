@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -7,25 +8,73 @@ sys.path.insert(0, str(Path(__file__).parent))
 import pytest
 from playwright.sync_api import sync_playwright
 
-from utils.port_detector import get_base_url
-from utils.storage_helpers import clear_storage
+from config import DESKTOP, MOBILE, TABLET
+from utils.context_pool import ContextPool
+from utils.fast_clock import FastClock
+from utils.network_stubs import MediaServer, NetworkKnobs, NetworkStubs
+from utils.perf_trace import PerfTracePlugin
+from utils.port_detector import get_base_url, get_worker_host, get_worker_id
+from utils.render_stats import RenderStats
+from utils.static_server import BASE_PATH, StaticServer, ensure_build
+from utils.storage_profiler import StorageProfiler
+from utils.storage_snapshots import boot_app, serialize_snapshots
+
+
+@pytest.fixture(scope="session")
+def worker_id():
+    """Get the pytest-xdist worker id, or 'master' when running serially."""
+    return get_worker_id()
 
 
 @pytest.fixture(scope="session")
 def browser():
-    """Create a browser instance for the test session."""
+    """Create a browser instance for the test session.
+
+    Under pytest-xdist every worker is its own process with its own session,
+    so each worker launches and owns a separate browser.
+    """
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         yield browser
         browser.close()
 
 
+@pytest.fixture(scope="session")
+def context_pool(request, browser, base_url):
+    """Warm contexts reused across tests when --context-pool=N is given."""
+    size = request.config.getoption("--context-pool")
+    if not size:
+        yield None
+        return
+    pool = ContextPool(browser, size, base_url)
+    yield pool
+    pool.close()
+
+
+def _acquire_context(request, context_pool, browser, viewport=None, label="context"):
+    if context_pool is None:
+        options = {"viewport": viewport} if viewport else {}
+        context, recycled = browser.new_context(**options), False
+    else:
+        context, recycled = context_pool.acquire(viewport)
+    request.node.user_properties.append((f"{label}_recycled", recycled))
+    return context
+
+
+def _release_context(context_pool, context, viewport=None, reusable=True):
+    if context_pool is None:
+        context.close()
+    else:
+        context_pool.release(context, viewport, reusable)
+
+
 @pytest.fixture
-def context(browser):
-    """Create a new browser context for each test."""
-    context = browser.new_context()
+def context(request, browser, context_pool):
+    """Create a browser context for each test, or recycle a pooled one."""
+    context = _acquire_context(request, context_pool, browser)
     yield context
-    context.close()
+    # A fake clock cannot be uninstalled, so that context is not reused
+    _release_context(context_pool, context, reusable="fast_clock" not in request.fixturenames)
 
 
 @pytest.fixture
@@ -37,58 +86,281 @@ def page(context):
 
 
 @pytest.fixture(scope="session")
-def base_url():
-    """Get the base URL for the dev server."""
-    return get_base_url()
+def app_server(request):
+    """Serve the production build from an in-process server.
+
+    dist/ is rebuilt only when the sources change. With --server=dev the
+    fixture yields None and tests use an already running `npm run dev`
+    (useful for HMR debugging).
+    """
+    if request.config.getoption("--server") == "dev":
+        yield None
+        return
+    server = StaticServer(ensure_build()).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(app_server, worker_id):
+    """Get the base URL for the app under test, on a per-worker origin."""
+    if app_server is None:
+        return get_base_url(worker_id)
+    return f"http://{get_worker_host(worker_id)}:{app_server.port}{BASE_PATH}"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--server",
+        choices=["static", "dev"],
+        default=os.environ.get("KIDS_TIMER_SERVER", "static"),
+        help="static: serve a cached production build (default); "
+             "dev: use a running Vite dev server",
+    )
+    parser.addoption(
+        "--context-pool",
+        type=int,
+        default=0,
+        metavar="N",
+        help="keep N warm browser contexts per viewport and reset them between "
+             "tests instead of recreating them (0 = off)",
+    )
+    parser.addoption(
+        "--bench",
+        action="store_true",
+        default=False,
+        help="run the benchmark suites in tests/bench",
+    )
+    parser.addoption(
+        "--bench-work-minutes",
+        type=int,
+        default=1,
+        help="work session length for timer benchmarks (25 = a real session)",
+    )
+    parser.addoption(
+        "--startup-budgets",
+        default=None,
+        help="JSON file overriding STARTUP_BUDGETS_MS for the startup benchmark",
+    )
+    parser.addoption(
+        "--perf-trace",
+        action="store_true",
+        default=False,
+        help="record CDP performance metrics per test and compare to a baseline",
+    )
+    parser.addoption(
+        "--perf-baseline",
+        default=str(Path(__file__).parent / "perf_baseline.json"),
+        help="baseline file for --perf-trace",
+    )
+    parser.addoption(
+        "--perf-tolerance",
+        type=float,
+        default=0.25,
+        help="relative increase over the baseline reported as a regression",
+    )
+    parser.addoption(
+        "--perf-update-baseline",
+        action="store_true",
+        default=False,
+        help="write this run's --perf-trace results into the baseline file",
+    )
+    parser.addoption(
+        "--perf-fail",
+        action="store_true",
+        default=False,
+        help="fail the session when --perf-trace finds a regression",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "storage_snapshot(name): boot the app with a named storage snapshot "
+        "(fresh, one_profile, rich_profile, multi_profile)",
+    )
+    config.addinivalue_line("markers", "bench: benchmark, only runs with --bench")
+    config.addinivalue_line("markers", "no_app: test does not need a browser or the running app")
+    if config.getoption("--perf-trace"):
+        config.pluginmanager.register(PerfTracePlugin(config), "perf_trace")
+
+
+def _call_properties(terminalreporter):
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) == "call":
+                yield from getattr(report, "user_properties", [])
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report boot-to-ready latency and context reuse across the run."""
+    properties = list(_call_properties(terminalreporter))
+    times = sorted(value for name, value in properties if name == "boot_to_ready_ms")
+    recycled = [value for name, value in properties if name.endswith("context_recycled")]
+    if not times:
+        return
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    terminalreporter.section("app boot")
+    terminalreporter.write_line(
+        f"boot-to-ready over {len(times)} boots: "
+        f"median {times[len(times) // 2]:.0f} ms, p95 {p95:.0f} ms, max {times[-1]:.0f} ms"
+    )
+    if any(recycled):
+        terminalreporter.write_line(f"{sum(recycled)} of {len(recycled)} contexts recycled")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench"):
+        return
+    skip_bench = pytest.mark.skip(reason="benchmark, run with --bench")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip_bench)
+
+
+def get_snapshot_name(request):
+    """Get the storage snapshot requested by the test, defaulting to 'fresh'."""
+    marker = request.node.get_closest_marker("storage_snapshot")
+    return marker.args[0] if marker else "fresh"
+
+
+@pytest.fixture(scope="session")
+def storage_snapshots():
+    """Named storage states, serialized once per session."""
+    return serialize_snapshots()
+
+
+# Fixtures that hook the page and must be set up before the app boots
+PRE_BOOT_FIXTURES = ["fast_clock", "storage_profiler", "render_stats"]
+
+
+@pytest.fixture(scope="session")
+def media_server():
+    """Local stand-in for archive.org serving a short silent track."""
+    server = MediaServer(NetworkKnobs()).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def network_stubs(media_server):
+    """Hermetic stubs for archive.org audio and the YouTube iframe API.
+
+    Installed on every test context by default. Adjust
+    network_stubs.knobs (latency_ms, bandwidth_kbps, yt_ready_ms) before
+    triggering playback to simulate slow networks.
+    """
+    knobs = media_server.httpd.knobs
+    knobs.reset()
+    yield NetworkStubs(media_server, knobs)
+    knobs.reset()
 
 
 @pytest.fixture(autouse=True)
-def setup_test(page, base_url):
-    """Setup that runs before each test - clears storage and navigates to app."""
-    page.goto(base_url)
-    clear_storage(page)
-    page.reload()
-    page.wait_for_load_state("networkidle")
+def setup_test(request):
+    """Setup that runs before each test - seeds storage and navigates to app.
+
+    Tests marked no_app (e.g. build checks) get no browser at all.
+    """
+    if request.node.get_closest_marker("no_app"):
+        yield
+        return
+    page = request.getfixturevalue("page")
+    base_url = request.getfixturevalue("base_url")
+    storage_snapshots = request.getfixturevalue("storage_snapshots")
+    request.getfixturevalue("network_stubs").install(page.context)
+    for name in PRE_BOOT_FIXTURES:
+        if name in request.fixturenames:
+            request.getfixturevalue(name)
+    ready_ms = boot_app(page, base_url, storage_snapshots[get_snapshot_name(request)])
+    request.node.user_properties.append(("boot_to_ready_ms", ready_ms))
     yield
 
 
 @pytest.fixture
-def mobile_page(browser, base_url):
-    """Create a mobile viewport page."""
-    context = browser.new_context(viewport={"width": 375, "height": 667})
+def fast_clock(page):
+    """Install a virtual clock so timer sessions complete without real waiting.
+
+    setup_test installs it before the app boots; call advance() or
+    run_until() to move virtual time forward.
+    """
+    clock = FastClock(page)
+    clock.install()
+    yield clock
+
+
+@pytest.fixture
+def storage_profiler(page):
+    """Count localStorage reads, writes and parse cost per user action.
+
+    setup_test installs it before the app boots; wrap an action in
+    `with storage_profiler.measure("start") as stats:` and assert on stats.
+    """
+    profiler = StorageProfiler(page)
+    profiler.install()
+    yield profiler
+
+
+@pytest.fixture
+def render_stats(page):
+    """Count component updates per component name.
+
+    setup_test installs it before the app boots; call reset(), act, then
+    read updates().
+    """
+    stats = RenderStats(page)
+    stats.install()
+    yield stats
+
+
+def _viewport_page(request, context_pool, browser, base_url, storage_snapshots, viewport, label):
+    context = _acquire_context(request, context_pool, browser, viewport, label)
+    request.getfixturevalue("network_stubs").install(context)
     page = context.new_page()
-    page.goto(base_url)
-    clear_storage(page)
-    page.reload()
-    page.wait_for_load_state("networkidle")
+    ready_ms = boot_app(page, base_url, storage_snapshots[get_snapshot_name(request)])
+    request.node.user_properties.append(("boot_to_ready_ms", ready_ms))
+    return context, page
+
+
+@pytest.fixture
+def mobile_page(request, context_pool, browser, base_url, storage_snapshots):
+    """Create a mobile viewport page."""
+    context, page = _viewport_page(
+        request, context_pool, browser, base_url, storage_snapshots, MOBILE, "mobile_context"
+    )
     yield page
     page.close()
-    context.close()
+    _release_context(context_pool, context, MOBILE)
 
 
 @pytest.fixture
-def tablet_page(browser, base_url):
+def tablet_page(request, context_pool, browser, base_url, storage_snapshots):
     """Create a tablet viewport page."""
-    context = browser.new_context(viewport={"width": 768, "height": 1024})
-    page = context.new_page()
-    page.goto(base_url)
-    clear_storage(page)
-    page.reload()
-    page.wait_for_load_state("networkidle")
+    context, page = _viewport_page(
+        request, context_pool, browser, base_url, storage_snapshots, TABLET, "tablet_context"
+    )
     yield page
     page.close()
-    context.close()
+    _release_context(context_pool, context, TABLET)
 
 
 @pytest.fixture
-def desktop_page(browser, base_url):
+def desktop_page(request, context_pool, browser, base_url, storage_snapshots):
     """Create a desktop viewport page."""
-    context = browser.new_context(viewport={"width": 1024, "height": 768})
-    page = context.new_page()
-    page.goto(base_url)
-    clear_storage(page)
-    page.reload()
-    page.wait_for_load_state("networkidle")
+    context, page = _viewport_page(
+        request, context_pool, browser, base_url, storage_snapshots, DESKTOP, "desktop_context"
+    )
+    yield page
+    page.close()
+    _release_context(context_pool, context, DESKTOP)
+
+
+@pytest.fixture
+def viewport_page(request, context_pool, browser, base_url, storage_snapshots, viewport):
+    """Create a page at the viewport given by the test's `viewport` parameter."""
+    context, page = _viewport_page(
+        request, context_pool, browser, base_url, storage_snapshots, viewport, "viewport_context"
+    )
     yield page
     page.close()
-    context.close()
+    _release_context(context_pool, context, viewport)
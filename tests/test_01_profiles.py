@@ -4,9 +4,9 @@ from config import SEL
 from utils.storage_helpers import (
     clear_storage,
     create_profile,
-    create_multiple_profiles,
     get_storage_data,
 )
+from utils.app_ready import wait_for_app_ready
 
 
 class TestProfileCreation:
@@ -63,7 +63,7 @@ class TestProfileCreation:
 
         # Reload the page
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
 
         # Should still be on timer screen with same profile
         page.wait_for_selector(SEL["timer_display"])
@@ -79,23 +79,16 @@ class TestProfileSelection:
         # Create a profile in storage
         create_profile(page, name="Joao")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
 
         # Should show timer screen with profile
         page.wait_for_selector(SEL["timer_display"])
         badge = page.locator(SEL["profile_badge"])
         assert "Joao" in badge.text_content()
 
+    @pytest.mark.storage_snapshot("multi_profile")
     def test_p03_switch_profile(self, page, base_url):
         """P03: Switch between profiles via profile badge."""
-        # Create multiple profiles
-        create_multiple_profiles(page, [
-            {"name": "Ana"},
-            {"name": "Bruno"},
-        ])
-        page.reload()
-        page.wait_for_load_state("networkidle")
-
         # Should show profile selector
         page.wait_for_selector(SEL["profile_selector"])
 
@@ -107,19 +100,19 @@ class TestProfileSelection:
         page.click(SEL["profile_badge"])
         page.wait_for_selector(SEL["modal"])
 
-        # Select Bruno
-        page.click(f"{SEL['profile_list_item']}:has-text('Bruno')")
+        # Select Bia
+        page.click(f"{SEL['profile_list_item']}:has-text('Bia')")
 
-        # Should now show Bruno
+        # Should now show Bia
         page.wait_for_selector(SEL["timer_display"])
         badge = page.locator(SEL["profile_badge"])
-        assert "Bruno" in badge.text_content()
+        assert "Bia" in badge.text_content()
 
     def test_p06_logout(self, page, base_url):
         """P06: Logout returns to profile selector."""
         create_profile(page, name="TestLogout")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Click profile badge
@@ -140,7 +133,7 @@ class TestProfileEditing:
         """P04: Edit profile name via modal."""
         create_profile(page, name="Original")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Click edit button directly (it's in the header)
@@ -165,7 +158,7 @@ class TestProfileEditing:
         """P05: Change avatar via edit modal."""
         create_profile(page, name="AvatarTest", avatar="rabbit")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Click edit button directly (it's in the header)
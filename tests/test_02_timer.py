@@ -1,18 +1,71 @@
-"""Timer Functionality Tests - T01-T10"""
+"""Timer Functionality Tests - T01-T14"""
+from collections import Counter
+
 import pytest
-import time
 from config import SEL
-from utils.storage_helpers import create_profile, get_storage_data
+from utils.storage_helpers import create_profile, get_storage_data, set_storage_data
+from utils.app_ready import wait_for_app_ready
+
+ALL_ALERTS = {
+    "oneMinute": True,
+    "fiveMinutes": True,
+    "fiftyPercent": True,
+    "twentyFivePercent": True,
+}
+
+# Logs every timer-alert and phase event in order, from before the app boots
+ALERT_LOG_SCRIPT = """
+window.__alertLog = []
+window.addEventListener('timer-alert', (e) => {
+    for (const name of e.detail.alerts) window.__alertLog.push({ alert: name })
+})
+window.addEventListener('timer-event', (e) => {
+    window.__alertLog.push({ event: e.detail.type })
+})
+"""
+
+# Delays every main-thread timer by a random 0-1500 ms (seeded, so a failure
+# reproduces), like a throttled tab or a busy device would
+TICK_JITTER_SCRIPT = """
+(() => {
+    let seed = 20240521
+    const random = () => {
+        seed = (seed * 1664525 + 1013904223) % 4294967296
+        return seed / 4294967296
+    }
+    const setTimeoutWithJitter = window.setTimeout
+    window.setTimeout = (fn, delay = 0, ...args) =>
+        setTimeoutWithJitter(fn, delay + random() * 1500, ...args)
+})()
+"""
+
+
+def alerts_by_phase(log):
+    """Count the alerts fired in each phase: {"work": Counter, "break": Counter}."""
+    phases = {"work": Counter(), "break": Counter()}
+    phase = "work"
+    for entry in log:
+        if entry.get("event") == "break-start":
+            phase = "break"
+        elif "alert" in entry:
+            phases[phase][entry["alert"]] += 1
+    return phases
+
+
+def enable_all_alerts(page):
+    """Turn every timer alert on in the stored settings."""
+    data = get_storage_data(page)
+    data.setdefault("globalSettings", {})["alerts"] = ALL_ALERTS
+    set_storage_data(page, data)
+    return data
 
 
 class TestTimerStart:
     """Tests for starting the timer."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_t01_start_default(self, page, base_url):
         """T01: Start timer with default 25-minute preset."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Click start button
@@ -27,11 +80,9 @@ class TestTimerStart:
         time_text = timer_time.text_content()
         assert ":" in time_text
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_t02_preset_longo(self, page, base_url):
         """T02: Start timer with 50/10 (Longo) preset."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Select Longo preset
@@ -47,11 +98,9 @@ class TestTimerStart:
         # Should be around 50 minutes
         assert time_text.startswith("50:") or time_text.startswith("49:")
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_t03_custom_time(self, page, base_url):
         """T03: Start timer with custom duration."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Select custom preset
@@ -77,36 +126,32 @@ class TestTimerStart:
 class TestTimerControls:
     """Tests for timer pause, resume, stop controls."""
 
-    def test_t04_pause(self, page, base_url):
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_t04_pause(self, page, base_url, fast_clock):
         """T04: Pause running timer."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Start timer
         page.click(SEL["start_btn"])
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
 
-        # Wait a moment then pause
-        time.sleep(1)
+        # Let a second pass then pause
+        fast_clock.advance(1)
         page.click(SEL["pause_btn"])
 
         # Should show paused status and resume button
         page.wait_for_selector(".status-badge.paused, .status-badge:has-text('Pausado')")
         assert page.locator(SEL["resume_btn"]).is_visible()
 
-    def test_t05_resume(self, page, base_url):
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_t05_resume(self, page, base_url, fast_clock):
         """T05: Resume paused timer."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Start and pause
         page.click(SEL["start_btn"])
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
-        time.sleep(1)
+        fast_clock.advance(1)
         page.click(SEL["pause_btn"])
         page.wait_for_selector(".status-badge.paused, .status-badge:has-text('Pausado')")
 
@@ -117,11 +162,9 @@ class TestTimerControls:
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
         assert page.locator(SEL["pause_btn"]).is_visible()
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_t06_stop(self, page, base_url):
         """T06: Stop timer resets to idle."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Start timer
@@ -139,11 +182,9 @@ class TestTimerControls:
 class TestTimerCompletion:
     """Tests for timer completion and transitions."""
 
-    def test_t07_work_to_break_transition(self, page, base_url):
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_t07_work_to_break_transition(self, page, base_url, fast_clock):
         """T07: Timer transitions from work to break after completion."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Use custom 1-minute duration for faster test
@@ -156,20 +197,15 @@ class TestTimerCompletion:
         page.click(SEL["start_btn"])
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
 
-        # Wait for work period to complete (1 minute + buffer)
-        page.wait_for_selector(
-            ".status-badge.break, .status-badge:has-text('Intervalo')",
-            timeout=70000
-        )
+        # Run the work period to completion on the virtual clock
+        fast_clock.run_until("break")
 
         # Skip button should be visible during break
         assert page.locator(SEL["skip_btn"]).is_visible()
 
-    def test_t08_skip_break(self, page, base_url):
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_t08_skip_break(self, page, base_url, fast_clock):
         """T08: Skip break returns to idle."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Use 1-minute custom duration
@@ -183,10 +219,7 @@ class TestTimerCompletion:
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
 
         # Wait for break
-        page.wait_for_selector(
-            ".status-badge.break, .status-badge:has-text('Intervalo')",
-            timeout=70000
-        )
+        fast_clock.run_until("break")
 
         # Click celebration overlay to dismiss it, then skip the break
         celebration = page.locator(".celebration-overlay")
@@ -205,11 +238,11 @@ class TestTimerCompletion:
 class TestTimerPoints:
     """Tests for points and tracking."""
 
-    def test_t09_points_awarded(self, page, base_url):
+    def test_t09_points_awarded(self, page, base_url, fast_clock):
         """T09: Points are awarded after completing work session."""
         create_profile(page, points=0)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Get initial points (should be 0)
@@ -226,10 +259,7 @@ class TestTimerPoints:
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
 
         # Wait for break (work completed)
-        page.wait_for_selector(
-            ".status-badge.break, .status-badge:has-text('Intervalo')",
-            timeout=70000
-        )
+        fast_clock.run_until("break")
 
         # Points should have increased
         new_text = points_btn.text_content()
@@ -238,11 +268,11 @@ class TestTimerPoints:
         new_points = int(''.join(filter(str.isdigit, new_text)) or '0')
         assert new_points > initial_points
 
-    def test_t10_today_count(self, page, base_url):
+    def test_t10_today_count(self, page, base_url, fast_clock):
         """T10: Today count increments after completing pomodoro."""
         create_profile(page, total_pomodoros=0)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Complete a 1-minute work session
@@ -255,10 +285,7 @@ class TestTimerPoints:
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
 
         # Wait for break (work completed)
-        page.wait_for_selector(
-            ".status-badge.break, .status-badge:has-text('Intervalo')",
-            timeout=70000
-        )
+        fast_clock.run_until("break")
 
         # Check storage for pomodoro count
         data = get_storage_data(page)
@@ -269,3 +296,117 @@ class TestTimerPoints:
         )
         assert profile is not None
         assert profile.get("totalPomodoros", 0) >= 1
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_t11_full_longo_cycle(self, page, base_url, fast_clock):
+        """T11: A full 50/10 (Longo) cycle runs through break back to idle."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        page.click(SEL["preset_longo"])
+        page.click(SEL["start_btn"])
+        page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
+
+        # Work period completes and the break starts
+        fast_clock.run_until("break")
+        break_time = page.locator(SEL["timer_time"]).text_content().strip()
+        assert break_time.startswith("10:") or break_time.startswith("09:")
+
+        # Break completes and the timer returns to idle
+        fast_clock.run_until("idle")
+        assert page.locator(SEL["start_btn"]).is_visible()
+
+        data = get_storage_data(page)
+        profile = next(
+            (p for p in data.get("profiles", [])
+             if p["id"] == data.get("activeProfileId")),
+            None
+        )
+        assert profile is not None
+        assert profile.get("totalPomodoros", 0) >= 1
+
+
+class TestTimerRestore:
+    """Tests for resuming a running timer after a reload."""
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_t12_restore_uses_deadline(self, page, base_url):
+        """T12: A restored timer counts down to its stored end time, not from its last save."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        # Last saved an hour ago with 10 minutes left, but the deadline says 5
+        now = page.evaluate("Date.now()")
+        data = get_storage_data(page)
+        data["timerState"] = {
+            "status": "working",
+            "timeRemaining": 600,
+            "totalTime": 1500,
+            "targetEndTime": now + 300 * 1000,
+            "workDuration": 25,
+            "breakDuration": 5,
+            "pausedStatus": None,
+            "savedAt": now - 3600 * 1000,
+        }
+        set_storage_data(page, data)
+
+        page.reload()
+        wait_for_app_ready(page)
+
+        page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
+        time_text = page.locator(SEL["timer_time"]).text_content().strip()
+        assert time_text.startswith("05:") or time_text.startswith("04:")
+
+
+class TestTimerAlerts:
+    """Tests for alerts firing exactly once per phase."""
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_t13_alerts_with_tick_jitter(self, page, base_url, fast_clock):
+        """T13: Every alert fires exactly once per phase even when timers run late."""
+        page.wait_for_selector(SEL["timer_display"])
+        enable_all_alerts(page)
+        page.add_init_script(ALERT_LOG_SCRIPT)
+        page.add_init_script(TICK_JITTER_SCRIPT)
+        page.reload()
+        wait_for_app_ready(page)
+
+        page.click(SEL["start_btn"])
+        page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
+        fast_clock.run_until("break")
+        fast_clock.run_until("idle")
+
+        phases = alerts_by_phase(page.evaluate("window.__alertLog"))
+        # 25 minutes of work: 1 and 5 minutes, 12:30 and 6:15 left
+        assert phases["work"] == Counter(list(ALL_ALERTS))
+        # 5 minute break: the 5 minute alert would be due at its start
+        assert phases["break"] == Counter(["oneMinute", "fiftyPercent", "twentyFivePercent"])
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_t14_alerts_across_restore(self, page, base_url, fast_clock):
+        """T14: A restored timer fires missed alerts once and never repeats fired ones."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        # 6 minutes left of 25: the 50% alert fired before the reload, the
+        # 25% one (due at 6:15) was missed while the page was closed
+        now = page.evaluate("Date.now()")
+        data = enable_all_alerts(page)
+        data["timerState"] = {
+            "status": "working",
+            "timeRemaining": 360,
+            "totalTime": 1500,
+            "targetEndTime": now + 360 * 1000,
+            "workDuration": 25,
+            "breakDuration": 5,
+            "pausedStatus": None,
+            "firedAlerts": ["fiftyPercent"],
+            "savedAt": now,
+        }
+        set_storage_data(page, data)
+        page.add_init_script(ALERT_LOG_SCRIPT)
+        page.reload()
+        wait_for_app_ready(page)
+
+        page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
+        fast_clock.run_until("break")
+
+        phases = alerts_by_phase(page.evaluate("window.__alertLog"))
+        assert phases["work"] == Counter(["twentyFivePercent", "fiveMinutes", "oneMinute"])
@@ -1,7 +1,14 @@
-"""Progress Indicator Tests - PR01-PR06"""
+"""Progress Indicator Tests - PR01-PR07"""
 import pytest
 from config import SEL
-from utils.storage_helpers import create_profile, get_storage_data
+from utils.storage_helpers import (
+    build_profile,
+    build_storage_data,
+    create_profile,
+    get_storage_data,
+    set_storage_data,
+)
+from utils.app_ready import wait_for_app_ready
 
 
 class TestProgressIndicators:
@@ -11,18 +18,16 @@ class TestProgressIndicators:
         """PR01: Circular progress indicator is shown by default."""
         create_profile(page, progress_indicator="circular")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Circular progress should be visible (SVG circle)
         circular = page.locator(".circular-progress, svg.progress-ring, .progress-circle")
         assert circular.count() > 0 or page.locator("svg circle").count() > 0
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_pr02_animal_path(self, page, base_url):
         """PR02: Animal path indicator shows animal on path."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Change to animal path via settings
@@ -36,11 +41,9 @@ class TestProgressIndicators:
         animal_path = page.locator(".animal-path")
         assert animal_path.count() > 0
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_pr03_hourglass(self, page, base_url):
         """PR03: Hourglass indicator shows hourglass SVG."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Change to hourglass via settings
@@ -54,11 +57,9 @@ class TestProgressIndicators:
         hourglass = page.locator(".hourglass-container")
         assert hourglass.count() > 0
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_pr04_progress_bar(self, page, base_url):
         """PR04: Progress bar indicator shows horizontal bar."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Change to progress bar via settings
@@ -80,7 +81,7 @@ class TestProgressSettings:
         """PR05: Change progress indicator via settings panel."""
         create_profile(page, progress_indicator="circular")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -101,11 +102,9 @@ class TestProgressSettings:
         # Verify indicator changed
         page.wait_for_selector(SEL["timer_display"])
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_pr06_persistence(self, page, base_url):
         """PR06: Progress indicator persists after reload."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Change to hourglass via settings
@@ -117,7 +116,7 @@ class TestProgressSettings:
 
         # Reload the page
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Hourglass should still be visible (persisted)
@@ -132,7 +131,7 @@ class TestProgressAccuracy:
         """Progress indicator updates while timer is running."""
         create_profile(page, progress_indicator="circular")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Start timer
@@ -146,3 +145,28 @@ class TestProgressAccuracy:
         # Stop timer
         page.click(SEL["stop_btn"])
         page.wait_for_selector(".status-badge.idle, .status-badge:has-text('Pronto')")
+
+    def test_pr07_smooth_progress_animation(self, page, base_url):
+        """PR07: Smooth progress runs one animation per phase and follows pause/stop."""
+        profile = build_profile(progress_indicator="circular")
+        data = build_storage_data([profile], profile["id"])
+        data["globalSettings"]["smoothProgress"] = True
+        set_storage_data(page, data)
+        page.reload()
+        wait_for_app_ready(page)
+        page.wait_for_selector(SEL["timer_display"])
+
+        play_state = """() => document.querySelector('.progress-ring')
+            .getAnimations().map(a => a.playState)"""
+
+        page.click(SEL["start_btn"])
+        page.wait_for_selector(".status-badge.working")
+        page.wait_for_function(f"({play_state})().join() === 'running'")
+
+        page.click(SEL["pause_btn"])
+        page.wait_for_selector(".status-badge.paused")
+        page.wait_for_function(f"({play_state})().join() === 'paused'")
+
+        page.click(SEL["stop_btn"])
+        page.wait_for_selector(".status-badge.idle")
+        assert page.evaluate(play_state) == []
@@ -1,17 +1,15 @@
-"""Music Player Tests - M01-M08"""
+"""Music Player Tests - M01-M09"""
 import pytest
 from config import SEL
-from utils.storage_helpers import create_profile
+from utils.app_ready import wait_for_app_ready
 
 
 class TestMusicSettings:
     """Tests for music settings and preferences."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_m01_enable_music(self, page, base_url):
         """M01: Enable music via settings."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -37,11 +35,9 @@ class TestMusicSettings:
             # Music section might be nested in settings
             assert music_section.count() > 0 or page.locator(SEL["track_card"]).count() >= 0
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_m02_play_track(self, page, base_url):
         """M02: Play an unlocked ambient track."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -63,11 +59,9 @@ class TestMusicSettings:
             now_playing = page.locator(SEL["now_playing"])
             # This may or may not be visible depending on implementation
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_m04_volume_control(self, page, base_url):
         """M04: Volume slider adjusts volume."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -91,7 +85,7 @@ class TestMusicSettings:
         """M05: Locked tracks show cost and are disabled."""
         create_profile(page, points=0)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -112,11 +106,9 @@ class TestMusicSettings:
 class TestMusicSections:
     """Tests for music section organization."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_m06_soundscape_section(self, page, base_url):
         """M06: Soundscape section shows ambient tracks."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -133,11 +125,9 @@ class TestMusicSections:
         # Or look for specific track names
         piano_track = page.locator(":text('Piano'), :text('Calmo')")
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_m07_energetic_section(self, page, base_url):
         """M07: Energetic section shows upbeat tracks."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -158,11 +148,9 @@ class TestMusicSections:
 class TestMusicPlayback:
     """Tests for music playback controls."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_m03_pause_music(self, page, base_url):
         """M03: Pause playing music."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings and enable music
@@ -180,11 +168,9 @@ class TestMusicPlayback:
             # Click again to pause (toggle behavior)
             track_cards.first.click()
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_m08_music_disabled_by_default(self, page, base_url):
         """M08: Music is disabled by default."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -198,3 +184,20 @@ class TestMusicPlayback:
             has_active = disabled_btn.locator(".active").count() > 0 or \
                         "active" in (disabled_btn.get_attribute("class") or "")
             # Default should be disabled
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_m09_soundscape_plays_offline(self, page, base_url, network_stubs):
+        """M09: Soundscapes play from the local audio stub, not archive.org."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        page.click(SEL["settings_btn"])
+        page.wait_for_selector(SEL["settings_panel"])
+        page.click(f"{SEL['music_btn']}:has-text('Música')")
+        page.wait_for_selector(SEL["music_player"])
+
+        page.locator(f"{SEL['track_card']}:not(.locked)").first.click()
+
+        # Now playing bar shows and the request went to the stub
+        page.wait_for_selector(f"{SEL['now_playing']}.playing")
+        assert any("archive.org" in url for url in network_stubs.requests)
+        assert page.locator(".status-message.error").count() == 0
@@ -2,6 +2,7 @@
 import pytest
 from config import SEL
 from utils.storage_helpers import create_profile, get_storage_data, add_points
+from utils.app_ready import wait_for_app_ready
 
 
 class TestRewardsShop:
@@ -11,7 +12,7 @@ class TestRewardsShop:
         """R01: Open rewards shop modal."""
         create_profile(page, points=100)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Click points/rewards button
@@ -26,7 +27,7 @@ class TestRewardsShop:
         """R02: Points are displayed in header."""
         create_profile(page, points=150)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Points button should show current points
@@ -38,7 +39,7 @@ class TestRewardsShop:
         """R03: Default items are shown as owned."""
         create_profile(page, avatar="rabbit")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open shop
@@ -54,7 +55,7 @@ class TestRewardsShop:
         # Create profile with enough points to buy something
         create_profile(page, points=100)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Get initial points
@@ -89,7 +90,7 @@ class TestRewardsShop:
         """R05: Cannot buy item without enough points."""
         create_profile(page, points=0)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open shop
@@ -112,7 +113,7 @@ class TestRewardsShop:
             unlocked_avatars=["rabbit", "turtle"]
         )
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open shop
@@ -135,7 +136,7 @@ class TestRewardsShop:
             unlocked_themes=["divertido", "minimalista"]
         )
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings (themes are in settings, not shop)
@@ -157,7 +158,7 @@ class TestRewardsShop:
         """R08: Shop shows different sections (avatars, themes, soundscapes)."""
         create_profile(page, points=100)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open shop
@@ -179,7 +180,7 @@ class TestRewardsUnlocking:
         """Purchased items become available for use."""
         create_profile(page, points=200)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open shop
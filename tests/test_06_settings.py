@@ -2,16 +2,15 @@
 import pytest
 from config import SEL
 from utils.storage_helpers import create_profile, get_storage_data
+from utils.app_ready import wait_for_app_ready
 
 
 class TestSettingsModal:
     """Tests for settings modal behavior."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_s01_open_settings(self, page, base_url):
         """S01: Open settings modal."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Click settings button
@@ -21,11 +20,9 @@ class TestSettingsModal:
         page.wait_for_selector(SEL["settings_panel"])
         assert page.locator(SEL["settings_panel"]).is_visible()
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_s10_close_settings(self, page, base_url):
         """S10: Close settings by clicking outside."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -46,7 +43,7 @@ class TestThemeSettings:
         """S02: Select and apply a theme."""
         create_profile(page, theme="divertido", unlocked_themes=["divertido", "minimalista"])
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -68,7 +65,7 @@ class TestThemeSettings:
         # Only unlock default themes
         create_profile(page, theme="divertido", unlocked_themes=["divertido"])
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -87,11 +84,9 @@ class TestThemeSettings:
 class TestToggleSettings:
     """Tests for toggle switches."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_s04_sound_toggle(self, page, base_url):
         """S04: Toggle sound effects on/off."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -112,11 +107,9 @@ class TestToggleSettings:
             new_active = "active" in (sound_toggle.get_attribute("class") or "")
             assert new_active != initial_active
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_s05_volume_slider(self, page, base_url):
         """S05: Adjust volume slider."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -136,11 +129,9 @@ class TestToggleSettings:
             # Value should persist
             new_value = slider.input_value()
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_s06_haptic_toggle(self, page, base_url):
         """S06: Toggle haptic feedback."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -156,11 +147,9 @@ class TestToggleSettings:
 class TestMusicSettings:
     """Tests for music preference settings."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_s07_music_options(self, page, base_url):
         """S07: Switch between music options."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -183,11 +172,9 @@ class TestMusicSettings:
 class TestAlertSettings:
     """Tests for timer alert settings."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_s08_alert_toggles(self, page, base_url):
         """S08: Toggle time alert settings."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -208,11 +195,9 @@ class TestAlertSettings:
 class TestDevMode:
     """Tests for developer mode."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_s09_dev_mode(self, page, base_url):
         """S09: Enable dev mode by tapping header 7 times."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -236,7 +221,7 @@ class TestDevMode:
         """Dev mode +50 points button adds points."""
         create_profile(page, points=0)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings and enable dev mode
@@ -2,16 +2,15 @@
 import pytest
 from config import SEL
 from utils.storage_helpers import create_profile, award_badge, get_storage_data
+from utils.app_ready import wait_for_app_ready
 
 
 class TestBadgesDisplay:
     """Tests for badges display modal."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_b01_open_badges(self, page, base_url):
         """B01: Open badges modal."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Click badges button
@@ -28,7 +27,7 @@ class TestBadgesDisplay:
         """B02: Locked badges show lock icon and dimmed appearance."""
         create_profile(page, badges=[])  # No badges earned
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open badges
@@ -50,7 +49,7 @@ class TestBadgesDisplay:
         # Create profile with some badges
         create_profile(page, badges=["primeiro-passo", "cinco-seguidos"])
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open badges
@@ -68,7 +67,7 @@ class TestBadgesDisplay:
         """B04: Badge count summary shows X of total."""
         create_profile(page, badges=["primeiro-passo"])
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open badges
@@ -83,11 +82,11 @@ class TestBadgesDisplay:
 class TestBadgeEarning:
     """Tests for earning badges."""
 
-    def test_b05_first_pomodoro_badge(self, page, base_url):
+    def test_b05_first_pomodoro_badge(self, page, base_url, fast_clock):
         """B05: Earn 'Primeiro Passo' badge after first pomodoro."""
         create_profile(page, badges=[], total_pomodoros=0)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Verify no badges initially
@@ -110,10 +109,7 @@ class TestBadgeEarning:
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
 
         # Wait for work period to complete
-        page.wait_for_selector(
-            ".status-badge.break, .status-badge:has-text('Intervalo')",
-            timeout=70000
-        )
+        fast_clock.run_until("break")
 
         # Check badges after completion
         final_data = get_storage_data(page)
@@ -131,13 +127,13 @@ class TestBadgeEarning:
         """Verify badge appears in UI after being added via storage."""
         create_profile(page, badges=[])
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Award badge via storage helper
         award_badge(page, "primeiro-passo")
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open badges
@@ -158,12 +154,12 @@ class TestBadgePersistence:
         """Earned badges persist after page reload."""
         create_profile(page, badges=["primeiro-passo", "cinco-seguidos"])
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Reload again
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Check badges still in storage
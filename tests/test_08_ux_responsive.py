@@ -2,6 +2,7 @@
 import pytest
 from config import SEL, MOBILE, TABLET, DESKTOP
 from utils.storage_helpers import create_profile
+from utils.app_ready import wait_for_app_ready
 
 
 class TestMobileViewport:
@@ -11,7 +12,7 @@ class TestMobileViewport:
         """RES01: No horizontal scroll on mobile (within 10px tolerance)."""
         create_profile(mobile_page)
         mobile_page.reload()
-        mobile_page.wait_for_load_state("networkidle")
+        wait_for_app_ready(mobile_page)
         mobile_page.wait_for_selector(SEL["timer_display"])
 
         # Check for horizontal overflow (allow small tolerance for scrollbar)
@@ -26,7 +27,7 @@ class TestMobileViewport:
         """RES02: All timer controls are visible on mobile."""
         create_profile(mobile_page)
         mobile_page.reload()
-        mobile_page.wait_for_load_state("networkidle")
+        wait_for_app_ready(mobile_page)
         mobile_page.wait_for_selector(SEL["timer_display"])
 
         # Check that key controls are visible
@@ -44,7 +45,7 @@ class TestMobileViewport:
         """RES03: Modals fit within mobile viewport width."""
         create_profile(mobile_page)
         mobile_page.reload()
-        mobile_page.wait_for_load_state("networkidle")
+        wait_for_app_ready(mobile_page)
         mobile_page.wait_for_selector(SEL["timer_display"])
 
         # Open settings modal
@@ -69,7 +70,7 @@ class TestTabletViewport:
         """RES04: Tablet shows proper grid layout."""
         create_profile(tablet_page)
         tablet_page.reload()
-        tablet_page.wait_for_load_state("networkidle")
+        wait_for_app_ready(tablet_page)
         tablet_page.wait_for_selector(SEL["timer_display"])
 
         # Open settings to see grid layout
@@ -92,7 +93,7 @@ class TestDesktopViewport:
         """RES05: Desktop shows optimal spacing."""
         create_profile(desktop_page)
         desktop_page.reload()
-        desktop_page.wait_for_load_state("networkidle")
+        wait_for_app_ready(desktop_page)
         desktop_page.wait_for_selector(SEL["timer_display"])
 
         # Check that layout uses available space
@@ -109,15 +110,10 @@ class TestResponsiveElements:
     """Tests for responsive element behavior."""
 
     @pytest.mark.parametrize("viewport", [MOBILE, TABLET, DESKTOP])
-    def test_no_horizontal_scroll_all_viewports(self, browser, base_url, viewport):
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_no_horizontal_scroll_all_viewports(self, viewport_page, base_url, viewport):
         """No horizontal scroll on any viewport size (within 10px tolerance)."""
-        context = browser.new_context(viewport=viewport)
-        page = context.new_page()
-        page.goto(base_url)
-
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
+        page = viewport_page
         page.wait_for_selector(SEL["timer_display"])
 
         scroll_width = page.evaluate("document.documentElement.scrollWidth")
@@ -127,38 +123,22 @@ class TestResponsiveElements:
         assert scroll_width <= client_width + 10, \
             f"Horizontal scroll at {viewport}: scrollWidth={scroll_width}, clientWidth={client_width}"
 
-        page.close()
-        context.close()
-
     @pytest.mark.parametrize("viewport", [MOBILE, TABLET, DESKTOP])
-    def test_header_visible_all_viewports(self, browser, base_url, viewport):
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_header_visible_all_viewports(self, viewport_page, base_url, viewport):
         """Header buttons are visible on all viewport sizes."""
-        context = browser.new_context(viewport=viewport)
-        page = context.new_page()
-        page.goto(base_url)
-
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
+        page = viewport_page
         page.wait_for_selector(SEL["timer_display"])
 
         # Header buttons should be visible
         assert page.locator(SEL["profile_badge"]).is_visible()
         assert page.locator(SEL["settings_btn"]).is_visible()
 
-        page.close()
-        context.close()
-
     @pytest.mark.parametrize("viewport", [MOBILE, TABLET, DESKTOP])
-    def test_modals_accessible_all_viewports(self, browser, base_url, viewport):
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_modals_accessible_all_viewports(self, viewport_page, base_url, viewport):
         """Modals can be opened and closed on all viewports."""
-        context = browser.new_context(viewport=viewport)
-        page = context.new_page()
-        page.goto(base_url)
-
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
+        page = viewport_page
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -175,6 +155,3 @@ class TestResponsiveElements:
 
         # Modal should close
         page.wait_for_selector(SEL["modal"], state="hidden")
-
-        page.close()
-        context.close()
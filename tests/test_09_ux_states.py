@@ -1,17 +1,16 @@
-"""Visual States Tests - VS01-VS08"""
+"""Visual States Tests - VS01-VS10"""
 import pytest
 from config import SEL
 from utils.storage_helpers import create_profile, award_badge
+from utils.app_ready import wait_for_app_ready
 
 
 class TestButtonStates:
     """Tests for button visual states."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_vs01_preset_active_state(self, page, base_url):
         """VS01: Active preset button has green border and background."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Find active preset button (default should be Curto/25-5)
@@ -33,7 +32,7 @@ class TestButtonStates:
         """VS02: Disabled buy button shows gray and blocked cursor."""
         create_profile(page, points=0)
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open shop
@@ -52,11 +51,9 @@ class TestButtonStates:
 class TestMediaStates:
     """Tests for media player visual states."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_vs03_track_playing_state(self, page, base_url):
         """VS03: Playing track shows green border and music badge."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings and enable music
@@ -85,7 +82,7 @@ class TestThemeStates:
         # Only unlock one theme
         create_profile(page, theme="divertido", unlocked_themes=["divertido"])
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings
@@ -111,7 +108,7 @@ class TestBadgeStates:
         """VS05: Earned badge shows full opacity and colored icon."""
         create_profile(page, badges=["primeiro-passo"])
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open badges
@@ -130,7 +127,7 @@ class TestBadgeStates:
         """VS06: Locked badge shows 0.5 opacity and lock icon."""
         create_profile(page, badges=[])  # No badges
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open badges
@@ -150,11 +147,9 @@ class TestBadgeStates:
 class TestTimerStates:
     """Tests for timer mode visual states."""
 
-    def test_vs07_break_mode_visual(self, page, base_url):
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_vs07_break_mode_visual(self, page, base_url, fast_clock):
         """VS07: Break mode has distinct visual style (blue tint)."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Use 1-minute custom to reach break faster
@@ -167,10 +162,7 @@ class TestTimerStates:
         page.wait_for_selector(".status-badge.working, .status-badge:has-text('Trabalhando')")
 
         # Wait for break
-        page.wait_for_selector(
-            ".status-badge.break, .status-badge:has-text('Intervalo')",
-            timeout=70000
-        )
+        fast_clock.run_until("break")
 
         # Check for break visual state
         status_badge = page.locator(".status-badge.break, .status-badge:has-text('Intervalo')")
@@ -180,11 +172,9 @@ class TestTimerStates:
         app = page.locator(".app, #app")
         # Break mode might add a class or change data attribute
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_working_mode_visual(self, page, base_url):
         """Working mode shows distinct visual style."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Start timer
@@ -210,7 +200,7 @@ class TestShopItemStates:
             unlocked_avatars=["rabbit", "turtle"]
         )
         page.reload()
-        page.wait_for_load_state("networkidle")
+        wait_for_app_ready(page)
         page.wait_for_selector(SEL["timer_display"])
 
         # Open shop
@@ -225,11 +215,9 @@ class TestShopItemStates:
 class TestStatusTransitions:
     """Tests for visual state transitions."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_idle_to_working_transition(self, page, base_url):
         """Idle to working state transition is visually clear."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Verify idle state
@@ -251,11 +239,9 @@ class TestStatusTransitions:
         # Stop timer
         page.click(SEL["stop_btn"])
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_working_to_paused_transition(self, page, base_url):
         """Working to paused state transition is visually clear."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Start timer
@@ -272,3 +258,49 @@ class TestStatusTransitions:
 
         # Stop timer
         page.click(SEL["stop_btn"])
+
+
+CELEBRATE_SCRIPT = """window.dispatchEvent(new CustomEvent('timer-event', {
+    detail: { type: 'pomodoro-complete' }
+}))"""
+
+# True once anything has been drawn on the confetti canvas
+CANVAS_DRAWN_SCRIPT = """() => {
+    const canvas = document.querySelector('.confetti-canvas')
+    if (!canvas || !canvas.width) return false
+    const pixels = canvas.getContext('2d').getImageData(0, 0, canvas.width, canvas.height).data
+    for (let i = 3; i < pixels.length; i += 4) if (pixels[i]) return true
+    return false
+}"""
+
+
+class TestCelebrationStates:
+    """Tests for the celebration overlay."""
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_vs09_confetti_on_canvas(self, page, base_url):
+        """VS09: Confetti is drawn on a single canvas, not as DOM nodes."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        page.evaluate(CELEBRATE_SCRIPT)
+        page.wait_for_selector(".celebration-overlay")
+        page.wait_for_function(CANVAS_DRAWN_SCRIPT)
+
+        assert page.locator(".confetti-canvas").count() == 1
+        assert page.locator(".confetti").count() == 0
+        assert int(page.get_attribute(".confetti-canvas", "data-particles")) > 0
+
+        page.click(".dismiss-btn")
+        page.wait_for_selector(".confetti-canvas", state="detached")
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_vs10_reduced_motion_skips_confetti(self, page, base_url):
+        """VS10: With prefers-reduced-motion the celebration shows without confetti."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.emulate_media(reduced_motion="reduce")
+
+        page.evaluate(CELEBRATE_SCRIPT)
+        page.wait_for_selector(".celebration-overlay")
+
+        assert page.locator(".celebration-title").is_visible()
+        assert page.locator(".confetti-canvas").count() == 0
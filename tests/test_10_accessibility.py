@@ -2,6 +2,7 @@
 import pytest
 from config import SEL, MOBILE
 from utils.storage_helpers import create_profile
+from utils.app_ready import wait_for_app_ready
 
 
 class TestTouchTargets:
@@ -11,7 +12,7 @@ class TestTouchTargets:
         """A01: All touch targets meet 44x44px minimum."""
         create_profile(mobile_page)
         mobile_page.reload()
-        mobile_page.wait_for_load_state("networkidle")
+        wait_for_app_ready(mobile_page)
         mobile_page.wait_for_selector(SEL["timer_display"])
 
         # Critical touch targets to check
@@ -37,7 +38,7 @@ class TestTouchTargets:
         """Preset buttons have adequate touch targets."""
         create_profile(mobile_page)
         mobile_page.reload()
-        mobile_page.wait_for_load_state("networkidle")
+        wait_for_app_ready(mobile_page)
         mobile_page.wait_for_selector(SEL["timer_display"])
 
         presets = mobile_page.locator(SEL["preset_btn"])
@@ -56,11 +57,9 @@ class TestTouchTargets:
 class TestFocusManagement:
     """Tests for keyboard focus visibility."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_a02_focus_visible_on_tab(self, page, base_url):
         """A02: Focus ring visible when tabbing through elements."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Tab through elements
@@ -78,11 +77,9 @@ class TestFocusManagement:
             # Focus ring should be visible
             pass  # Hard to test programmatically without visual comparison
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_a05_modal_focus_trap(self, page, base_url):
         """A05: Focus stays trapped within open modal."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open settings modal
@@ -108,11 +105,9 @@ class TestFocusManagement:
 class TestLabeling:
     """Tests for button labels and descriptions."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_a03_buttons_have_labels(self, page, base_url):
         """A03: Interactive elements have descriptive text or title."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Check that buttons have accessible labels
@@ -128,11 +123,9 @@ class TestLabeling:
                 has_label = bool(text.strip() or aria_label or title)
                 # Most buttons should have some form of label
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_settings_button_identifiable(self, page, base_url):
         """Settings button is identifiable."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         settings_btn = page.locator(SEL["settings_btn"])
@@ -146,11 +139,9 @@ class TestLabeling:
 class TestColorContrast:
     """Tests for color contrast and readability."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_a04_text_readable(self, page, base_url):
         """A04: Primary text is readable (sufficient contrast)."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Check timer display text is visible
@@ -166,11 +157,9 @@ class TestColorContrast:
             text = status.first.text_content()
             assert text and len(text) > 0
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_button_text_readable(self, page, base_url):
         """Button text is readable."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Start button should have readable text
@@ -182,11 +171,9 @@ class TestColorContrast:
 class TestKeyboardNavigation:
     """Tests for keyboard navigation support."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_can_start_timer_with_keyboard(self, page, base_url):
         """Timer can be started using keyboard."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Tab to start button
@@ -202,11 +189,9 @@ class TestKeyboardNavigation:
         # Stop timer
         page.click(SEL["stop_btn"])
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_can_navigate_settings_with_keyboard(self, page, base_url):
         """Settings can be navigated using keyboard."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Focus and activate settings button
@@ -227,11 +212,9 @@ class TestKeyboardNavigation:
 class TestScreenReaderSupport:
     """Tests for screen reader accessibility."""
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_timer_status_announced(self, page, base_url):
         """Timer status changes could be announced to screen readers."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Check for ARIA attributes on status elements
@@ -241,11 +224,9 @@ class TestScreenReaderSupport:
             text = status.first.text_content()
             assert text  # Should have status text like "Pronto", "Trabalhando", etc.
 
+    @pytest.mark.storage_snapshot("one_profile")
     def test_modal_has_role(self, page, base_url):
         """Modal has appropriate ARIA role."""
-        create_profile(page)
-        page.reload()
-        page.wait_for_load_state("networkidle")
         page.wait_for_selector(SEL["timer_display"])
 
         # Open modal
@@ -0,0 +1,196 @@
+"""Storage Write Budget Tests - S01-S11"""
+import pytest
+from config import SEL, STORAGE_WRITE_BUDGETS
+from utils.app_ready import wait_for_app_ready
+from utils.bench import cdp_session
+from utils.data_scale import build_scaled_storage
+from utils.storage_helpers import get_storage_data, set_storage_data
+
+
+class TestTimerStorageBudgets:
+    """localStorage writes caused by timer actions."""
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_s01_start_budget(self, page, base_url, storage_profiler):
+        """S01: Starting the timer stays within its write budget."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        with storage_profiler.measure("start") as stats:
+            page.click(SEL["start_btn"])
+            page.wait_for_selector(".status-badge.working")
+
+        assert stats.writes <= STORAGE_WRITE_BUDGETS["start"], stats
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_s02_pause_resume_budget(self, page, base_url, storage_profiler):
+        """S02: Pausing and resuming stay within their write budgets."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.click(SEL["start_btn"])
+        page.wait_for_selector(".status-badge.working")
+
+        with storage_profiler.measure("pause") as paused:
+            page.click(SEL["pause_btn"])
+            page.wait_for_selector(".status-badge.paused")
+
+        with storage_profiler.measure("resume") as resumed:
+            page.click(SEL["resume_btn"])
+            page.wait_for_selector(".status-badge.working")
+
+        assert paused.writes <= STORAGE_WRITE_BUDGETS["pause"], paused
+        assert resumed.writes <= STORAGE_WRITE_BUDGETS["resume"], resumed
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_s03_complete_budget(self, page, base_url, storage_profiler, fast_clock):
+        """S03: Completing a work session stays within its write budget."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.click(SEL["preset_custom"])
+        page.wait_for_selector(SEL["custom_inputs"])
+        page.locator(f"{SEL['custom_inputs']} {SEL['number_input']}").first.fill("1")
+        page.click(SEL["start_btn"])
+        page.wait_for_selector(".status-badge.working")
+
+        with storage_profiler.measure("complete") as stats:
+            fast_clock.run_until("break")
+
+        assert stats.writes >= 1
+        assert stats.writes <= STORAGE_WRITE_BUDGETS["complete"], stats
+        # Saves go through the in-memory document, not a re-read of storage
+        assert stats.parses == 0, stats
+
+
+class TestProfileStorageBudgets:
+    """localStorage writes caused by shop and settings actions."""
+
+    @pytest.mark.storage_snapshot("rich_profile")
+    def test_s04_purchase_budget(self, page, base_url, storage_profiler):
+        """S04: Buying an item stays within its write budget."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.click(SEL["points_btn"])
+        page.wait_for_selector(SEL["rewards_shop"])
+
+        buy_btn = page.locator(f"{SEL['buy_btn']}:not(:disabled)").first
+        with storage_profiler.measure("purchase") as stats:
+            buy_btn.click()
+            page.wait_for_function("window.__storageProfile.stats.writes > 0")
+
+        assert stats.writes <= STORAGE_WRITE_BUDGETS["purchase"], stats
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_s05_theme_change_budget(self, page, base_url, storage_profiler):
+        """S05: Changing theme stays within its write budget."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.click(SEL["settings_btn"])
+        page.wait_for_selector(SEL["settings_panel"])
+
+        with storage_profiler.measure("theme_change") as stats:
+            page.click(f"{SEL['theme_btn']}:has-text('Minimalista')")
+            page.wait_for_selector("html[data-theme='minimalista']", state="attached")
+
+        assert stats.writes <= STORAGE_WRITE_BUDGETS["theme_change"], stats
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_s06_profiler_counts_reads(self, page, base_url, storage_profiler):
+        """S06: Profiler attributes reads, bytes and parse cost to an action."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        with storage_profiler.measure("start") as stats:
+            page.click(SEL["start_btn"])
+            page.wait_for_selector(".status-badge.working")
+
+        assert stats.bytesWritten > 0
+        assert "kids-timer:timer" in stats.keysWritten
+        assert storage_profiler.actions["start"] is stats
+
+
+def reopen(page, base_url):
+    """Open the app in a new tab of the same context, without re-seeding."""
+    reopened = page.context.new_page()
+    reopened.goto(base_url)
+    wait_for_app_ready(reopened)
+    return reopened
+
+
+class TestWriteBack:
+    """Batched writes still reach storage when the page goes away."""
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_s07_state_survives_immediate_close(self, page, base_url):
+        """S07: Closing the tab right after starting keeps the running timer."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        page.click(SEL["start_btn"])
+        page.close()
+
+        reopened = reopen(page, base_url)
+        reopened.wait_for_selector(".status-badge.working")
+        assert get_storage_data(reopened)["timerState"]["status"] == "working"
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_s08_completion_survives_immediate_close(self, page, base_url, fast_clock):
+        """S08: Closing the tab right after a completion keeps points and the break."""
+        page.wait_for_selector(SEL["timer_display"])
+        points_before = get_storage_data(page)["profiles"][0]["points"]
+        page.click(SEL["preset_custom"])
+        page.wait_for_selector(SEL["custom_inputs"])
+        page.locator(f"{SEL['custom_inputs']} {SEL['number_input']}").first.fill("1")
+        page.click(SEL["start_btn"])
+        page.wait_for_selector(".status-badge.working")
+
+        fast_clock.run_until("break")
+        page.close()
+
+        data = get_storage_data(reopen(page, base_url))
+        assert data["profiles"][0]["points"] > points_before
+        assert data["timerState"]["status"] == "break"
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_s09_state_survives_renderer_crash(self, page, base_url):
+        """S09: Changes are on disk one task later, even if the tab then crashes."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        page.click(SEL["start_btn"])
+        page.wait_for_selector(".status-badge.working")
+        page.evaluate("() => new Promise((resolve) => setTimeout(resolve))")
+        page.on("crash", lambda _: None)
+        try:
+            cdp_session(page).send("Page.crash")
+        except Exception:
+            pass  # the session dies with the renderer
+
+        reopened = reopen(page, base_url)
+        assert get_storage_data(reopened)["timerState"]["status"] == "working"
+
+
+class TestShardedStorage:
+    """The document is split across per-section keys."""
+
+    def test_s10_timer_writes_independent_of_data_size(self, page, base_url, storage_profiler):
+        """S10: Timer actions only rewrite the timer key, however much data is stored."""
+        set_storage_data(page, build_scaled_storage(history=2000, profiles=50, videos=100))
+        page.reload()
+        wait_for_app_ready(page)
+        page.wait_for_selector(SEL["timer_display"])
+
+        with storage_profiler.measure("start") as started:
+            page.click(SEL["start_btn"])
+            page.wait_for_selector(".status-badge.working")
+        with storage_profiler.measure("pause") as paused:
+            page.click(SEL["pause_btn"])
+            page.wait_for_selector(".status-badge.paused")
+
+        for stats in (started, paused):
+            assert stats.keysWritten == {"kids-timer:timer": 1}, stats
+            assert stats.bytesWritten < 1024, stats
+
+    @pytest.mark.storage_snapshot("rich_profile")
+    def test_s11_legacy_document_migrated(self, page, base_url):
+        """S11: The legacy single-key document is split into shards on load."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        keys = page.evaluate("Object.keys(localStorage)")
+        data = get_storage_data(page)
+
+        assert "kids-timer-data" not in keys
+        assert {"kids-timer:meta", "kids-timer:profile:test-profile-001"} <= set(keys)
+        assert data["version"] == 2
+        assert data["profiles"][0]["points"] == 500
@@ -0,0 +1,76 @@
+"""Memory Leak Tests - L01-L04"""
+import pytest
+from config import (
+    LEAK_MAX_BYTES_PER_CYCLE,
+    LEAK_MAX_LISTENERS_PER_CYCLE,
+    LEAK_MAX_NODES_PER_CYCLE,
+    SEL,
+)
+from utils.leak_detector import measure_growth
+
+
+def assert_no_leak(growth):
+    """Fail if any measurement grows linearly with the number of cycles."""
+    assert growth["retained_bytes"] <= LEAK_MAX_BYTES_PER_CYCLE, growth
+    assert growth["listeners"] <= LEAK_MAX_LISTENERS_PER_CYCLE, growth
+    assert growth["dom_nodes"] <= LEAK_MAX_NODES_PER_CYCLE, growth
+
+
+@pytest.mark.storage_snapshot("one_profile")
+class TestRepeatedCycles:
+    """Repeat an interaction many times and watch heap and listener growth."""
+
+    def test_l01_start_stop_timer(self, page, base_url):
+        """L01: Starting and stopping the timer does not leak."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        def cycle():
+            page.click(SEL["start_btn"])
+            page.wait_for_selector(".status-badge.working")
+            page.click(SEL["stop_btn"])
+            page.wait_for_selector(".status-badge.idle")
+
+        assert_no_leak(measure_growth(page, cycle))
+
+    def test_l02_open_close_settings(self, page, base_url):
+        """L02: Opening and closing settings does not leak."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        def cycle():
+            page.click(SEL["settings_btn"])
+            page.wait_for_selector(SEL["settings_panel"])
+            page.click(SEL["close_btn"])
+            page.wait_for_selector(SEL["settings_panel"], state="detached")
+
+        assert_no_leak(measure_growth(page, cycle))
+
+    def test_l03_play_switch_soundscape(self, page, base_url):
+        """L03: Playing and switching soundscapes does not leak."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.click(SEL["settings_btn"])
+        page.wait_for_selector(SEL["settings_panel"])
+        page.click(f"{SEL['music_btn']}:has-text('Música')")
+        page.wait_for_selector(SEL["music_player"])
+
+        tracks = page.locator(f"{SEL['track_card']}:not(.locked)")
+        state = {"next": 0}
+
+        def cycle():
+            tracks.nth(state["next"]).click()
+            state["next"] = 1 - state["next"]
+
+        assert_no_leak(measure_growth(page, cycle))
+
+    def test_l04_celebrate_dismiss(self, page, base_url):
+        """L04: Showing and dismissing the celebration does not leak."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        def cycle():
+            page.evaluate("""window.dispatchEvent(new CustomEvent('timer-event', {
+                detail: { type: 'pomodoro-complete' }
+            }))""")
+            page.wait_for_selector(".celebration-overlay")
+            page.click(".dismiss-btn")
+            page.wait_for_selector(".celebration-overlay", state="detached")
+
+        assert_no_leak(measure_growth(page, cycle))
@@ -0,0 +1,56 @@
+"""Bundle Weight Tests - W01-W05"""
+import pytest
+from config import BUNDLE_BUDGETS
+from utils.bundle_report import run
+
+LAZY_PANELS = ["SettingsPanel", "RewardsShop", "BadgesDisplay", "MusicPlayer", "YouTubePlayer"]
+
+pytestmark = pytest.mark.no_app
+
+
+@pytest.fixture(scope="module")
+def report():
+    """Measure the production build once for the module.
+
+    Not saved: only npm run bundle:report moves the report it diffs against.
+    """
+    report, _ = run(write=False)
+    return report
+
+
+class TestBundleBudgets:
+    """Production build size against BUNDLE_BUDGETS."""
+
+    def test_w01_js_within_budget(self, report):
+        """W01: Total gzipped JS and the largest chunk stay within budget."""
+        assert report["totals"]["js"]["gzip"] <= BUNDLE_BUDGETS["js_gzip_total"]
+        assert report["largest_js_gzip"] <= BUNDLE_BUDGETS["largest_js_gzip"], report["largest_js"]
+
+    def test_w02_css_within_budget(self, report):
+        """W02: Total gzipped CSS stays within budget."""
+        assert report["totals"]["css"]["gzip"] <= BUNDLE_BUDGETS["css_gzip_total"]
+
+    def test_w03_images_within_budget(self, report):
+        """W03: Avatar, animal and break images stay within budget."""
+        assert "avatars" in report["images"]
+        assert report["totals"]["images"]["raw"] <= BUNDLE_BUDGETS["images_raw_total"]
+
+    def test_w04_chunks_attributed_to_sources(self, report):
+        """W04: Every JS chunk is traced back to its source module."""
+        assert report["chunks"]
+        for key, chunk in report["chunks"].items():
+            if chunk["type"] == "js":
+                assert chunk["sources"], key
+
+    def test_w05_lazy_panels_not_in_initial_load(self, report):
+        """W05: Modal panels are split out of the initial payload."""
+        assert report["initial"]["gzip"] <= BUNDLE_BUDGETS["initial_gzip"]
+        initial_sources = [
+            src for chunk in report["chunks"].values() if chunk.get("initial")
+            for src in chunk["sources"]
+        ]
+        for panel in LAZY_PANELS:
+            assert not any(panel in src for src in initial_sources), panel
+            assert any(
+                panel in src for chunk in report["chunks"].values() for src in chunk["sources"]
+            ), f"{panel} has no chunk of its own"
@@ -0,0 +1,103 @@
+"""Lazy Loading Tests - LZ01-LZ06"""
+import time
+
+import pytest
+from config import MODAL_OPEN_BUDGET_MS, SEL
+
+RESOURCE_LOADED = """
+(name) => performance.getEntriesByType('resource').some(e => e.name.includes(name))
+"""
+
+
+def chunk_loaded(page, name: str) -> bool:
+    return page.evaluate(RESOURCE_LOADED, name)
+
+
+def open_modal_ms(page, button: str, content: str) -> float:
+    """Click a header button and time until the modal content is visible.
+
+    dispatch_event skips the hover a real click would do, so nothing is
+    prefetched unless the test did it first.
+    """
+    start = time.perf_counter()
+    page.dispatch_event(button, "click")
+    page.wait_for_selector(content)
+    return (time.perf_counter() - start) * 1000
+
+
+class TestLazyPanels:
+    """Modal panels load on demand instead of at startup."""
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_lz01_panels_not_loaded_at_startup(self, page, base_url):
+        """LZ01: Settings, shop and badges chunks are not fetched at startup."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        for name in ["SettingsPanel", "RewardsShop", "BadgesDisplay", "MusicPlayer", "YouTubePlayer"]:
+            assert not chunk_loaded(page, name), f"{name} loaded at startup"
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_lz02_hover_prefetches_panel(self, page, base_url):
+        """LZ02: Hovering or focusing a header button prefetches its panel."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        page.hover(SEL["settings_btn"])
+        page.wait_for_function(RESOURCE_LOADED, arg="SettingsPanel")
+        page.focus(SEL["points_btn"])
+        page.wait_for_function(RESOURCE_LOADED, arg="RewardsShop")
+
+        assert not chunk_loaded(page, "BadgesDisplay")
+        assert page.locator(SEL["settings_panel"]).count() == 0
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_lz03_prefetched_modal_opens_within_budget(self, page, base_url):
+        """LZ03: A modal opens within budget once its panel is prefetched."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.hover(SEL["badges_btn"])
+        page.wait_for_function(RESOURCE_LOADED, arg="BadgesDisplay")
+
+        elapsed = open_modal_ms(page, SEL["badges_btn"], SEL["badges_display"])
+
+        assert elapsed <= MODAL_OPEN_BUDGET_MS["prefetched"], f"{elapsed:.0f}ms"
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_lz04_cold_modal_opens_within_budget(self, page, base_url):
+        """LZ04: A modal opened without prefetch still opens within budget."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        elapsed = open_modal_ms(page, SEL["points_btn"], SEL["rewards_shop"])
+
+        assert elapsed <= MODAL_OPEN_BUDGET_MS["cold"], f"{elapsed:.0f}ms"
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_lz05_failed_load_shows_error_state(self, page, base_url):
+        """LZ05: A panel that fails to download shows an error, not a blank modal."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.route("**/*SettingsPanel*", lambda route: route.abort())
+
+        page.dispatch_event(SEL["settings_btn"], "click")
+
+        page.wait_for_selector(".modal .loading-panel.failed")
+        assert page.locator(SEL["settings_panel"]).count() == 0
+
+
+class TestLazyThemes:
+    """Theme stylesheets load on demand."""
+
+    @pytest.mark.storage_snapshot("rich_profile")
+    def test_lz06_only_active_theme_loaded_at_startup(self, page, base_url):
+        """LZ06: Only the active theme's stylesheet loads before the app is ready."""
+        page.wait_for_selector(SEL["timer_display"])
+
+        loaded = page.evaluate("""() => {
+            const ready = performance.getEntriesByName('app-ready')[0].startTime
+            return performance.getEntriesByType('resource')
+                .filter((e) => e.startTime < ready && /\\.css(\\?|$)/.test(e.name))
+                .map((e) => e.name)
+        }""")
+        theme = page.locator("html").get_attribute("data-theme")
+        others = ["divertido", "minimalista", "floresta", "espaco", "oceano", "doces"]
+        others.remove(theme)
+
+        assert any(f"/{theme}" in name for name in loaded), loaded
+        assert not any(f"/{other}" in name for other in others for name in loaded), loaded
@@ -0,0 +1,114 @@
+"""Session History Tests - H01-H04"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from config import SEL
+from utils.app_ready import wait_for_app_ready
+from utils.data_scale import build_history
+from utils.storage_helpers import (
+    READ_HISTORY_SCRIPT,
+    build_profile,
+    build_storage_data,
+    get_history,
+    get_storage_data,
+    set_storage_data,
+)
+
+HISTORY_MIGRATED = "JSON.parse(localStorage.getItem('kids-timer:history') || '[]').length === 0"
+
+
+def boot_with_history(page, history):
+    """Reload the app with a legacy document holding the given sessions."""
+    profile = build_profile()
+    data = build_storage_data([profile], profile["id"])
+    data["sessionHistory"] = history
+    set_storage_data(page, data)
+    page.reload()
+    wait_for_app_ready(page)
+    page.wait_for_function(HISTORY_MIGRATED)
+
+
+def wait_for_sessions(page, count: int):
+    """Wait until the IndexedDB history holds exactly `count` sessions."""
+    page.wait_for_function(
+        f"async () => (await ({READ_HISTORY_SCRIPT})()).sessions.length === {count}"
+    )
+
+
+def iso_days_ago(days: int) -> str:
+    when = datetime.now(timezone.utc) - timedelta(days=days)
+    return when.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class TestIndexedDbHistory:
+    """Session history is kept in IndexedDB with daily rollups."""
+
+    @pytest.mark.storage_snapshot("one_profile")
+    def test_h01_completion_recorded(self, page, base_url, fast_clock):
+        """H01: A completed session is stored in IndexedDB and counted in its rollup."""
+        page.wait_for_selector(SEL["timer_display"])
+        page.click(SEL["preset_custom"])
+        page.wait_for_selector(SEL["custom_inputs"])
+        page.locator(f"{SEL['custom_inputs']} {SEL['number_input']}").first.fill("1")
+        page.click(SEL["start_btn"])
+        page.wait_for_selector(".status-badge.working")
+
+        fast_clock.run_until("break")
+        wait_for_sessions(page, 1)
+
+        history = get_history(page)
+        assert len(history["sessions"]) == 1
+        session = history["sessions"][0]
+        assert session["profileId"] == "test-profile-001"
+        assert session["workDuration"] == 1
+        assert history["rollups"] == [{
+            "profileId": "test-profile-001",
+            "day": session["date"][:10],
+            "pomodoros": 1,
+            "workMinutes": 1,
+            "breakMinutes": session["breakDuration"],
+        }]
+        assert get_storage_data(page)["sessionHistory"] == []
+
+    def test_h02_legacy_history_migrated(self, page, base_url):
+        """H02: Sessions in the legacy localStorage array move to IndexedDB."""
+        legacy = build_history(200, ["test-profile-001"])
+        boot_with_history(page, legacy)
+
+        history = get_history(page)
+        assert len(history["sessions"]) == 200
+        assert sum(r["pomodoros"] for r in history["rollups"]) == 200
+        assert sum(r["workMinutes"] for r in history["rollups"]) == sum(
+            s["workDuration"] for s in legacy
+        )
+
+    def test_h03_migration_is_idempotent(self, page, base_url):
+        """H03: Importing sessions that are already stored does not double count."""
+        legacy = build_history(50, ["test-profile-001"])
+        boot_with_history(page, legacy)
+        boot_with_history(page, legacy)
+
+        history = get_history(page)
+        assert len(history["sessions"]) == 50
+        assert sum(r["pomodoros"] for r in history["rollups"]) == 50
+
+    def test_h04_old_sessions_pruned_by_range(self, page, base_url):
+        """H04: Sessions and rollups past the retention window are pruned."""
+        legacy = [
+            {
+                "profileId": "test-profile-001",
+                "date": iso_days_ago(days),
+                "type": "pomodoro",
+                "workDuration": 25,
+                "breakDuration": 5,
+                "completed": True,
+            }
+            for days in (400, 380, 200, 31, 1)
+        ]
+        boot_with_history(page, legacy)
+        wait_for_sessions(page, 3)
+
+        history = get_history(page)
+        dates = sorted(s["date"] for s in history["sessions"])
+        assert dates == sorted(s["date"] for s in legacy[2:])
+        assert len(history["rollups"]) == 3
@@ -0,0 +1,64 @@
+"""Render Tests - R01-R03"""
+import pytest
+from config import RENDER_UPDATES_PER_TICK, SEL
+from utils.storage_helpers import create_profile
+from utils.app_ready import wait_for_app_ready
+
+INDICATOR_COMPONENTS = {
+    "circular": "CircularProgress",
+    "animal-path": "AnimalPath",
+    "hourglass": "Hourglass",
+    "progress-bar": "ProgressBar",
+}
+TICKS = 10
+
+
+def start_with_indicator(page, indicator):
+    create_profile(page, progress_indicator=indicator)
+    page.reload()
+    wait_for_app_ready(page)
+    page.wait_for_selector(SEL["timer_display"])
+    page.click(SEL["start_btn"])
+    page.wait_for_selector(".status-badge.working")
+
+
+class TestTickRendering:
+    """Tests for what a timer tick re-renders."""
+
+    @pytest.mark.parametrize("indicator", list(INDICATOR_COMPONENTS))
+    def test_r01_tick_update_budget(self, page, base_url, fast_clock, render_stats, indicator):
+        """R01: A tick updates at most the clock and the progress indicator."""
+        start_with_indicator(page, indicator)
+        fast_clock.advance(2)
+
+        render_stats.reset()
+        fast_clock.advance(TICKS)
+        updates = render_stats.updates()
+
+        # The clock re-renders once per tick, so it counts the ticks
+        ticks = updates.get("TimerClock", 0)
+        assert ticks >= TICKS, updates
+        assert sum(updates.values()) <= RENDER_UPDATES_PER_TICK * ticks, updates
+        assert set(updates) <= {"TimerClock", INDICATOR_COMPONENTS[indicator]}, updates
+
+    def test_r02_header_not_updated_by_ticks(self, page, base_url, fast_clock, render_stats):
+        """R02: The app shell and header don't re-render while the timer runs."""
+        start_with_indicator(page, "circular")
+
+        render_stats.reset()
+        fast_clock.advance(TICKS)
+        updates = render_stats.updates()
+
+        assert "App" not in updates, updates
+        assert "TimerDisplay" not in updates, updates
+
+    def test_r03_status_change_updates_display(self, page, base_url, fast_clock, render_stats):
+        """R03: Status changes still reach the display (counters are live)."""
+        start_with_indicator(page, "circular")
+        fast_clock.advance(2)
+
+        render_stats.reset()
+        page.click(SEL["pause_btn"])
+        page.wait_for_selector(".status-badge.paused")
+
+        assert render_stats.updates().get("TimerDisplay", 0) >= 1
@@ -0,0 +1,11 @@
+APP_READY_SELECTOR = "html[data-app-ready='true']"
+
+
+def wait_for_app_ready(page, timeout: float = 10000) -> float:
+    """Wait until main.js has mounted the app and return boot-to-ready in ms.
+
+    Replaces waiting for "networkidle", which adds 500 ms of network quiet
+    and never settles while a soundscape streams.
+    """
+    page.wait_for_selector(APP_READY_SELECTOR, state="attached", timeout=timeout)
+    return page.evaluate("performance.getEntriesByName('app-ready')[0].startTime")
@@ -0,0 +1,128 @@
+import json
+from pathlib import Path
+
+from config import SEL
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils.fast_clock import FastClock
+from utils.storage_snapshots import snapshot_init_script
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+RESULTS_DIR = PROJECT_ROOT / "bench-results"
+
+
+def write_bench_results(name: str, results) -> Path:
+    """Write benchmark results as JSON to bench-results/<name>.json."""
+    RESULTS_DIR.mkdir(exist_ok=True)
+    path = RESULTS_DIR / f"{name}.json"
+    path.write_text(json.dumps(results, indent=2))
+    return path
+
+
+def cdp_session(page):
+    """Open a Chrome DevTools Protocol session for the page."""
+    return page.context.new_cdp_session(page)
+
+
+def set_cpu_throttling(page, rate: float):
+    """Slow the page's CPU down by the given factor (1 = no throttling)."""
+    session = cdp_session(page)
+    session.send("Emulation.setCPUThrottlingRate", {"rate": rate})
+    return session
+
+
+class HiddenPage:
+    """Handle returned by hide_page; close() makes the page visible again."""
+
+    def __init__(self, session, window_id):
+        self.session = session
+        self.window_id = window_id
+
+    def close(self):
+        self.session.send("Browser.setWindowBounds", {
+            "windowId": self.window_id, "bounds": {"windowState": "normal"},
+        })
+        self.session.send("Emulation.setFocusEmulationEnabled", {"enabled": True})
+        self.session.detach()
+
+
+def hide_page(page, timeout: int = 5000) -> HiddenPage:
+    """Hide the page the way a minimized browser window is hidden.
+
+    Another tab in front does not hide anything in headless Chromium, so this
+    turns off focus emulation (which keeps headless pages focused) and
+    minimizes the page's window over CDP, then waits up to `timeout` ms for
+    document.visibilityState to turn 'hidden'. Callers should check it before
+    measuring. Returns a handle; close() shows the page again.
+    """
+    session = cdp_session(page)
+    session.send("Emulation.setFocusEmulationEnabled", {"enabled": False})
+    window_id = session.send("Browser.getWindowForTarget")["windowId"]
+    session.send("Browser.setWindowBounds", {
+        "windowId": window_id, "bounds": {"windowState": "minimized"},
+    })
+    try:
+        # Polled on a timer: a hidden page runs no animation frames
+        page.wait_for_function(
+            "document.visibilityState === 'hidden'", polling=100, timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        pass
+    return HiddenPage(session, window_id)
+
+
+def block_main_thread(page, block_ms: int, every_ms: int):
+    """Block the page's main thread for block_ms every every_ms."""
+    page.evaluate(
+        """([blockMs, everyMs]) => {
+            setInterval(() => {
+                const end = performance.now() + blockMs
+                while (performance.now() < end) {}
+            }, everyMs)
+        }""",
+        [block_ms, every_ms],
+    )
+
+
+def start_custom_session(page, work_minutes: int, break_minutes: int = 1):
+    """Start a work session with custom durations from the idle timer screen."""
+    page.wait_for_selector(SEL["timer_display"])
+    page.click(SEL["preset_custom"])
+    page.wait_for_selector(SEL["custom_inputs"])
+    inputs = page.locator(f"{SEL['custom_inputs']} {SEL['number_input']}")
+    inputs.nth(0).fill(str(work_minutes))
+    inputs.nth(1).fill(str(break_minutes))
+    page.click(SEL["start_btn"])
+    page.wait_for_selector(".status-badge.working")
+
+
+def parse_display_time(text: str) -> int:
+    """Convert an mm:ss timer display into seconds."""
+    mins, secs = text.strip().split(":")
+    return int(mins) * 60 + int(secs)
+
+
+def boot_with_storage(browser, base_url, data, ready, fast_clock=False, init_scripts=()):
+    """Cold-boot the app in a new context already holding `data`.
+
+    Returns (context, page, metrics) where metrics has the blob size, the
+    time from navigation start until `ready` is true, and any seeding error
+    such as a localStorage quota overflow.
+
+    init_scripts run before the app, after storage is seeded.
+    """
+    blob = json.dumps(data)
+    context = browser.new_context()
+    page = context.new_page()
+    if fast_clock:
+        FastClock(page).install()
+    page.add_init_script(snapshot_init_script(blob))
+    for script in init_scripts:
+        page.add_init_script(script)
+    page.goto(base_url)
+    page.wait_for_function(ready, timeout=60000)
+    metrics = {
+        "blob_bytes": len(blob),
+        "boot_ms": round(page.evaluate("performance.now()"), 1),
+        "seed_error": page.evaluate("window.__snapshotError || null"),
+    }
+    return context, page, metrics
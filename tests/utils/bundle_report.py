@@ -0,0 +1,208 @@
+"""Size report for the production build.
+
+Run directly to print the report, the change since the last run and any
+budget in config.BUNDLE_BUDGETS it exceeds:
+
+    python tests/utils/bundle_report.py
+"""
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: brotli sizes are reported as None
+    brotli = None
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config import BUNDLE_BUDGETS
+from utils.bench import RESULTS_DIR
+from utils.static_server import DIST_DIR, ensure_build
+
+REPORT_FILE = RESULTS_DIR / "bundle-report.json"
+MANIFEST_FILE = DIST_DIR / ".vite" / "manifest.json"
+IMAGE_DIRS = ["avatars", "animals", "break"]
+HASH_PATTERN = re.compile(r"-[A-Za-z0-9_-]{8}(?=\.\w+$)")
+
+
+def sizes(data: bytes) -> dict:
+    """Raw, gzip (level 9) and brotli (quality 11) sizes in bytes."""
+    return {
+        "raw": len(data),
+        "gzip": len(gzip.compress(data, compresslevel=9)),
+        "brotli": len(brotli.compress(data, quality=11)) if brotli else None,
+    }
+
+
+def add_sizes(total: dict, item: dict):
+    for key in ("raw", "gzip", "brotli"):
+        if item[key] is None or total.get(key, 0) is None:
+            total[key] = None
+        else:
+            total[key] = total.get(key, 0) + item[key]
+
+
+def chunk_sources(manifest: dict) -> dict:
+    """Map each emitted file to the source modules that produced it."""
+    sources = {}
+    for src, entry in manifest.items():
+        sources.setdefault(entry["file"], []).append(src)
+        for css in entry.get("css", []):
+            sources.setdefault(css, []).append(src)
+    return sources
+
+
+def initial_files(manifest: dict) -> set:
+    """Files loaded on first paint: entry chunks and their static imports.
+
+    Dynamic imports (lazy panels) are left out.
+    """
+    files = set()
+    stack = [key for key, entry in manifest.items() if entry.get("isEntry")]
+    seen = set()
+    while stack:
+        key = stack.pop()
+        if key in seen:
+            continue
+        seen.add(key)
+        entry = manifest[key]
+        files.add(entry["file"])
+        files.update(entry.get("css", []))
+        stack.extend(entry.get("imports", []))
+    return files
+
+
+def build_report(dist: Path = DIST_DIR) -> dict:
+    """Measure every JS/CSS chunk and every image directory in dist/."""
+    manifest = json.loads(MANIFEST_FILE.read_text()) if MANIFEST_FILE.exists() else {}
+    sources = chunk_sources(manifest)
+
+    chunks = {}
+    totals = {"js": {}, "css": {}, "images": {}}
+    for path in sorted((dist / "assets").iterdir()):
+        kind = path.suffix.lstrip(".")
+        if kind not in ("js", "css"):
+            continue
+        file = f"assets/{path.name}"
+        srcs = sorted(sources.get(file, []))
+        # Stable across builds: the source module, else the unhashed name
+        key = f"{srcs[0]} ({kind})" if srcs else HASH_PATTERN.sub("", file)
+        chunk = {"file": file, "type": kind, "sources": srcs, **sizes(path.read_bytes())}
+        chunks[key] = chunk
+        add_sizes(totals[kind], chunk)
+
+    images = {}
+    for name in IMAGE_DIRS:
+        root = dist / "images" / name
+        for group, files in (
+            (name, [p for p in root.glob("*") if p.is_file()]),
+            (f"{name}/fantasia", list((root / "fantasia").glob("*"))),
+        ):
+            if not files:
+                continue
+            group_sizes = {"files": len(files)}
+            for file in files:
+                add_sizes(group_sizes, sizes(file.read_bytes()))
+            images[group] = group_sizes
+            add_sizes(totals["images"], group_sizes)
+
+    initial = initial_files(manifest)
+    initial_sizes = {}
+    for chunk in chunks.values():
+        if chunk["file"] in initial:
+            add_sizes(initial_sizes, chunk)
+            chunk["initial"] = True
+
+    largest_js = max(
+        (c for c in chunks.values() if c["type"] == "js"),
+        key=lambda c: c["gzip"],
+        default=None,
+    )
+    return {
+        "chunks": chunks,
+        "images": images,
+        "totals": totals,
+        "initial": initial_sizes,
+        "largest_js": largest_js["file"] if largest_js else None,
+        "largest_js_gzip": largest_js["gzip"] if largest_js else 0,
+    }
+
+
+def diff_reports(previous: dict, current: dict) -> dict:
+    """Gzip size change per chunk/image group; None marks added or removed."""
+    diff = {}
+    for section in ("chunks", "images"):
+        before, after = previous.get(section, {}), current.get(section, {})
+        for key in sorted(set(before) | set(after)):
+            old = before.get(key, {}).get("gzip")
+            new = after.get(key, {}).get("gzip")
+            if old != new:
+                diff[key] = {
+                    "before": old,
+                    "after": new,
+                    "change": None if old is None or new is None else new - old,
+                }
+    return diff
+
+
+def check_budgets(report: dict, budgets: dict) -> list:
+    """List every budget the report exceeds."""
+    measured = {
+        "js_gzip_total": report["totals"]["js"].get("gzip", 0),
+        "css_gzip_total": report["totals"]["css"].get("gzip", 0),
+        "largest_js_gzip": report["largest_js_gzip"],
+        "initial_gzip": report["initial"].get("gzip", 0),
+        "images_raw_total": report["totals"]["images"].get("raw", 0),
+    }
+    return [
+        f"{name}: {measured[name]} > {limit}"
+        for name, limit in budgets.items()
+        if measured.get(name, 0) > limit
+    ]
+
+
+def run(write: bool = True) -> tuple:
+    """Build if needed, measure, diff against the previous run and save.
+
+    Returns (report, diff).
+    """
+    ensure_build()
+    report = build_report()
+    previous = json.loads(REPORT_FILE.read_text()) if REPORT_FILE.exists() else {}
+    diff = diff_reports(previous, report)
+    if write:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        REPORT_FILE.write_text(json.dumps(report, indent=2))
+    return report, diff
+
+
+def _fmt(size) -> str:
+    return "-" if size is None else f"{size / 1024:.1f} KB"
+
+
+def main():
+    report, diff = run()
+    print(f"{'chunk / directory':<50} {'raw':>10} {'gzip':>10} {'brotli':>10}")
+    for key, item in list(report["chunks"].items()) + list(report["images"].items()):
+        print(f"{key:<50} {_fmt(item['raw']):>10} {_fmt(item['gzip']):>10} {_fmt(item['brotli']):>10}")
+    for kind, total in list(report["totals"].items()) + [("initial load", report["initial"])]:
+        print(f"{'TOTAL ' + kind:<50} {_fmt(total.get('raw')):>10} "
+              f"{_fmt(total.get('gzip')):>10} {_fmt(total.get('brotli')):>10}")
+    if diff:
+        print("\nChanged since last run (gzip):")
+        for key, change in diff.items():
+            delta = "added/removed" if change["change"] is None else f"{change['change']:+d} B"
+            print(f"  {key}: {_fmt(change['before'])} -> {_fmt(change['after'])} ({delta})")
+    over = check_budgets(report, BUNDLE_BUDGETS)
+    if over:
+        print("\nOver budget (bytes):")
+        for line in over:
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
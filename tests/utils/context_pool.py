@@ -0,0 +1,72 @@
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+# Everything the app can persist, except the service worker registration
+# itself, which is worth keeping warm between tests
+CLEARED_STORAGE = "local_storage,indexeddb,cache_storage,websql,file_systems"
+
+
+class ContextPool:
+    """Keep warm browser contexts per viewport and reset them between tests.
+
+    A recycled context keeps its HTTP cache, compiled scripts and service
+    worker registration; storage, cookies, permissions and routes are reset
+    so tests still start from a clean slate.
+    """
+
+    def __init__(self, browser, size: int, base_url: str):
+        parts = urlsplit(base_url)
+        self.browser = browser
+        self.size = size
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.idle = defaultdict(list)
+
+    @staticmethod
+    def _key(viewport):
+        return (viewport["width"], viewport["height"]) if viewport else None
+
+    def acquire(self, viewport=None):
+        """Get a context for the viewport. Returns (context, recycled)."""
+        idle = self.idle[self._key(viewport)]
+        if idle:
+            return idle.pop(), True
+        options = {"viewport": viewport} if viewport else {}
+        return self.browser.new_context(**options), False
+
+    def release(self, context, viewport=None, reusable=True):
+        """Reset the context and keep it warm, or close it.
+
+        Contexts with state that cannot be undone (e.g. an installed fake
+        clock) must be released with reusable=False.
+        """
+        idle = self.idle[self._key(viewport)]
+        if not reusable or len(idle) >= self.size:
+            context.close()
+            return
+        try:
+            self.reset(context)
+        except Exception:
+            context.close()
+            return
+        idle.append(context)
+
+    def reset(self, context):
+        """Clear storage, caches, cookies, permissions and routes, close pages."""
+        page = context.pages[0] if context.pages else context.new_page()
+        session = context.new_cdp_session(page)
+        session.send("Storage.clearDataForOrigin", {
+            "origin": self.origin,
+            "storageTypes": CLEARED_STORAGE,
+        })
+        session.detach()
+        for open_page in list(context.pages):
+            open_page.close()
+        context.clear_cookies()
+        context.clear_permissions()
+        context.unroute_all(behavior="ignoreErrors")
+
+    def close(self):
+        for contexts in self.idle.values():
+            for context in contexts:
+                context.close()
+        self.idle.clear()
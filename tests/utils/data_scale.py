@@ -0,0 +1,76 @@
+import random
+import string
+from datetime import datetime, timedelta, timezone
+
+from utils.storage_helpers import build_profile, build_storage_data
+
+
+def _video_id(rng) -> str:
+    return "".join(rng.choice(string.ascii_letters + string.digits + "-_") for _ in range(11))
+
+
+def build_history(count: int, profile_ids: list, days: int = 29, seed: int = 0) -> list:
+    """Build session history entries spread over the last `days` days.
+
+    Dates stay inside the app's retention windows (30 days in localStorage,
+    a year in IndexedDB) so nothing is pruned and every entry is measured.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    history = []
+    for i in range(count):
+        when = now - timedelta(seconds=rng.randint(60, days * 24 * 60 * 60))
+        work = rng.choice([25, 50])
+        history.append({
+            "profileId": profile_ids[i % len(profile_ids)],
+            "date": when.isoformat().replace("+00:00", "Z"),
+            "type": "pomodoro",
+            "workDuration": work,
+            "breakDuration": work // 5,
+            "completed": True,
+        })
+    history.sort(key=lambda s: s["date"])
+    return history
+
+
+def build_videos(count: int, seed: int = 0) -> list:
+    """Build saved YouTube videos in the shape youtube.loadVideo() stores."""
+    rng = random.Random(seed)
+    videos = []
+    for i in range(count):
+        video_id = _video_id(rng)
+        videos.append({
+            "id": video_id,
+            "title": f"YouTube - {video_id[:8]}...",
+            "addedAt": 1735689600000 + i * 60000,
+        })
+    return videos
+
+
+def build_scaled_storage(
+    history: int = 0,
+    profiles: int = 1,
+    videos: int = 0,
+    active: bool = True,
+    seed: int = 0,
+) -> dict:
+    """Build a kids-timer-data document scaled along independent axes.
+
+    history: sessionHistory entries, profiles: profile count,
+    videos: savedYoutubeVideos entries. With active=False no profile is
+    selected, so the app boots into the ProfileSelector.
+    """
+    profile_list = [
+        build_profile(
+            profile_id=f"scale-profile-{i + 1:05d}",
+            name=f"Perfil {i + 1}",
+            total_pomodoros=i % 50,
+            points=(i * 7) % 300,
+        )
+        for i in range(profiles)
+    ]
+    profile_ids = [p["id"] for p in profile_list]
+    data = build_storage_data(profile_list, profile_ids[0] if active else None)
+    data["sessionHistory"] = build_history(history, profile_ids, seed=seed)
+    data["savedYoutubeVideos"] = build_videos(videos, seed=seed)
+    return data
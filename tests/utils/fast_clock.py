@@ -0,0 +1,47 @@
+import re
+
+
+class FastClock:
+    """Virtual clock driving Date.now(), setInterval and setTimeout in the page.
+
+    Wraps Playwright's page.clock so timer tests can jump through a whole
+    work/break cycle instead of waiting for it in real time.
+    """
+
+    def __init__(self, page):
+        self.page = page
+
+    def install(self):
+        """Install fake timers. Takes effect for the next app boot."""
+        self.page.clock.install()
+
+    def advance(self, seconds: float):
+        """Move virtual time forward, firing every timer that falls due."""
+        self.page.clock.run_for(int(seconds * 1000))
+
+    def remaining_seconds(self) -> int:
+        """Read the time shown in .timer-time as a number of seconds."""
+        text = self.page.locator(".timer-time").first.text_content() or ""
+        match = re.search(r"(\d+):(\d{2})", text)
+        if not match:
+            return 0
+        return int(match.group(1)) * 60 + int(match.group(2))
+
+    def run_until(self, status: str, max_seconds: int = 3 * 60 * 60):
+        """Advance virtual time until the timer reaches the given status.
+
+        status is one of the .status-badge classes: idle, working, break or
+        paused. Each step jumps straight to the displayed end of the current
+        phase, so a 50/10 cycle takes a handful of round trips.
+        """
+        selector = f".status-badge.{status}"
+        elapsed = 0
+        while self.page.locator(selector).count() == 0:
+            if elapsed >= max_seconds:
+                raise TimeoutError(
+                    f"Timer did not reach '{status}' within {max_seconds}s of virtual time"
+                )
+            step = max(1, self.remaining_seconds())
+            self.advance(step)
+            elapsed += step
+        self.page.wait_for_selector(selector)
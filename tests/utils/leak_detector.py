@@ -0,0 +1,90 @@
+import json
+
+from utils.bench import cdp_session
+
+
+def slope(points: list) -> float:
+    """Least-squares slope of (x, y) points: growth of y per unit of x."""
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    num = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    den = sum((x - mean_x) ** 2 for x, _ in points)
+    return num / den if den else 0.0
+
+
+class HeapProbe:
+    """Measure retained heap and event listener counts through CDP."""
+
+    def __init__(self, page):
+        self.page = page
+        self.session = cdp_session(page)
+        self.session.send("HeapProfiler.enable")
+        self._chunks = []
+        self.session.on(
+            "HeapProfiler.addHeapSnapshotChunk",
+            lambda event: self._chunks.append(event["chunk"]),
+        )
+
+    def collect_garbage(self):
+        self.session.send("HeapProfiler.collectGarbage")
+
+    def retained_size(self) -> int:
+        """Total self size of every node in a heap snapshot, in bytes."""
+        self._chunks = []
+        self.session.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+        snapshot = json.loads("".join(self._chunks))
+        self._chunks = []
+        fields = snapshot["snapshot"]["meta"]["node_fields"]
+        offset = fields.index("self_size")
+        nodes = snapshot["nodes"]
+        return sum(nodes[i + offset] for i in range(0, len(nodes), len(fields)))
+
+    def listener_count(self) -> int:
+        """Event listeners on window plus everything in the document tree."""
+        total = 0
+        for expression, depth in (("window", 0), ("document", -1)):
+            obj = self.session.send("Runtime.evaluate", {"expression": expression})
+            listeners = self.session.send("DOMDebugger.getEventListeners", {
+                "objectId": obj["result"]["objectId"],
+                "depth": depth,
+                "pierce": True,
+            })
+            total += len(listeners["listeners"])
+        return total
+
+    def sample(self) -> dict:
+        """Force GC, then measure retained heap, listeners and DOM size."""
+        self.collect_garbage()
+        self.collect_garbage()
+        return {
+            "retained_bytes": self.retained_size(),
+            "listeners": self.listener_count(),
+            "dom_nodes": self.page.evaluate("document.getElementsByTagName('*').length"),
+        }
+
+
+def measure_growth(page, cycle, checkpoints=(10, 20, 30), warmup=3) -> dict:
+    """Run `cycle` repeatedly and report per-cycle growth of each measurement.
+
+    The warm-up cycles let lazy singletons (audio element, components,
+    caches) settle so only per-cycle growth remains.
+    """
+    probe = HeapProbe(page)
+    for _ in range(warmup):
+        cycle()
+
+    samples = [(0, probe.sample())]
+    done = 0
+    for target in checkpoints:
+        while done < target:
+            cycle()
+            done += 1
+        samples.append((done, probe.sample()))
+
+    growth = {
+        key: slope([(n, s[key]) for n, s in samples])
+        for key in samples[0][1]
+    }
+    growth["samples"] = samples
+    return growth
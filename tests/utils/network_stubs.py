@@ -0,0 +1,201 @@
+import base64
+import io
+import re
+import threading
+import time
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 1x1 transparent PNG for YouTube thumbnails
+BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+
+def silent_wav(seconds: float = 2.0, rate: int = 8000) -> bytes:
+    """Generate a mono 16-bit silent WAV file."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * rate))
+    return buffer.getvalue()
+
+
+class NetworkKnobs:
+    """Latency and bandwidth applied by the stubs.
+
+    latency_ms delays the first audio byte and the YouTube API load,
+    bandwidth_kbps caps audio transfer speed (None = unlimited) and
+    yt_ready_ms delays the fake player's onReady/onStateChange events.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.latency_ms = 0
+        self.bandwidth_kbps = None
+        self.yt_ready_ms = 50
+
+
+class MediaRequestHandler(BaseHTTPRequestHandler):
+    """Serve the silent track with HTTP range support, throttled by the knobs."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.server.audio
+        knobs = self.server.knobs
+        time.sleep(knobs.latency_ms / 1000)
+
+        start, end = 0, len(body) - 1
+        match = re.match(r"bytes=(\d*)-(\d*)", self.headers.get("Range", ""))
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                if match.group(2):
+                    end = min(int(match.group(2)), end)
+            else:
+                start = max(0, len(body) - int(match.group(2)))
+            if start > end:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        else:
+            self.send_response(200)
+
+        chunk = body[start:end + 1]
+        self.send_header("Content-Type", "audio/wav")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(chunk)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self._write_throttled(chunk, knobs.bandwidth_kbps)
+
+    def _write_throttled(self, data: bytes, bandwidth_kbps):
+        if not bandwidth_kbps:
+            self.wfile.write(data)
+            return
+        step = 4096
+        bytes_per_second = bandwidth_kbps * 1000 / 8
+        try:
+            for i in range(0, len(data), step):
+                self.wfile.write(data[i:i + step])
+                time.sleep(step / bytes_per_second)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MediaServer:
+    """Local server standing in for the archive.org audio host."""
+
+    def __init__(self, knobs: NetworkKnobs, host="127.0.0.1"):
+        self.httpd = ThreadingHTTPServer((host, 0), MediaRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.audio = silent_wav()
+        self.httpd.knobs = knobs
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# Minimal stand-in for https://www.youtube.com/iframe_api. Implements the
+# parts of YT.Player used by stores/youtube.js and records every player.
+FAKE_YT_API = """
+setTimeout(() => {
+    const READY_MS = %(ready_ms)d
+    const PlayerState = { UNSTARTED: -1, ENDED: 0, PLAYING: 1, PAUSED: 2, BUFFERING: 3, CUED: 5 }
+    window.__ytPlayers = []
+
+    class Player {
+        constructor(elementId, options = {}) {
+            this.options = options
+            this.videoId = options.videoId
+            this.state = PlayerState.UNSTARTED
+            this.volume = 100
+            this.destroyed = false
+            this.element = typeof elementId === 'string' ? document.getElementById(elementId) : elementId
+            window.__ytPlayers.push(this)
+            setTimeout(() => this._emit('onReady', {}), READY_MS)
+        }
+        _emit(name, extra) {
+            if (this.destroyed) return
+            const handler = this.options.events && this.options.events[name]
+            if (handler) handler({ target: this, ...extra })
+        }
+        _setState(state) {
+            this.state = state
+            setTimeout(() => this._emit('onStateChange', { data: state }), READY_MS)
+        }
+        playVideo() { this._setState(PlayerState.PLAYING) }
+        pauseVideo() { this._setState(PlayerState.PAUSED) }
+        stopVideo() { this._setState(PlayerState.CUED) }
+        setVolume(volume) { this.volume = volume }
+        getVolume() { return this.volume }
+        getPlayerState() { return this.state }
+        destroy() { this.destroyed = true }
+    }
+
+    window.YT = { Player, PlayerState }
+    if (typeof window.onYouTubeIframeAPIReady === 'function') {
+        window.onYouTubeIframeAPIReady()
+    }
+}, %(load_ms)d)
+"""
+
+
+class NetworkStubs:
+    """Route-based stubs for every external host the app talks to.
+
+    archive.org audio is redirected to the local MediaServer, the YouTube
+    iframe API is replaced by FAKE_YT_API, thumbnails get a blank PNG and
+    any other YouTube/Google media request is aborted.
+    """
+
+    def __init__(self, media_server: MediaServer, knobs: NetworkKnobs):
+        self.media_server = media_server
+        self.knobs = knobs
+        self.requests = []
+
+    def install(self, context):
+        # Later routes take precedence, so the catch-all goes first
+        context.route(re.compile(r"^https://([\w-]+\.)*(youtube\.com|ytimg\.com|googlevideo\.com)/"),
+                      lambda route: route.abort())
+        context.route(re.compile(r"^https://([\w-]+\.)*archive\.org/"), self._audio)
+        context.route("https://www.youtube.com/iframe_api*", self._youtube_api)
+        context.route("https://img.youtube.com/**", self._thumbnail)
+
+    def _audio(self, route):
+        self.requests.append(route.request.url)
+        path = route.request.url.split("archive.org", 1)[1]
+        route.fulfill(status=302, headers={"Location": self.media_server.url + path})
+
+    def _youtube_api(self, route):
+        self.requests.append(route.request.url)
+        route.fulfill(
+            status=200,
+            content_type="text/javascript",
+            body=FAKE_YT_API % {
+                "load_ms": self.knobs.latency_ms,
+                "ready_ms": self.knobs.yt_ready_ms,
+            },
+        )
+
+    def _thumbnail(self, route):
+        route.fulfill(status=200, content_type="image/png", body=BLANK_PNG)
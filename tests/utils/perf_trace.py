@@ -0,0 +1,190 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from utils.bench import RESULTS_DIR, cdp_session
+
+PAGE_FIXTURES = ["page", "mobile_page", "tablet_page", "desktop_page"]
+
+# Performance.getMetrics counters reported as the change during the test
+DELTA_METRICS = {
+    "ScriptDuration": "script_ms",
+    "LayoutCount": "layout_count",
+    "RecalcStyleCount": "recalc_style_count",
+}
+# Performance.getMetrics values reported as measured at the end of the test
+ABSOLUTE_METRICS = {
+    "JSHeapUsedSize": "js_heap_used",
+    "Nodes": "dom_nodes",
+}
+
+PAINT_SCRIPT = """
+() => {
+    const paint = (name) => performance.getEntriesByName(name)[0]?.startTime ?? null
+    return { first_paint_ms: paint('first-paint'), fcp_ms: paint('first-contentful-paint') }
+}
+"""
+
+# Differences below these are noise, whatever the relative change
+ABSOLUTE_FLOOR = {
+    "script_ms": 20,
+    "layout_count": 5,
+    "recalc_style_count": 5,
+    "js_heap_used": 512 * 1024,
+    "dom_nodes": 50,
+    "fcp_ms": 50,
+    "first_paint_ms": 50,
+}
+
+
+def read_metrics(session) -> dict:
+    metrics = session.send("Performance.getMetrics")["metrics"]
+    return {m["name"]: m["value"] for m in metrics}
+
+
+# Baseline entry used for tests that have none of their own. It is derived
+# from the recorded entries, never written by hand.
+DEFAULT_BASELINE_KEY = "*"
+
+
+def fallback_entry(baseline: dict) -> dict:
+    """Worst recorded value of each metric across the per-test entries."""
+    entry = {}
+    for key, metrics in baseline.items():
+        if key == DEFAULT_BASELINE_KEY:
+            continue
+        for name, value in metrics.items():
+            if value is not None:
+                entry[name] = max(entry.get(name, value), value)
+    return entry
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    """Compare results with the baseline and list metrics that got worse.
+
+    Tests without an entry are checked against the "*" fallback, if any.
+    """
+    regressions = []
+    for key, metrics in results.items():
+        expected = baseline.get(key) or baseline.get(DEFAULT_BASELINE_KEY)
+        if not expected:
+            continue
+        for name, value in metrics.items():
+            before = expected.get(name)
+            if value is None or before is None:
+                continue
+            limit = max(before * (1 + tolerance), before + ABSOLUTE_FLOOR.get(name, 0))
+            if value > limit:
+                regressions.append({
+                    "test": key,
+                    "metric": name,
+                    "baseline": before,
+                    "current": value,
+                })
+    return regressions
+
+
+class PerfTracePlugin:
+    """Record CDP performance metrics per test and compare them to a baseline.
+
+    Enabled with --perf-trace. Wraps each test's call phase, so any test using
+    page, mobile_page, tablet_page or desktop_page is traced unchanged.
+
+    Metrics travel on each report's user_properties, so under pytest-xdist the
+    workers only measure and the controller alone compares and writes files.
+    With --perf-fail a regression fails the session.
+    """
+
+    def __init__(self, config):
+        self.results = {}
+        self.regressions = []
+        self.unrecorded = []
+        self.is_worker = hasattr(config, "workerinput")
+        self.output = RESULTS_DIR / "perf-trace.json"
+        self.baseline_path = Path(config.getoption("--perf-baseline"))
+        self.tolerance = config.getoption("--perf-tolerance")
+        self.update_baseline = config.getoption("--perf-update-baseline")
+        self.fail_on_regression = config.getoption("--perf-fail")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        funcargs = getattr(item, "funcargs", {})
+        traced = []
+        for name in PAGE_FIXTURES:
+            page = funcargs.get(name)
+            if page is None or page.is_closed():
+                continue
+            session = cdp_session(page)
+            session.send("Performance.enable")
+            traced.append((name, page, session, read_metrics(session)))
+
+        yield
+
+        for name, page, session, before in traced:
+            if page.is_closed():
+                continue
+            after = read_metrics(session)
+            metrics = {
+                label: round(after.get(key, 0) - before.get(key, 0), 4)
+                for key, label in DELTA_METRICS.items()
+            }
+            metrics["script_ms"] = round(metrics["script_ms"] * 1000, 1)
+            metrics.update({label: after.get(key) for key, label in ABSOLUTE_METRICS.items()})
+            metrics.update(page.evaluate(PAINT_SCRIPT))
+            session.detach()
+
+            key = item.nodeid if len(traced) == 1 else f"{item.nodeid}::{name}"
+            item.user_properties.append(("perf_trace", {key: metrics}))
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call":
+            return
+        for name, value in report.user_properties:
+            if name == "perf_trace":
+                self.results.update(value)
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker or not self.results:
+            return
+        RESULTS_DIR.mkdir(exist_ok=True)
+
+        baseline = {}
+        if self.baseline_path.exists():
+            baseline = json.loads(self.baseline_path.read_text())
+        self.regressions = find_regressions(self.results, baseline, self.tolerance)
+        self.unrecorded = sorted(key for key in self.results if key not in baseline)
+
+        self.output.write_text(json.dumps({
+            "results": self.results,
+            "regressions": self.regressions,
+        }, indent=2))
+
+        if self.update_baseline:
+            baseline.update(self.results)
+            baseline[DEFAULT_BASELINE_KEY] = fallback_entry(baseline)
+            self.baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+        if self.regressions and self.fail_on_regression:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker:
+            return
+        reporter = terminalreporter
+        reporter.section("performance trace")
+        reporter.write_line(f"{len(self.results)} tests traced, results in {self.output}")
+        if not self.baseline_path.exists():
+            reporter.write_line(
+                f"No baseline at {self.baseline_path}; run with --perf-update-baseline to create it"
+            )
+        elif self.unrecorded:
+            reporter.write_line(
+                f"{len(self.unrecorded)} tests have no baseline entry of their own and were "
+                f"checked against '{DEFAULT_BASELINE_KEY}'; run with --perf-update-baseline to record them"
+            )
+        for r in self.regressions:
+            reporter.write_line(
+                f"REGRESSION {r['test']} {r['metric']}: {r['baseline']} -> {r['current']}",
+                red=True,
+            )
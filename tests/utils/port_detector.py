@@ -1,3 +1,4 @@
+import os
 import socket
 
 
@@ -18,6 +19,26 @@ def find_port(ports=None):
     )
 
 
-def get_base_url():
+def get_worker_id():
+    """Get the pytest-xdist worker id ('gw0', 'gw1', ...) or 'master' when serial."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def get_worker_host(worker_id=None):
+    """Get the hostname a worker should use to reach the dev server.
+
+    Each xdist worker gets its own `<worker>.localhost` subdomain. Chromium
+    resolves `*.localhost` to loopback and Vite accepts it by default, while
+    the browser treats every subdomain as a separate origin, so workers
+    never share the app's localStorage keys.
+    """
+    if worker_id is None:
+        worker_id = get_worker_id()
+    if worker_id == "master":
+        return "localhost"
+    return f"{worker_id}.localhost"
+
+
+def get_base_url(worker_id=None):
     """Get the base URL for the dev server."""
-    return f"http://localhost:{find_port()}"
+    return f"http://{get_worker_host(worker_id)}:{find_port()}"
@@ -0,0 +1,21 @@
+# Turns on the app's component update counters (src/utils/renderStats.js),
+# which production builds only install when this flag is set before boot.
+RENDER_STATS_INIT_SCRIPT = "window.__RENDER_STATS__ = true"
+
+
+class RenderStats:
+    """Counts component re-renders in the app, per component name."""
+
+    def __init__(self, page):
+        self.page = page
+
+    def install(self):
+        """Enable the counters before the app boots. Takes effect for the next navigation."""
+        self.page.add_init_script(RENDER_STATS_INIT_SCRIPT)
+
+    def reset(self):
+        self.page.evaluate("window.__renderStats.reset()")
+
+    def updates(self) -> dict:
+        """Get {component name: update count} since the last reset."""
+        return self.page.evaluate("window.__renderStats.updates")
@@ -0,0 +1,81 @@
+import fcntl
+import hashlib
+import subprocess
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DIST_DIR = PROJECT_ROOT / "dist"
+BASE_PATH = "/kids-timer/"
+
+# Inputs that change the production bundle
+BUILD_INPUTS = ["src", "public", "vite.config.js", "index.html", "package.json"]
+HASH_FILE = DIST_DIR / ".build-hash"
+LOCK_FILE = PROJECT_ROOT / ".build.lock"
+
+
+def source_hash() -> str:
+    """Hash the contents of every build input."""
+    digest = hashlib.sha256()
+    for name in BUILD_INPUTS:
+        path = PROJECT_ROOT / name
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for file in files:
+            if not file.exists():
+                continue
+            digest.update(str(file.relative_to(PROJECT_ROOT)).encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def ensure_build() -> Path:
+    """Run `npm run build` unless dist/ already matches the current sources.
+
+    Guarded by a file lock so parallel workers build at most once.
+    """
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        current = source_hash()
+        if HASH_FILE.exists() and HASH_FILE.read_text() == current:
+            return DIST_DIR
+        subprocess.run(["npm", "run", "build"], cwd=PROJECT_ROOT, check=True)
+        HASH_FILE.write_text(current)
+    return DIST_DIR
+
+
+class DistRequestHandler(SimpleHTTPRequestHandler):
+    """Serve dist/ under the same /kids-timer/ base as GitHub Pages."""
+
+    def do_GET(self):
+        if not self.path.startswith(BASE_PATH):
+            self.send_response(302)
+            self.send_header("Location", BASE_PATH)
+            self.end_headers()
+            return
+        super().do_GET()
+
+    def translate_path(self, path):
+        return super().translate_path("/" + path[len(BASE_PATH):])
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StaticServer:
+    """In-process HTTP server for the production build on an ephemeral port."""
+
+    def __init__(self, directory=DIST_DIR, host="127.0.0.1"):
+        handler = partial(DistRequestHandler, directory=str(directory))
+        self.httpd = ThreadingHTTPServer((host, 0), handler)
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
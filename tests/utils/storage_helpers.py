@@ -2,22 +2,90 @@ import json
 from typing import Optional
 
 
+# The app stores its document sharded across "kids-timer:*" keys (version 2)
+# and migrates the single legacy "kids-timer-data" key on load. Tests read the
+# document back from the shards and write it in the legacy format.
+
+# Reassemble the document the same way storage.load() does
+ASSEMBLE_STORAGE_SCRIPT = """
+() => {
+    const read = (key) => JSON.parse(localStorage.getItem(key))
+    const meta = read('kids-timer:meta')
+    if (!meta) return read('kids-timer-data')
+    const { profileIds = [], ...data } = meta
+    data.profiles = profileIds.map((id) => read(`kids-timer:profile:${id}`)).filter(Boolean)
+    const sections = {
+        globalSettings: 'settings',
+        timerState: 'timer',
+        sessionHistory: 'history',
+        savedYoutubeVideos: 'youtube',
+    }
+    for (const [section, key] of Object.entries(sections)) {
+        const value = localStorage.getItem(`kids-timer:${key}`)
+        if (value !== null) data[section] = JSON.parse(value)
+    }
+    return data
+}
+"""
+
+# Same, after letting the app's end-of-task write-back land
+READ_STORAGE_SCRIPT = """
+async () => {
+    await new Promise((resolve) => setTimeout(resolve))
+    return (%s)()
+}
+""" % ASSEMBLE_STORAGE_SCRIPT
+
+CLEAR_SHARDS_SCRIPT = """
+() => Object.keys(localStorage)
+    .filter((key) => key.startsWith('kids-timer:'))
+    .forEach((key) => localStorage.removeItem(key))
+"""
+
+
+# Every record in the app's IndexedDB session history. Opening the database
+# before the app has created it is rolled back, so the app's upgrade still runs.
+READ_HISTORY_SCRIPT = """
+async () => {
+    await new Promise((resolve) => setTimeout(resolve))
+    const db = await new Promise((resolve) => {
+        const request = indexedDB.open('kids-timer')
+        request.onupgradeneeded = () => request.transaction.abort()
+        request.onsuccess = () => resolve(request.result)
+        request.onerror = () => resolve(null)
+    })
+    if (!db) return { sessions: [], rollups: [] }
+    const all = (name) => new Promise((resolve, reject) => {
+        const request = db.transaction(name).objectStore(name).getAll()
+        request.onsuccess = () => resolve(request.result)
+        request.onerror = () => reject(request.error)
+    })
+    const result = { sessions: await all('sessions'), rollups: await all('dailyRollups') }
+    db.close()
+    return result
+}
+"""
+
+
 def clear_storage(page):
     """Clear all kids-timer localStorage data."""
+    page.evaluate(CLEAR_SHARDS_SCRIPT)
     page.evaluate("localStorage.removeItem('kids-timer-data')")
     page.evaluate("localStorage.removeItem('kids-timer-last-date')")
 
 
 def get_storage_data(page) -> dict:
     """Get current localStorage data."""
-    data = page.evaluate("localStorage.getItem('kids-timer-data')")
-    if data:
-        return json.loads(data)
-    return {}
+    return page.evaluate(READ_STORAGE_SCRIPT) or {}
 
 
-def create_profile(
-    page,
+def get_history(page) -> dict:
+    """Get the IndexedDB session history as {"sessions": [...], "rollups": [...]}."""
+    return page.evaluate(READ_HISTORY_SCRIPT)
+
+
+def build_profile(
+    profile_id: str = "test-profile-001",
     name: str = "Teste",
     points: int = 0,
     badges: Optional[list] = None,
@@ -27,8 +95,8 @@ def create_profile(
     total_pomodoros: int = 0,
     unlocked_themes: Optional[list] = None,
     unlocked_avatars: Optional[list] = None,
-):
-    """Create a test profile in localStorage."""
+) -> dict:
+    """Build a single profile record as the app stores it."""
     if badges is None:
         badges = []
     if unlocked_themes is None:
@@ -36,31 +104,36 @@ def create_profile(
     if unlocked_avatars is None:
         unlocked_avatars = ["rabbit"]
 
-    data = {
+    return {
+        "id": profile_id,
+        "name": name,
+        "avatar": avatar,
+        "theme": theme,
+        "progressIndicator": progress_indicator,
+        "musicPreference": "none",
+        "pathAnimal": "rabbit",
+        "totalPomodoros": total_pomodoros,
+        "totalMinutes": total_pomodoros * 25,
+        "currentStreak": 0,
+        "longestStreak": 0,
+        "lastActiveDate": None,
+        "points": points,
+        "unlockedThemes": unlocked_themes,
+        "unlockedAvatars": unlocked_avatars,
+        "unlockedAnimals": ["rabbit"],
+        "unlockedSoundscapes": ["piano-calmo", "anoitecer"],
+        "unlockedEnergeticTracks": ["happy-ukulele", "adventure-theme"],
+        "badges": badges,
+        "triedIndicators": []
+    }
+
+
+def build_storage_data(profiles: list, active_profile_id: Optional[str] = None) -> dict:
+    """Build a full kids-timer-data document around the given profiles."""
+    return {
         "version": 1,
-        "profiles": [{
-            "id": "test-profile-001",
-            "name": name,
-            "avatar": avatar,
-            "theme": theme,
-            "progressIndicator": progress_indicator,
-            "musicPreference": "none",
-            "pathAnimal": "rabbit",
-            "totalPomodoros": total_pomodoros,
-            "totalMinutes": total_pomodoros * 25,
-            "currentStreak": 0,
-            "longestStreak": 0,
-            "lastActiveDate": None,
-            "points": points,
-            "unlockedThemes": unlocked_themes,
-            "unlockedAvatars": unlocked_avatars,
-            "unlockedAnimals": ["rabbit"],
-            "unlockedSoundscapes": ["piano-calmo", "anoitecer"],
-            "unlockedEnergeticTracks": ["happy-ukulele", "adventure-theme"],
-            "badges": badges,
-            "triedIndicators": []
-        }],
-        "activeProfileId": "test-profile-001",
+        "profiles": profiles,
+        "activeProfileId": active_profile_id,
         "globalSettings": {
             "masterVolume": 0.7,
             "soundEffectsEnabled": True,
@@ -71,98 +144,80 @@ def create_profile(
         "timerState": None
     }
 
+
+def set_storage_data(page, data: dict):
+    """Write a full kids-timer-data document to localStorage.
+
+    Written in the legacy single-key format, which the app migrates on its
+    next load.
+    """
     json_str = json.dumps(data)
+    page.evaluate(CLEAR_SHARDS_SCRIPT)
     page.evaluate(f"localStorage.setItem('kids-timer-data', {repr(json_str)})")
 
 
+def create_profile(page, **kwargs):
+    """Create a test profile in localStorage.
+
+    Accepts the same keyword arguments as build_profile().
+    """
+    profile = build_profile(**kwargs)
+    set_storage_data(page, build_storage_data([profile], profile["id"]))
+
+
 def create_multiple_profiles(page, profiles: list):
     """Create multiple test profiles."""
-    profile_list = []
-    for i, p in enumerate(profiles):
-        profile_list.append({
-            "id": f"test-profile-{i+1:03d}",
-            "name": p.get("name", f"Profile {i+1}"),
-            "avatar": p.get("avatar", "rabbit"),
-            "theme": p.get("theme", "divertido"),
-            "progressIndicator": p.get("progressIndicator", "circular"),
-            "musicPreference": "none",
-            "pathAnimal": "rabbit",
-            "totalPomodoros": p.get("totalPomodoros", 0),
-            "totalMinutes": p.get("totalPomodoros", 0) * 25,
-            "currentStreak": 0,
-            "longestStreak": 0,
-            "lastActiveDate": None,
-            "points": p.get("points", 0),
-            "unlockedThemes": ["divertido", "minimalista"],
-            "unlockedAvatars": ["rabbit"],
-            "unlockedAnimals": ["rabbit"],
-            "unlockedSoundscapes": ["piano-calmo", "anoitecer"],
-            "unlockedEnergeticTracks": ["happy-ukulele", "adventure-theme"],
-            "badges": p.get("badges", []),
-            "triedIndicators": []
-        })
-
-    data = {
-        "version": 1,
-        "profiles": profile_list,
-        "activeProfileId": None,
-        "globalSettings": {
-            "masterVolume": 0.7,
-            "soundEffectsEnabled": True,
-            "defaultPreset": "25-5",
-            "hapticEnabled": True
-        },
-        "sessionHistory": [],
-        "timerState": None
-    }
-
-    json_str = json.dumps(data)
-    page.evaluate(f"localStorage.setItem('kids-timer-data', {repr(json_str)})")
+    profile_list = [
+        build_profile(
+            profile_id=f"test-profile-{i+1:03d}",
+            name=p.get("name", f"Profile {i+1}"),
+            avatar=p.get("avatar", "rabbit"),
+            theme=p.get("theme", "divertido"),
+            progress_indicator=p.get("progressIndicator", "circular"),
+            total_pomodoros=p.get("totalPomodoros", 0),
+            points=p.get("points", 0),
+            badges=p.get("badges", []),
+        )
+        for i, p in enumerate(profiles)
+    ]
+    set_storage_data(page, build_storage_data(profile_list))
+
+
+def _active_profile(data: dict) -> Optional[dict]:
+    return next((p for p in data["profiles"] if p["id"] == data["activeProfileId"]), None)
 
 
 def add_points(page, points: int):
     """Add points to the active profile."""
-    page.evaluate(f"""
-        (() => {{
-            const data = JSON.parse(localStorage.getItem('kids-timer-data'));
-            const profile = data.profiles.find(p => p.id === data.activeProfileId);
-            if (profile) {{
-                profile.points += {points};
-                localStorage.setItem('kids-timer-data', JSON.stringify(data));
-            }}
-        }})()
-    """)
+    data = get_storage_data(page)
+    profile = _active_profile(data)
+    if profile:
+        profile["points"] += points
+        set_storage_data(page, data)
 
 
 def award_badge(page, badge_id: str):
     """Award a badge to the active profile."""
-    page.evaluate(f"""
-        (() => {{
-            const data = JSON.parse(localStorage.getItem('kids-timer-data'));
-            const profile = data.profiles.find(p => p.id === data.activeProfileId);
-            if (profile && !profile.badges.includes('{badge_id}')) {{
-                profile.badges.push('{badge_id}');
-                localStorage.setItem('kids-timer-data', JSON.stringify(data));
-            }}
-        }})()
-    """)
+    data = get_storage_data(page)
+    profile = _active_profile(data)
+    if profile and badge_id not in profile["badges"]:
+        profile["badges"].append(badge_id)
+        set_storage_data(page, data)
 
 
 def set_timer_state(page, status: str, time_remaining: int, total_time: int):
     """Set timer state in localStorage for testing restoration."""
-    page.evaluate(f"""
-        (() => {{
-            const data = JSON.parse(localStorage.getItem('kids-timer-data')) || {{}};
-            data.timerState = {{
-                status: '{status}',
-                timeRemaining: {time_remaining},
-                totalTime: {total_time},
-                targetEndTime: Date.now() + {time_remaining} * 1000,
-                workDuration: 25,
-                breakDuration: 5,
-                pausedStatus: null,
-                savedAt: Date.now()
-            }};
-            localStorage.setItem('kids-timer-data', JSON.stringify(data));
-        }})()
-    """)
+    data = get_storage_data(page)
+    # The page's clock, which may be a fake one
+    now = page.evaluate("Date.now()")
+    data["timerState"] = {
+        "status": status,
+        "timeRemaining": time_remaining,
+        "totalTime": total_time,
+        "targetEndTime": now + time_remaining * 1000,
+        "workDuration": 25,
+        "breakDuration": 5,
+        "pausedStatus": None,
+        "savedAt": now,
+    }
+    set_storage_data(page, data)
@@ -0,0 +1,108 @@
+from contextlib import contextmanager
+
+# Wraps Storage.prototype.getItem/setItem and JSON.parse so every storage
+# access made by the app is counted in window.__storageProfile.
+PROFILER_INIT_SCRIPT = """
+(() => {
+    if (window !== window.top || window.__storageProfile) return;
+
+    const fresh = () => ({
+        reads: 0,
+        bytesRead: 0,
+        writes: 0,
+        bytesWritten: 0,
+        parses: 0,
+        parseMs: 0,
+        keysWritten: {},
+    });
+    const profile = {
+        stats: fresh(),
+        reset() {
+            this.stats = fresh();
+            readValues.clear();
+        },
+    };
+    window.__storageProfile = profile;
+
+    const readValues = new Set();
+    const getItem = Storage.prototype.getItem;
+    const setItem = Storage.prototype.setItem;
+    const parse = JSON.parse;
+
+    Storage.prototype.getItem = function (key) {
+        const value = getItem.call(this, key);
+        profile.stats.reads++;
+        if (value !== null) {
+            profile.stats.bytesRead += value.length;
+            readValues.add(value);
+        }
+        return value;
+    };
+
+    Storage.prototype.setItem = function (key, value) {
+        const text = String(value);
+        profile.stats.writes++;
+        profile.stats.bytesWritten += text.length;
+        profile.stats.keysWritten[key] = (profile.stats.keysWritten[key] || 0) + 1;
+        return setItem.call(this, key, text);
+    };
+
+    JSON.parse = function (text, reviver) {
+        if (!readValues.has(text)) return parse.call(this, text, reviver);
+        const start = performance.now();
+        try {
+            return parse.call(this, text, reviver);
+        } finally {
+            profile.stats.parses++;
+            profile.stats.parseMs += performance.now() - start;
+        }
+    };
+})()
+"""
+
+
+class StorageStats(dict):
+    """Storage activity recorded for one action.
+
+    Keys: reads, bytesRead, writes, bytesWritten, parses, parseMs, keysWritten.
+    """
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class StorageProfiler:
+    """Counts localStorage reads, writes and JSON parse cost per user action."""
+
+    def __init__(self, page):
+        self.page = page
+        self.actions = {}
+
+    def install(self):
+        """Hook storage before the app boots. Takes effect for the next navigation."""
+        self.page.add_init_script(PROFILER_INIT_SCRIPT)
+
+    def reset(self):
+        self.page.evaluate("window.__storageProfile.reset()")
+
+    def stats(self) -> StorageStats:
+        """Get storage activity since the last reset."""
+        return StorageStats(self.page.evaluate("window.__storageProfile.stats"))
+
+    @contextmanager
+    def measure(self, action: str):
+        """Record storage activity for everything done inside the block.
+
+        The yielded StorageStats is filled in when the block exits, and is
+        also kept in self.actions[action].
+        """
+        result = StorageStats()
+        self.reset()
+        yield result
+        # The app writes back at the end of the task; let pending writes land
+        self.page.evaluate("() => new Promise((resolve) => setTimeout(resolve))")
+        result.update(self.stats())
+        self.actions[action] = result
@@ -0,0 +1,88 @@
+import json
+from typing import Optional
+
+from utils.app_ready import wait_for_app_ready
+from utils.storage_helpers import build_profile, build_storage_data
+
+SEEDED_FLAG = "kids-timer-snapshot-seeded"
+
+
+def _one_profile():
+    profile = build_profile()
+    return build_storage_data([profile], profile["id"])
+
+
+def _rich_profile():
+    profile = build_profile(
+        points=500,
+        total_pomodoros=40,
+        badges=["primeiro-passo", "cinco-seguidos", "maratonista", "fashionista"],
+        unlocked_themes=["divertido", "minimalista", "floresta", "espaco", "oceano", "doces"],
+        unlocked_avatars=["rabbit", "turtle", "fox", "owl", "cat", "dog"],
+    )
+    return build_storage_data([profile], profile["id"])
+
+
+def _multi_profile():
+    profiles = [
+        build_profile(profile_id="test-profile-001", name="Ana"),
+        build_profile(profile_id="test-profile-002", name="Bia", points=100),
+        build_profile(profile_id="test-profile-003", name="Caio", theme="minimalista"),
+    ]
+    return build_storage_data(profiles)
+
+
+# Named storage states. None means empty storage (first launch).
+SNAPSHOTS = {
+    "fresh": lambda: None,
+    "one_profile": _one_profile,
+    "rich_profile": _rich_profile,
+    "multi_profile": _multi_profile,
+}
+
+
+def serialize_snapshots() -> dict:
+    """Serialize every named snapshot to its kids-timer-data JSON string."""
+    serialized = {}
+    for name, build in SNAPSHOTS.items():
+        data = build()
+        serialized[name] = json.dumps(data) if data is not None else None
+    return serialized
+
+
+def snapshot_init_script(snapshot_json: Optional[str]) -> str:
+    """Build an init script that seeds localStorage before the app boots.
+
+    The script seeds only on the first document of the tab (tracked in
+    sessionStorage), so a test that writes its own data and reloads is not
+    reset back to the snapshot.
+    """
+    return f"""
+        (() => {{
+            if (window !== window.top || location.origin === 'null') return;
+            try {{
+                if (sessionStorage.getItem('{SEEDED_FLAG}')) return;
+                sessionStorage.setItem('{SEEDED_FLAG}', '1');
+                Object.keys(localStorage)
+                    .filter((key) => key.startsWith('kids-timer:'))
+                    .forEach((key) => localStorage.removeItem(key));
+                localStorage.removeItem('kids-timer-data');
+                localStorage.removeItem('kids-timer-last-date');
+                const data = {json.dumps(snapshot_json)};
+                if (data) localStorage.setItem('kids-timer-data', data);
+            }} catch (e) {{
+                // Storage unavailable or over quota; surfaced for benchmarks
+                window.__snapshotError = String(e);
+            }}
+        }})()
+    """
+
+
+def boot_app(page, base_url, snapshot_json) -> float:
+    """Seed storage through an init script and load the app exactly once.
+
+    Returns the boot-to-ready latency in ms.
+    """
+    page.add_init_script(snapshot_init_script(snapshot_json))
+    page.goto(base_url)
+    return wait_for_app_ready(page)
@@ -5,6 +5,9 @@ import vue from '@vitejs/plugin-vue'
 export default defineConfig({
   plugins: [vue()],
   base: process.env.CAPACITOR_BUILD ? '/' : '/kids-timer/',
+  build: {
+    manifest: true
+  },
   server: {
     port: 3000
   }